@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Allocation (GC Pressure) Benchmark
+Plays the game for 60 s under a scripted input pattern (walk, turn, jump,
+hover) while the DevTools sampling heap profiler records every allocation,
+including objects the GC has already collected. Reports bytes allocated per
+frame split into game code (game/js) and libraries (three.js, Cannon), the
+top allocating game call sites, and a once-a-second JS heap usage sample
+(the sawtooth between collections). Steady-state game allocations per
+frame must stay under GAME_BYTES_PER_FRAME_LIMIT.
+
+Usage:
+  python alloc_benchmark.py
+  python alloc_benchmark.py --headless --seconds 30
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+from results_store import ResultsStore, environment_info
+
+DEFAULT_SECONDS = 60
+WARMUP_SECONDS = 5              # JIT, lazy pools and LOD batches settle before sampling starts
+SAMPLING_INTERVAL = 512         # Mean bytes between heap samples (smaller = more precise, slower)
+GAME_BYTES_PER_FRAME_LIMIT = 256
+GAME_SCRIPT_MARKER = '/js/'     # URL fragment of the game's own scripts
+
+# Cycles held keys through the input paths the frame loop exercises
+AUTOPILOT_JS = """
+const engine = window.gameEngine;
+const pattern = [['KeyW'], ['KeyW', 'ArrowLeft'], ['KeyS'], ['KeyW', 'Space'], []];
+let step = 0;
+window.__allocAutopilot = setInterval(() => {
+    engine.keys = {};
+    for (const code of pattern[step % pattern.length]) engine.keys[code] = true;
+    engine.mouse.clicked = step % 3 === 0;
+    step++;
+}, 1500);
+"""
+
+STOP_AUTOPILOT_JS = """
+clearInterval(window.__allocAutopilot);
+window.gameEngine.keys = {};
+window.gameEngine.mouse.clicked = false;
+"""
+
+
+def total_frames(driver):
+    return driver.execute_script("return window.gameTelemetry ? window.gameTelemetry.totalFrames : 0;")
+
+
+def heap_usage(driver):
+    usage = driver.execute_cdp_cmd('Runtime.getHeapUsage', {})
+    return usage.get('usedSize', 0)
+
+
+def allocation_sites(profile):
+    """Flatten the sampling profile tree into {(function, url, line): bytes}"""
+    sites = {}
+    stack = [profile['head']]
+    while stack:
+        node = stack.pop()
+        frame = node['callFrame']
+        if node.get('selfSize'):
+            key = (frame.get('functionName') or '(anonymous)', frame.get('url', ''), frame.get('lineNumber', -1) + 1)
+            sites[key] = sites.get(key, 0) + node['selfSize']
+        stack.extend(node.get('children', []))
+    return sites
+
+
+def summarize_allocations(sites, frames):
+    game = {k: v for k, v in sites.items() if GAME_SCRIPT_MARKER in k[1]}
+    game_bytes = sum(game.values())
+    total_bytes = sum(sites.values())
+    top = sorted(game.items(), key=lambda item: -item[1])[:15]
+    return {
+        'frames': frames,
+        'total_bytes': total_bytes,
+        'game_bytes': game_bytes,
+        'bytes_per_frame': total_bytes / frames if frames else 0.0,
+        'game_bytes_per_frame': game_bytes / frames if frames else 0.0,
+        'top_game_sites': [
+            {'function': f, 'site': f"{url.rsplit('/', 1)[-1]}:{line}", 'bytes': size,
+             'bytes_per_frame': size / frames if frames else 0.0}
+            for (f, url, line), size in top
+        ],
+    }
+
+
+def run_alloc_benchmark(game_url, seconds=DEFAULT_SECONDS, headless=False):
+    print("🗑️ RoboQuest Allocation Benchmark")
+    print("=" * 40)
+
+    driver = create_driver(headless)
+    environment = environment_info(driver)
+    started = time.perf_counter()
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            print("❌ Game did not load")
+            return None
+        driver.execute_script(AUTOPILOT_JS)
+        time.sleep(WARMUP_SECONDS)
+
+        driver.execute_cdp_cmd('HeapProfiler.enable', {})
+        driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        driver.execute_cdp_cmd('HeapProfiler.startSampling', {
+            'samplingInterval': SAMPLING_INTERVAL,
+            'includeObjectsCollectedByMajorGC': True,
+            'includeObjectsCollectedByMinorGC': True,
+        })
+        first_frame = total_frames(driver)
+        heap_samples = []
+        for second in range(seconds):
+            time.sleep(1)
+            heap_samples.append(heap_usage(driver))
+            if (second + 1) % 10 == 0:
+                print(f"⏱️ {second + 1:3d}s heap {heap_samples[-1] / 1048576:.1f} MB")
+        frames = total_frames(driver) - first_frame
+        profile = driver.execute_cdp_cmd('HeapProfiler.stopSampling', {})['profile']
+        driver.execute_cdp_cmd('HeapProfiler.disable', {})
+        driver.execute_script(STOP_AUTOPILOT_JS)
+    finally:
+        driver.quit()
+
+    summary = summarize_allocations(allocation_sites(profile), frames)
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'seconds': seconds,
+        'sampling_interval': SAMPLING_INTERVAL,
+        'heap_samples': heap_samples,
+        'duration_s': round(time.perf_counter() - started, 3),
+        'passed': summary['game_bytes_per_frame'] <= GAME_BYTES_PER_FRAME_LIMIT,
+    }
+    report.update(summary)
+    record_history(report, environment)
+    return report
+
+
+def print_alloc_report(report):
+    print()
+    print(f"🎞️ {report['frames']} frames sampled")
+    print(f"📦 All code:  {report['bytes_per_frame']:.0f} bytes/frame")
+    print(f"🤖 Game code: {report['game_bytes_per_frame']:.0f} bytes/frame "
+          f"(limit {GAME_BYTES_PER_FRAME_LIMIT})")
+    if report['top_game_sites']:
+        print("🔎 Top game allocation sites:")
+        for site in report['top_game_sites']:
+            print(f"   {site['bytes_per_frame']:8.1f} B/frame  {site['function']} ({site['site']})")
+    icon = '✅' if report['passed'] else '❌'
+    print(f"{icon} Steady-state game allocations {'within' if report['passed'] else 'over'} budget")
+
+
+def record_history(report, environment):
+    try:
+        with ResultsStore() as store:
+            run_id = store.start_run('alloc_benchmark', environment)
+            store.record_result(
+                run_id, 'alloc_benchmark', 'passed' if report['passed'] else 'failed', report['duration_s'],
+                details={'top_game_sites': report['top_game_sites']},
+                metrics={
+                    'bytes_per_frame': report['bytes_per_frame'],
+                    'game_bytes_per_frame': report['game_bytes_per_frame'],
+                    'frames': report['frames'],
+                }
+            )
+            store.finish_run(run_id)
+    except Exception as e:
+        print(f"⚠️ Could not record results history: {e}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run_seconds = int(args[args.index('--seconds') + 1]) if '--seconds' in args else DEFAULT_SECONDS
+    with DevServer() as server:
+        alloc_report = run_alloc_benchmark(server.game_url, run_seconds, headless='--headless' in args)
+    if alloc_report is None:
+        sys.exit(1)
+    print_alloc_report(alloc_report)
+
+    path = f"alloc_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump(alloc_report, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if alloc_report['passed'] else 1)
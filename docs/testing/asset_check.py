@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Asset Checker
+Walks the game's real asset graph (script/link/img tags in game/index.html
+plus texture and model URLs referenced from the scripts it loads), fetches
+everything concurrently over pooled keep-alive connections and reports
+status, transfer size, time to first byte and transfer time per asset.
+The total payload is checked against a budget.
+
+Usage:
+  python asset_check.py                    # serve the repo in-process and check it
+  python asset_check.py --base-url http://localhost:8000
+  python asset_check.py --budget-kb 6000   # fail when the payload exceeds 6000 KB
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GAME_HTML = 'game/index.html'
+
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 15
+DEFAULT_BUDGET_KB = 8192   # Total transferred bytes for a cold load
+CHUNK_SIZE = 64 * 1024
+
+# String literals in game scripts that name fetchable assets
+ASSET_URL_RE = re.compile(
+    r"""['"`]((?:https?://|\.{0,2}/)?[^'"`\s$]+\.(?:png|jpe?g|webp|gif|ktx2|basis|hdr|glb|gltf|bin|rql|mp3|ogg|wav))['"`]""",
+    re.IGNORECASE,
+)
+
+
+class _AssetTagParser(HTMLParser):
+    """Collects script/link/img references from an HTML document"""
+
+    def __init__(self):
+        super().__init__()
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script' and attrs.get('src'):
+            self.references.append(('script', attrs['src']))
+        elif tag == 'link' and attrs.get('href') and attrs.get('rel') in ('stylesheet', 'icon', 'preload', 'modulepreload'):
+            self.references.append(('stylesheet' if attrs['rel'] == 'stylesheet' else attrs['rel'], attrs['href']))
+        elif tag == 'img' and attrs.get('src'):
+            self.references.append(('image', attrs['src']))
+
+
+def discover_assets(base_url, root=REPO_ROOT, html_path=GAME_HTML):
+    """Asset list [{url, kind, remote, referenced_by}] for the game page"""
+    page_url = urljoin(base_url.rstrip('/') + '/', html_path)
+    origin = urlsplit(page_url).netloc
+    assets = {page_url: {'url': page_url, 'kind': 'document', 'referenced_by': None}}
+
+    with open(os.path.join(root, html_path), encoding='utf-8') as f:
+        parser = _AssetTagParser()
+        parser.feed(f.read())
+
+    local_scripts = []
+    for kind, ref in parser.references:
+        if ref.startswith('data:'):
+            continue
+        url = urljoin(page_url, ref)
+        assets.setdefault(url, {'url': url, 'kind': kind, 'referenced_by': html_path})
+        if kind == 'script' and urlsplit(url).netloc == origin:
+            local_scripts.append(url)
+
+    # Only scripts the page actually loads; textures resolve against the document URL
+    for script_url in local_scripts:
+        script_path = os.path.join(root, urlsplit(script_url).path.lstrip('/'))
+        if not os.path.isfile(script_path):
+            continue
+        with open(script_path, encoding='utf-8') as f:
+            source = f.read()
+        name = os.path.relpath(script_path, root)
+        for ref in ASSET_URL_RE.findall(source):
+            url = urljoin(page_url, ref)
+            assets.setdefault(url, {'url': url, 'kind': 'texture', 'referenced_by': name})
+
+    for asset in assets.values():
+        asset['remote'] = urlsplit(asset['url']).netloc != origin
+    return list(assets.values())
+
+
+def create_session(workers=DEFAULT_WORKERS):
+    """Keep-alive session with a connection pool per host sized for the worker count"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip, deflate, br'
+    return session
+
+
+def fetch_asset(session, asset, timeout=DEFAULT_TIMEOUT):
+    """Fetch one asset and time it; never raises"""
+    result = dict(asset)
+    started = time.perf_counter()
+    try:
+        with session.get(asset['url'], timeout=timeout, stream=True) as response:
+            ttfb = time.perf_counter() - started
+            wire_bytes = 0
+            for chunk in response.raw.stream(CHUNK_SIZE, decode_content=False):
+                wire_bytes += len(chunk)
+            result.update({
+                'status': response.status_code,
+                'ok': response.ok,
+                'bytes': wire_bytes,
+                'content_length': int(response.headers.get('Content-Length', wire_bytes)),
+                'encoding': response.headers.get('Content-Encoding', 'identity'),
+                'content_type': response.headers.get('Content-Type', ''),
+                'ttfb_ms': round(ttfb * 1000.0, 1),
+                'transfer_ms': round((time.perf_counter() - started - ttfb) * 1000.0, 1),
+            })
+    except requests.RequestException as e:
+        result.update({
+            'status': None,
+            'ok': False,
+            'bytes': 0,
+            'error': str(e),
+            'ttfb_ms': None,
+            'transfer_ms': round((time.perf_counter() - started) * 1000.0, 1),
+        })
+    return result
+
+
+def check_assets(base_url, budget_kb=DEFAULT_BUDGET_KB, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT):
+    """Fetch the whole asset graph concurrently and build a report"""
+    assets = discover_assets(base_url)
+    started = time.perf_counter()
+    with create_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda a: fetch_asset(session, a, timeout), assets))
+    wall_ms = (time.perf_counter() - started) * 1000.0
+
+    total_bytes = sum(r['bytes'] for r in results)
+    failures = [r for r in results if not r['ok']]
+    # Remote textures have in-game fallbacks; everything else is required
+    required_failures = [r for r in failures if not (r['remote'] and r['kind'] == 'texture')]
+    over_budget = total_bytes > budget_kb * 1024
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'base_url': base_url,
+        'assets': sorted(results, key=lambda r: -r['bytes']),
+        'summary': {
+            'count': len(results),
+            'remote': sum(1 for r in results if r['remote']),
+            'failures': len(failures),
+            'required_failures': len(required_failures),
+            'total_kb': round(total_bytes / 1024, 1),
+            'remote_kb': round(sum(r['bytes'] for r in results if r['remote']) / 1024, 1),
+            'budget_kb': budget_kb,
+            'over_budget': over_budget,
+            'wall_ms': round(wall_ms, 1),
+        },
+        'passed': not required_failures and not over_budget,
+    }
+
+
+def print_asset_report(report):
+    summary = report['summary']
+    print(f"{'':2} {'status':>6} {'KB':>8} {'TTFB':>8} {'xfer':>8}  asset")
+    for r in report['assets']:
+        icon = '✅' if r['ok'] else ('⚠️' if r['remote'] and r['kind'] == 'texture' else '❌')
+        status = r['status'] if r['status'] is not None else 'ERR'
+        ttfb = f"{r['ttfb_ms']:.0f}ms" if r['ttfb_ms'] is not None else '-'
+        where = '🌍 ' if r['remote'] else ''
+        print(f"{icon} {status:>6} {r['bytes'] / 1024:>8.1f} {ttfb:>8} {r['transfer_ms']:>6.0f}ms  {where}{r['url']}")
+        if r.get('error'):
+            print(f"   ↳ {r['error']}")
+
+    print(f"\n📦 {summary['count']} assets, {summary['total_kb']:.0f} KB transferred "
+          f"(budget {summary['budget_kb']} KB) in {summary['wall_ms']:.0f} ms")
+    if summary['remote']:
+        print(f"🌍 {summary['remote']} remote assets ({summary['remote_kb']:.0f} KB) - the game depends on third-party hosts")
+    if summary['over_budget']:
+        print(f"❌ Payload over budget by {summary['total_kb'] - summary['budget_kb']:.0f} KB")
+    if summary['failures']:
+        print(f"❌ {summary['failures']} assets failed ({summary['required_failures']} required)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    budget = float(args[args.index('--budget-kb') + 1]) if '--budget-kb' in args else DEFAULT_BUDGET_KB
+    server = None
+    if '--base-url' in args:
+        base = args[args.index('--base-url') + 1]
+    else:
+        from dev_server import DevServer
+        server = DevServer().start()
+        base = server.base_url
+
+    print("📦 RoboQuest Asset Check")
+    print("=" * 40)
+    try:
+        asset_report = check_assets(base, budget)
+    finally:
+        if server:
+            server.stop()
+    print_asset_report(asset_report)
+
+    path = f"asset_check_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump(asset_report, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if asset_report['passed'] else 1)
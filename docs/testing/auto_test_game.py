@@ -14,6 +14,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import json
+from log_stream import ConsoleStream
 
 def test_roboquest_game():
     """Automated test with console reading"""
@@ -25,7 +26,7 @@ def test_roboquest_game():
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    console = None
     
     try:
         # Initialize driver
@@ -36,6 +37,9 @@ def test_roboquest_game():
         
         print("✅ WebDriver initialized")
         
+        # Console, JS errors and failed requests are pushed to this queue as they happen
+        console = ConsoleStream(driver).start()
+        
         # Load game
         print("🌐 Loading game...")
         driver.get('http://localhost:8000/game/index.html')
@@ -57,7 +61,7 @@ def test_roboquest_game():
         print("\n📋 CONSOLE LOGS:")
         print("-" * 20)
         
-        logs = driver.get_log('browser')
+        logs = console.drain()
         game_logs = []
         errors = []
         
@@ -146,8 +150,7 @@ def test_roboquest_game():
         print("\n📋 FINAL CONSOLE CHECK:")
         print("-" * 25)
         
-        final_logs = driver.get_log('browser')
-        new_logs = final_logs[len(logs):]  # Only new logs
+        new_logs = console.drain()  # Everything since the first check, in browser order
         
         for log in new_logs:
             if log['level'] == 'SEVERE':
@@ -177,6 +180,8 @@ def test_roboquest_game():
         return False
     finally:
         try:
+            if console:
+                console.stop()
             driver.quit()
             print("🧹 Browser closed")
         except:
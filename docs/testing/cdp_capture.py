@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest In-Memory Screenshot Capture
+Captures through DevTools Page.captureScreenshot with clip rectangles,
+PNG/JPEG/WebP encoding and scale factors, and returns decoded NumPy arrays.
+Writing to disk is optional and happens on a background thread.
+
+Usage:
+    capture = ScreenshotCapture(driver)
+    frame = capture.capture(scale=0.5)                          # half-size RGB array
+    hud = capture.capture(clip=(0, 0, 0.25, 0.18), fmt='jpeg')  # HUD region only
+    capture.capture(save_to='tps_debug_5.png')                  # array + async write
+    capture.close()                                             # wait for pending writes
+"""
+
+import base64
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+FORMATS = ('png', 'jpeg', 'webp')
+
+
+class ScreenshotCapture:
+    """DevTools screenshot capture returning in-memory arrays"""
+
+    def __init__(self, driver, writer_threads=2):
+        self.driver = driver
+        self._writer = ThreadPoolExecutor(max_workers=writer_threads, thread_name_prefix='screenshot-writer')
+        self._pending = []
+        self._viewport = None
+        self.timings_ms = []
+
+    def viewport(self, refresh=False):
+        """CSS viewport size (width, height) used to resolve fractional clips"""
+        if self._viewport is None or refresh:
+            metrics = self.driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
+            view = metrics.get('cssVisualViewport') or metrics.get('layoutViewport')
+            self._viewport = (view['clientWidth'], view['clientHeight'])
+        return self._viewport
+
+    def _resolve_clip(self, clip, scale):
+        """Turn an (x, y, w, h) tuple (fractions or CSS pixels) into a DevTools clip"""
+        if clip is None:
+            if scale == 1.0:
+                return None
+            clip = (0.0, 0.0, 1.0, 1.0)
+        x, y, w, h = clip
+        if all(0.0 <= v <= 1.0 for v in clip):
+            width, height = self.viewport()
+            x, w = x * width, w * width
+            y, h = y * height, h * height
+        return {'x': x, 'y': y, 'width': w, 'height': h, 'scale': scale}
+
+    def capture_bytes(self, clip=None, fmt='png', quality=None, scale=1.0):
+        """Encoded image bytes straight from the browser compositor"""
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported format '{fmt}' (choose from {FORMATS})")
+        params = {'format': fmt, 'fromSurface': True}
+        if quality is not None and fmt != 'png':
+            params['quality'] = int(quality)
+        resolved = self._resolve_clip(clip, scale)
+        if resolved:
+            params['clip'] = resolved
+        if fmt == 'png':
+            # Skip the slow zlib level; still lossless
+            params['optimizeForSpeed'] = True
+
+        start = time.perf_counter()
+        result = self.driver.execute_cdp_cmd('Page.captureScreenshot', params)
+        data = base64.b64decode(result['data'])
+        self.timings_ms.append((time.perf_counter() - start) * 1000.0)
+        return data
+
+    def capture(self, clip=None, fmt='png', quality=None, scale=1.0, save_to=None, decode=True, gray=False):
+        """Capture to an RGB (or grayscale) uint8 array; optionally write the encoded bytes asynchronously"""
+        data = self.capture_bytes(clip=clip, fmt=fmt, quality=quality, scale=scale)
+        if save_to:
+            self.save_async(data, save_to)
+        if not decode:
+            return data
+        with Image.open(io.BytesIO(data)) as img:
+            return np.asarray(img.convert('L' if gray else 'RGB'))
+
+    def save_async(self, data, path):
+        """Queue encoded image bytes for writing on the writer thread"""
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(self._writer.submit(_write_file, path, data))
+
+    def flush(self):
+        """Block until queued writes are on disk (re-raises write errors)"""
+        for future in self._pending:
+            future.result()
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._writer.shutdown(wait=True)
+
+    def stats(self):
+        """Capture latency summary in milliseconds"""
+        if not self.timings_ms:
+            return {'captures': 0}
+        ordered = sorted(self.timings_ms)
+        return {
+            'captures': len(ordered),
+            'mean_ms': round(sum(ordered) / len(ordered), 2),
+            'p50_ms': round(ordered[len(ordered) // 2], 2),
+            'max_ms': round(ordered[-1], 2),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _write_file(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+if __name__ == "__main__":
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from dev_server import DevServer
+
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    server = DevServer().start()
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_window_size(1280, 720)
+    try:
+        driver.get(server.game_url)
+        time.sleep(4)
+
+        start = time.perf_counter()
+        driver.save_screenshot('capture_compare_webdriver.png')
+        print(f"🐢 driver.save_screenshot: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        with ScreenshotCapture(driver) as capture:
+            for label, kwargs in [
+                ('full png', {}),
+                ('half-size png', {'scale': 0.5}),
+                ('quarter jpeg q70', {'scale': 0.25, 'fmt': 'jpeg', 'quality': 70}),
+                ('center clip webp', {'clip': (0.3, 0.25, 0.4, 0.5), 'fmt': 'webp', 'quality': 80}),
+            ]:
+                start = time.perf_counter()
+                frame = capture.capture(**kwargs)
+                print(f"⚡ {label}: {frame.shape} in {(time.perf_counter() - start) * 1000:.0f} ms")
+            capture.capture(scale=0.5, save_to='capture_compare_cdp.png')
+            print(f"📊 {capture.stats()}")
+    finally:
+        driver.quit()
+        server.stop()
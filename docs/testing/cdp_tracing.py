@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest DevTools Performance Tracing
+Captures Chrome DevTools traces, Performance.getMetrics and HeapProfiler samples
+around a test scenario and writes a machine-readable summary report.
+
+Usage (inside a harness script):
+    chrome_options = Options()
+    DevToolsTracer.configure_options(chrome_options)
+    driver = webdriver.Chrome(options=chrome_options)
+    ...
+    with DevToolsTracer(driver, 'hold_d_key') as tracer:
+        ...  # drive the scenario
+    print(tracer.report_path)
+
+Standalone:
+    python cdp_tracing.py [scenario_seconds]
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+# Reports go with the harness screenshots by default
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCREENSHOT_DIR = os.path.normpath(os.path.join(HERE, '..', 'screenshots', 'development'))
+
+# Trace categories needed for main-thread tasks, script execution and GC pauses
+DEFAULT_TRACE_CATEGORIES = ','.join([
+    'devtools.timeline',
+    'v8',
+    'disabled-by-default-devtools.timeline',
+])
+
+# Top-level scheduler tasks on the renderer main thread
+TASK_EVENT_NAMES = {'RunTask', 'ThreadControllerImpl::RunTask'}
+
+# Events DevTools attributes to "Scripting"
+SCRIPT_EVENT_NAMES = {
+    'EvaluateScript',
+    'FunctionCall',
+    'TimerFire',
+    'FireAnimationFrame',
+    'EventDispatch',
+    'v8.compile',
+    'v8.compileModule',
+    'v8.evaluateModule',
+}
+
+GC_EVENT_NAMES = {'MinorGC', 'MajorGC'}
+
+MAIN_THREAD_NAME = 'CrRendererMain'
+
+# Performance.getMetrics entries that are reported as before/after deltas
+METRIC_NAMES = (
+    'JSHeapUsedSize',
+    'JSHeapTotalSize',
+    'TaskDuration',
+    'ScriptDuration',
+    'LayoutDuration',
+    'RecalcStyleDuration',
+    'Nodes',
+    'JSEventListeners',
+)
+
+
+def _merged_duration_us(intervals):
+    """Total length of a set of [start, end) intervals with overlaps counted once"""
+    total = 0
+    current_start = None
+    current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        elif end > current_end:
+            current_end = end
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def _event_intervals(events, names, threads=None):
+    """Collect (start, end) intervals in microseconds for complete and B/E events"""
+    intervals = []
+    open_events = {}
+    for event in events:
+        if event.get('name') not in names:
+            continue
+        key = (event.get('pid'), event.get('tid'))
+        if threads is not None and key not in threads:
+            continue
+        phase = event.get('ph')
+        ts = event.get('ts', 0)
+        if phase == 'X':
+            intervals.append((ts, ts + event.get('dur', 0)))
+        elif phase == 'B':
+            open_events.setdefault((key, event['name']), []).append(ts)
+        elif phase == 'E':
+            starts = open_events.get((key, event['name']))
+            if starts:
+                intervals.append((starts.pop(), ts))
+    return intervals
+
+
+def summarize_trace_events(events):
+    """Summarize raw trace events into main-thread, scripting and GC timings (ms)"""
+    main_threads = {
+        (event.get('pid'), event.get('tid'))
+        for event in events
+        if event.get('ph') == 'M'
+        and event.get('name') == 'thread_name'
+        and event.get('args', {}).get('name') == MAIN_THREAD_NAME
+    }
+    # Fall back to every thread if metadata was not captured
+    threads = main_threads or None
+
+    task_intervals = _event_intervals(events, TASK_EVENT_NAMES, threads)
+    script_intervals = _event_intervals(events, SCRIPT_EVENT_NAMES, threads)
+    gc_intervals = _event_intervals(events, GC_EVENT_NAMES, threads)
+
+    gc_pauses_ms = sorted(((end - start) / 1000.0 for start, end in gc_intervals), reverse=True)
+    timestamps = [event['ts'] for event in events if event.get('ts')]
+    span_ms = (max(timestamps) - min(timestamps)) / 1000.0 if timestamps else 0.0
+
+    return {
+        'trace_events': len(events),
+        'trace_span_ms': round(span_ms, 3),
+        'main_thread_ms': round(_merged_duration_us(task_intervals) / 1000.0, 3),
+        'script_ms': round(_merged_duration_us(script_intervals) / 1000.0, 3),
+        'gc': {
+            'count': len(gc_pauses_ms),
+            'total_ms': round(sum(gc_pauses_ms), 3),
+            'max_ms': round(gc_pauses_ms[0], 3) if gc_pauses_ms else 0.0,
+            'longest_pauses_ms': [round(p, 3) for p in gc_pauses_ms[:10]],
+        },
+    }
+
+
+def summarize_heap_profile(profile, top=10):
+    """Summarize a HeapProfiler sampling profile into total bytes and top allocation sites"""
+    sites = {}
+    stack = [profile.get('head', {})] if profile else []
+    while stack:
+        node = stack.pop()
+        stack.extend(node.get('children', []))
+        self_size = node.get('selfSize', 0)
+        if not self_size:
+            continue
+        frame = node.get('callFrame', {})
+        site = '{} ({}:{})'.format(
+            frame.get('functionName') or '(anonymous)',
+            os.path.basename(frame.get('url', '')) or '?',
+            frame.get('lineNumber', -1) + 1,
+        )
+        sites[site] = sites.get(site, 0) + self_size
+
+    ranked = sorted(sites.items(), key=lambda item: item[1], reverse=True)
+    return {
+        'sampled_bytes': sum(sites.values()),
+        'samples': len(profile.get('samples', [])) if profile else 0,
+        'top_sites': [{'site': site, 'bytes': size} for site, size in ranked[:top]],
+    }
+
+
+class DevToolsTracer:
+    """Wraps a scenario with DevTools tracing, metrics and heap sampling"""
+
+    def __init__(self, driver, scenario='scenario', output_dir=SCREENSHOT_DIR, heap_sampling_interval=32768):
+        self.driver = driver
+        self.scenario = scenario
+        self.output_dir = output_dir
+        self.heap_sampling_interval = heap_sampling_interval
+        self.report = None
+        self.report_path = None
+        self._metrics_before = {}
+        self._started_at = None
+        self._start_time = None
+        self._heap_sampling = False
+
+    @staticmethod
+    def configure_options(chrome_options, categories=DEFAULT_TRACE_CATEGORIES):
+        """Enable the ChromeDriver performance log with trace categories (call before creating the driver)"""
+        chrome_options.set_capability('goog:loggingPrefs', {'browser': 'ALL', 'performance': 'ALL'})
+        chrome_options.add_experimental_option('perfLoggingPrefs', {
+            'enableNetwork': False,
+            'enablePage': False,
+            'traceCategories': categories,
+        })
+        return chrome_options
+
+    def _get_metrics(self):
+        result = self.driver.execute_cdp_cmd('Performance.getMetrics', {})
+        return {m['name']: m['value'] for m in result.get('metrics', [])}
+
+    def _drain_trace_events(self):
+        """Read and parse buffered trace events from the performance log"""
+        events = []
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            print(f"⚠️ Performance log unavailable (configure_options not applied?): {e}")
+            return events
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            if message.get('method') == 'Tracing.dataCollected':
+                events.append(message.get('params', {}))
+        return events
+
+    def start(self):
+        """Begin capturing: discard earlier trace events and take baseline metrics"""
+        self._drain_trace_events()
+        self.driver.execute_cdp_cmd('Performance.enable', {'timeDomain': 'timeTicks'})
+        try:
+            self.driver.execute_cdp_cmd('HeapProfiler.enable', {})
+            self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+            self.driver.execute_cdp_cmd('HeapProfiler.startSampling', {
+                'samplingInterval': self.heap_sampling_interval
+            })
+            self._heap_sampling = True
+        except Exception as e:
+            print(f"⚠️ Heap sampling unavailable: {e}")
+            self._heap_sampling = False
+        self._metrics_before = self._get_metrics()
+        self._started_at = datetime.now().isoformat()
+        self._start_time = time.time()
+        print(f"🔬 DevTools tracing started: {self.scenario}")
+
+    def stop(self):
+        """Stop capturing and build the summary report"""
+        duration = time.time() - self._start_time
+        # Collect first so heap growth counts only what the scenario kept alive, as at start()
+        try:
+            self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        except Exception as e:
+            print(f"⚠️ Could not collect garbage before final metrics: {e}")
+        metrics_after = self._get_metrics()
+        events = self._drain_trace_events()
+
+        heap_profile = None
+        if self._heap_sampling:
+            try:
+                heap_profile = self.driver.execute_cdp_cmd('HeapProfiler.stopSampling', {}).get('profile')
+            except Exception as e:
+                print(f"⚠️ Could not stop heap sampling: {e}")
+        self.driver.execute_cdp_cmd('Performance.disable', {})
+
+        before, after = self._metrics_before, metrics_after
+        metrics_delta = {
+            name: round(after.get(name, 0) - before.get(name, 0), 6)
+            for name in METRIC_NAMES
+            if name in before or name in after
+        }
+
+        trace_summary = summarize_trace_events(events)
+        self.report = {
+            'scenario': self.scenario,
+            'started_at': self._started_at,
+            'duration_s': round(duration, 3),
+            'main_thread_ms': trace_summary['main_thread_ms'],
+            'script_ms': trace_summary['script_ms'],
+            'gc': trace_summary['gc'],
+            'heap': {
+                'start_bytes': before.get('JSHeapUsedSize', 0),
+                'end_bytes': after.get('JSHeapUsedSize', 0),
+                'growth_bytes': after.get('JSHeapUsedSize', 0) - before.get('JSHeapUsedSize', 0),
+                'sampling': summarize_heap_profile(heap_profile) if heap_profile else None,
+            },
+            'metrics': {
+                # TaskDuration/ScriptDuration are reported by Chrome in seconds
+                'task_ms': round(metrics_delta.get('TaskDuration', 0) * 1000.0, 3),
+                'script_ms': round(metrics_delta.get('ScriptDuration', 0) * 1000.0, 3),
+                'delta': metrics_delta,
+            },
+            'trace': {
+                'events': trace_summary['trace_events'],
+                'span_ms': trace_summary['trace_span_ms'],
+            },
+        }
+        print(f"🔬 DevTools tracing stopped: {self.scenario} ({duration:.1f}s)")
+        return self.report
+
+    def save_report(self, report=None):
+        """Write the report as JSON next to the scenario screenshots"""
+        report = report or self.report
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.output_dir, f'trace_{self.scenario}_{timestamp}.json')
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        self.report_path = path
+        print(f"📋 Trace report saved: {path}")
+        return path
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        self.save_report()
+        return False
+
+
+def print_report(report):
+    """Human-readable summary of a trace report"""
+    print(f"🧵 Main thread: {report['main_thread_ms']:.1f} ms "
+          f"(metrics: {report['metrics']['task_ms']:.1f} ms)")
+    print(f"📜 Scripting: {report['script_ms']:.1f} ms "
+          f"(metrics: {report['metrics']['script_ms']:.1f} ms)")
+    print(f"🗑️ GC: {report['gc']['count']} pauses, {report['gc']['total_ms']:.1f} ms total, "
+          f"{report['gc']['max_ms']:.1f} ms max")
+    print(f"📈 JS heap growth: {report['heap']['growth_bytes'] / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    import sys
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.action_chains import ActionChains
+    from dev_server import DevServer
+
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    DevToolsTracer.configure_options(chrome_options)
+    server = DevServer().start()
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_window_size(1280, 720)
+    try:
+        driver.get(server.game_url)
+        time.sleep(4)
+        driver.find_element(By.ID, 'gameCanvas').click()
+
+        with DevToolsTracer(driver, 'hold_w') as tracer:
+            actions = ActionChains(driver)
+            actions.key_down('w').perform()
+            time.sleep(seconds)
+            actions.key_up('w').perform()
+
+        print_report(tracer.report)
+    finally:
+        driver.quit()
+        server.stop()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Dev/Test Server
+Static server for the repository that tests can start in-process on a free
+port. Negotiates gzip (and brotli when the package is installed), sends
+strong ETags with 304 revalidation, Cache-Control and single byte ranges,
+and records per-request timing and transfer sizes.
+
+Usage:
+    with DevServer() as server:
+        driver.get(server.game_url)
+        ...
+        print(server.stats())
+
+    python dev_server.py            # serve the repo on a free port
+    python dev_server.py 8000       # or on a fixed port
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from functools import partial
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GAME_PATH = '/game/index.html'
+
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml',
+)
+MIN_COMPRESS_BYTES = 1024
+DEFAULT_MAX_AGE = 3600      # Seconds non-HTML assets may be reused without revalidation
+REQUEST_LOG_SIZE = 10000
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class _Representation:
+    """File contents plus its encoded variants, keyed by (mtime, size)"""
+
+    def __init__(self, path, stat):
+        with open(path, 'rb') as f:
+            self.body = f.read()
+        self.version = (stat.st_mtime_ns, stat.st_size)
+        self.mtime = stat.st_mtime
+        self.digest = hashlib.sha1(self.body).hexdigest()[:20]
+        self.encoded = {}
+        self._lock = threading.Lock()
+
+    def variant(self, encoding):
+        """(bytes, strong ETag) for 'identity', 'gzip' or 'br'"""
+        if encoding == 'identity':
+            return self.body, f'"{self.digest}"'
+        with self._lock:
+            if encoding not in self.encoded:
+                if encoding == 'br':
+                    self.encoded[encoding] = brotli.compress(self.body, quality=5)
+                else:
+                    self.encoded[encoding] = gzip.compress(self.body, compresslevel=6, mtime=0)
+        # Each encoding is a different representation, so it needs its own strong tag
+        return self.encoded[encoding], f'"{self.digest}-{encoding}"'
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files from the server's root with caching validators and compression"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _negotiate_encoding(self, ctype, size):
+        if size < MIN_COMPRESS_BYTES or not ctype.startswith(COMPRESSIBLE_TYPES):
+            return 'identity'
+        accepted = {}
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = part.strip().partition(';')
+            q = 1.0
+            if params.strip().startswith('q='):
+                try:
+                    q = float(params.strip()[2:])
+                except ValueError:
+                    q = 0.0
+            accepted[name.strip().lower()] = q
+        if brotli and accepted.get('br', 0) > 0:
+            return 'br'
+        if accepted.get('gzip', 0) > 0:
+            return 'gzip'
+        return 'identity'
+
+    def _cache_control(self, ctype):
+        if ctype.startswith('text/html') or self.server.max_age <= 0:
+            return 'no-cache'
+        return f'public, max-age={self.server.max_age}'
+
+    def _parse_range(self, size):
+        """(start, end) inclusive, None for a full response, or 'invalid' for 416"""
+        header = self.headers.get('Range')
+        if not header:
+            return None
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range != self._identity_etag:
+            return None
+        match = RANGE_RE.match(header.strip())
+        if not match or match.groups() == ('', ''):
+            return None  # Multi-range and malformed ranges get the whole file
+        first, last = match.groups()
+        if first == '':
+            length = int(last)
+            if length == 0:
+                return 'invalid'
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return 'invalid'
+        return start, end
+
+    def _resolve(self):
+        path = unquote(urlsplit(self.path).path)
+        local = self.translate_path(path)
+        if os.path.isdir(local):
+            if not path.endswith('/'):
+                return 'redirect', path + '/'
+            for index in ('index.html', 'index.htm'):
+                candidate = os.path.join(local, index)
+                if os.path.isfile(candidate):
+                    return 'file', candidate
+            return 'missing', None
+        if os.path.isfile(local):
+            return 'file', local
+        return 'missing', None
+
+    def send_head(self):
+        """Send headers and return the body bytes (None when there is no body)"""
+        kind, target = self._resolve()
+        if kind == 'redirect':
+            self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+            self.send_header('Location', target)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+        if kind == 'missing':
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return None
+
+        rep = self.server.representation(target)
+        ctype = self.guess_type(target)
+        encoding = 'identity' if self.headers.get('Range') else self._negotiate_encoding(ctype, len(rep.body))
+        body, etag = rep.variant(encoding)
+        self._identity_etag = rep.variant('identity')[1]
+        self._encoding = encoding
+
+        common = [
+            ('ETag', etag),
+            ('Last-Modified', formatdate(rep.mtime, usegmt=True)),
+            ('Cache-Control', self._cache_control(ctype)),
+            ('Vary', 'Accept-Encoding'),
+            ('Accept-Ranges', 'bytes'),
+        ]
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for name, value in common:
+                self.send_header(name, value)
+            self.end_headers()
+            return None
+
+        byte_range = self._parse_range(len(body)) if encoding == 'identity' else None
+        if byte_range == 'invalid':
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{len(body)}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None
+
+        if byte_range:
+            start, end = byte_range
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(body)}')
+            body = body[start:end + 1]
+        else:
+            self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        for name, value in common:
+            self.send_header(name, value)
+        self.end_headers()
+        return body
+
+    def _serve(self, include_body):
+        started = time.perf_counter()
+        self._status = None
+        self._encoding = 'identity'
+        body = self.send_head()
+        sent = 0
+        if body is not None and include_body:
+            self.wfile.write(body)
+            sent = len(body)
+        self.server.record({
+            'method': self.command,
+            'path': urlsplit(self.path).path,
+            'status': self._status,
+            'bytes': sent,
+            'encoding': self._encoding,
+            'ms': round((time.perf_counter() - started) * 1000.0, 3),
+        })
+
+    def send_response(self, code, message=None):
+        self._status = int(code)
+        super().send_response(code, message)
+
+    def do_GET(self):
+        self._serve(include_body=True)
+
+    def do_HEAD(self):
+        self._serve(include_body=False)
+
+
+class DevServer:
+    """In-process threaded static server for the repository"""
+
+    def __init__(self, root=REPO_ROOT, host='127.0.0.1', port=0, max_age=DEFAULT_MAX_AGE, quiet=True, log_requests=False):
+        self.root = root
+        self.host = host
+        self.port = port
+        self.max_age = max_age
+        self.quiet = quiet
+        self.log_requests = log_requests
+        self.requests = deque(maxlen=REQUEST_LOG_SIZE)
+        self._files = {}
+        self._files_lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    def representation(self, path):
+        stat = os.stat(path)
+        with self._files_lock:
+            rep = self._files.get(path)
+            if rep is None or rep.version != (stat.st_mtime_ns, stat.st_size):
+                rep = _Representation(path, stat)
+                self._files[path] = rep
+            return rep
+
+    def record(self, entry):
+        self.requests.append(entry)
+        if self.log_requests:
+            print(f"🌐 {entry['status']} {entry['method']} {entry['path']} "
+                  f"{entry['bytes'] / 1024:.1f}KB {entry['encoding']} {entry['ms']:.1f}ms")
+
+    def start(self):
+        httpd = ThreadingHTTPServer((self.host, self.port), partial(DevRequestHandler, directory=self.root))
+        httpd.daemon_threads = True
+        # Handler reads its settings from the server object
+        httpd.max_age = self.max_age
+        httpd.quiet = self.quiet
+        httpd.representation = self.representation
+        httpd.record = self.record
+        self._httpd = httpd
+        self.port = httpd.server_address[1]
+        self._thread = threading.Thread(target=httpd.serve_forever, name='dev-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+        return self
+
+    @property
+    def base_url(self):
+        return f'http://{self.host}:{self.port}'
+
+    @property
+    def game_url(self):
+        return self.base_url + GAME_PATH
+
+    def stats(self):
+        """Request counts, transfer sizes and timing since start"""
+        entries = list(self.requests)
+        if not entries:
+            return {'requests': 0}
+        timings = sorted(e['ms'] for e in entries)
+        by_encoding = {}
+        for e in entries:
+            by_encoding[e['encoding']] = by_encoding.get(e['encoding'], 0) + e['bytes']
+        return {
+            'requests': len(entries),
+            'not_modified': sum(1 for e in entries if e['status'] == 304),
+            'partial': sum(1 for e in entries if e['status'] == 206),
+            'errors': sum(1 for e in entries if e['status'] and e['status'] >= 400),
+            'bytes_sent': sum(e['bytes'] for e in entries),
+            'bytes_by_encoding': by_encoding,
+            'p50_ms': timings[len(timings) // 2],
+            'max_ms': timings[-1],
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    server = DevServer(port=port, log_requests=True).start()
+    print(f"🚀 Serving {server.root}")
+    print(f"🎮 Game: {server.game_url}")
+    print(f"🗜️ Compression: gzip{' + brotli' if brotli else ''}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats()}")
+        server.stop()
+        print("🧹 Server stopped")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest DevTools Event Pump
+Runs Selenium's CDP connection (trio + websocket) on a background thread so
+synchronous harness scripts can receive pushed DevTools events.
+
+Usage:
+    pump = DevToolsEventPump(driver)
+    pump.on_start(lambda session, devtools: session.execute(devtools.page.enable()))
+    pump.subscribe(lambda devtools: devtools.page.ScreencastFrame, handle_frame)
+    pump.start()
+    ...
+    pump.stop()
+
+Handlers are async functions called as handler(event, session, devtools).
+"""
+
+import threading
+
+import trio
+
+# Events buffered per subscription before the pump applies backpressure
+EVENT_BUFFER_SIZE = 2048
+
+
+class DevToolsEventPump:
+    """Background CDP session that dispatches pushed events to handlers"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._setups = []
+        self._teardowns = []
+        self._subscriptions = []
+        self._thread = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self.error = None
+
+    def on_start(self, callback):
+        """Async callback(session, devtools) run once the connection is open"""
+        self._setups.append(callback)
+        return self
+
+    def on_stop(self, callback):
+        """Async callback(session, devtools) run before the connection closes"""
+        self._teardowns.append(callback)
+        return self
+
+    def subscribe(self, event_type, handler):
+        """event_type is a function devtools -> CDP event class"""
+        self._subscriptions.append((event_type, handler))
+        return self
+
+    async def _pump(self, session, devtools, event_class, handler):
+        async for event in session.listen(event_class, buffer_size=EVENT_BUFFER_SIZE):
+            await handler(event, session, devtools)
+
+    async def _main(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            for setup in self._setups:
+                await setup(session, devtools)
+            async with trio.open_nursery() as nursery:
+                for event_type, handler in self._subscriptions:
+                    nursery.start_soon(self._pump, session, devtools, event_type(devtools), handler)
+                self._ready.set()
+                while not self._stop.is_set():
+                    await trio.sleep(0.02)
+                nursery.cancel_scope.cancel()
+            for teardown in self._teardowns:
+                await teardown(session, devtools)
+
+    def _run(self):
+        try:
+            trio.run(self._main)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._ready.set()
+
+    def start(self, timeout=10):
+        """Open the connection and block until subscriptions are live"""
+        self._stop.clear()
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name='devtools-events', daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        if self.error:
+            raise RuntimeError(f"DevTools connection failed: {self.error}")
+        return self
+
+    def stop(self, timeout=10):
+        """Run teardown callbacks and close the connection"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        return self
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Frame-Time Benchmark Suite
+Runs scripted gameplay scenarios, records per-frame CPU frame times from
+window.gameTelemetry and compares p50/p95/p99 against stored JSON baselines.
+
+Usage:
+  python frame_benchmark.py                      # run all scenarios, compare to baselines
+  python frame_benchmark.py idle_spawn hover     # run selected scenarios
+  python frame_benchmark.py --update-baseline    # record new baselines
+  python frame_benchmark.py --threshold 0.10     # fail on >10% regression
+
+Exit code is 1 when any scenario regresses past the threshold.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from dev_server import DevServer
+from results_store import ResultsStore, environment_info, flatten_metrics
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'frame_baselines.json')
+
+DEFAULT_THRESHOLD = 0.15   # Relative regression allowed on p50/p95/p99
+ABSOLUTE_SLACK_MS = 0.5    # Ignore regressions smaller than this (timer noise)
+LONG_FRAME_MS = 16.7       # Frames that miss a 60 Hz vsync
+VERY_LONG_FRAME_MS = 50.0  # Frames users notice as hitches
+WARMUP_SECONDS = 2.0
+COMPARED_STATS = ('p50', 'p95', 'p99')
+REGION_CELL = 25.0         # World units per side of a render-cost region
+
+# Per-frame render cost ceilings (checked against each scenario's p95), see game/js/RenderStats.js.
+# drawCalls and triangles are frame totals (main pass plus shadow passes); shadowCalls is the shadow share
+RENDER_BUDGETS = {
+    'drawCalls': 600,
+    'triangles': 1000000,
+    'shadowCalls': 300,
+    'programs': 40,
+}
+RENDER_STATS = ('drawCalls', 'triangles', 'shadowCalls', 'shadowTriangles', 'programs', 'textures', 'geometries')
+
+# Shared in-page driver: each scenario provides setup(ctx) and update(ctx, dt, elapsed)
+SCENARIO_RUNNER_JS = """
+const scenario = (function() { %s })();
+const logic = window.gameLogic;
+const ctx = {
+    logic: logic,
+    engine: window.gameEngine,
+    player: logic.player,
+    world: logic.worldManager,
+    camera: logic.cameraController
+};
+if (window.__rqBench) window.__rqBench.running = false;
+const bench = { running: true, elapsed: 0, stop: () => { bench.running = false; scenario.teardown && scenario.teardown(ctx); } };
+window.__rqBench = bench;
+scenario.setup && scenario.setup(ctx);
+let last = performance.now();
+function step(now) {
+    if (!bench.running) return;
+    const dt = Math.min((now - last) / 1000, 0.1);
+    last = now;
+    bench.elapsed += dt;
+    scenario.update && scenario.update(ctx, dt, bench.elapsed);
+    requestAnimationFrame(step);
+}
+requestAnimationFrame(step);
+return true;
+"""
+
+# Rotate whichever camera controller is active
+ORBIT_HELPER_JS = """
+function orbit(camera, radians) {
+    if (camera.yawTarget !== undefined) {
+        camera.yawTarget = camera.yawTarget + radians;
+        if (camera.yawTarget > Math.PI) camera.yawTarget -= Math.PI * 2;
+    } else if (camera.targetHorizontalAngle !== undefined) {
+        camera.targetHorizontalAngle += radians;
+        if (camera.targetHorizontalAngle > Math.PI) camera.targetHorizontalAngle -= Math.PI * 2;
+    }
+}
+"""
+
+SCENARIOS = {
+    'idle_spawn': {
+        'description': 'Stand still at the spawn platform',
+        'duration': 8.0,
+        'js': """
+            return {
+                setup(ctx) { ctx.player.respawn(); }
+            };
+        """,
+    },
+    'platform_chain': {
+        'description': 'Run forward while hopping along the floating platform chain',
+        'duration': 12.0,
+        'js': """
+            let chain = [];
+            let index = 0;
+            return {
+                setup(ctx) {
+                    chain = ctx.world.platforms
+                        .map(p => p.mesh.position)
+                        .filter(p => p.y > 1.5)
+                        .sort((a, b) => a.x - b.x);
+                    ctx.engine.keys['KeyW'] = true;
+                },
+                update(ctx, dt, elapsed) {
+                    const next = Math.floor(elapsed / 0.75) % Math.max(chain.length, 1);
+                    if (chain.length && next !== index) {
+                        index = next;
+                        const p = chain[index];
+                        ctx.player.physicsBody.position.set(p.x, p.y + 2, p.z);
+                        ctx.player.physicsBody.velocity.set(0, 0, 0);
+                    }
+                },
+                teardown(ctx) { ctx.engine.keys['KeyW'] = false; }
+            };
+        """,
+    },
+    'forest_orbit': {
+        'description': 'Orbit the camera a full turn every 4s from the middle of the forest',
+        'duration': 12.0,
+        'js': ORBIT_HELPER_JS + """
+            return {
+                setup(ctx) {
+                    // Instanced scenery: each tree record carries its bounding-sphere center
+                    const trees = ctx.world.scenery.trees;
+                    const center = trees.reduce((acc, t) => {
+                        acc.x += t.center.x / trees.length;
+                        acc.z += t.center.z / trees.length;
+                        return acc;
+                    }, { x: 0, z: 0 });
+                    ctx.player.physicsBody.position.set(center.x, 5, center.z);
+                    ctx.player.physicsBody.velocity.set(0, 0, 0);
+                },
+                update(ctx, dt) { orbit(ctx.camera, dt * Math.PI / 2); }
+            };
+        """,
+    },
+    'hover': {
+        'description': 'Hold Space to jump and hover with jetpack particles',
+        'duration': 8.0,
+        'js': """
+            return {
+                setup(ctx) { ctx.player.respawn(); ctx.engine.keys['Space'] = true; },
+                teardown(ctx) { ctx.engine.keys['Space'] = false; }
+            };
+        """,
+    },
+}
+
+
+def percentile(sorted_values, fraction):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize_frame_times(frame_ms):
+    """p50/p95/p99, mean and long-frame counts for a list of frame times (ms)"""
+    ordered = sorted(frame_ms)
+    count = len(ordered)
+    return {
+        'frames': count,
+        'mean': round(sum(ordered) / count, 3) if count else 0.0,
+        'p50': round(percentile(ordered, 0.50), 3),
+        'p95': round(percentile(ordered, 0.95), 3),
+        'p99': round(percentile(ordered, 0.99), 3),
+        'max': round(ordered[-1], 3) if count else 0.0,
+        'long_frames': sum(1 for ms in ordered if ms > LONG_FRAME_MS),
+        'very_long_frames': sum(1 for ms in ordered if ms > VERY_LONG_FRAME_MS),
+    }
+
+
+def summarize_render_stats(columns):
+    """mean/p95/max per renderer counter from drained telemetry columns"""
+    summary = {}
+    for name in RENDER_STATS:
+        values = columns.get(name)
+        if not values:
+            continue
+        ordered = sorted(values)
+        summary[name] = {
+            'mean': round(sum(ordered) / len(ordered), 1),
+            'p95': round(percentile(ordered, 0.95), 1),
+            'max': ordered[-1],
+        }
+    return summary
+
+
+def render_cost_by_region(columns, cell=REGION_CELL, top=5):
+    """Mean draw calls/triangles per camera grid cell, most expensive first"""
+    if 'cameraX' not in columns or 'drawCalls' not in columns:
+        return []
+    regions = {}
+    for x, z, calls, triangles in zip(columns['cameraX'], columns['cameraZ'], columns['drawCalls'], columns['triangles']):
+        key = (int(x // cell), int(z // cell))
+        region = regions.setdefault(key, [0, 0.0, 0.0])
+        region[0] += 1
+        region[1] += calls
+        region[2] += triangles
+    ranked = sorted(regions.items(), key=lambda item: -item[1][1] / item[1][0])
+    return [
+        {
+            'region': f'{kx * cell:.0f},{kz * cell:.0f}',
+            'frames': frames,
+            'draw_calls': round(calls / frames, 1),
+            'triangles': round(triangles / frames),
+        }
+        for (kx, kz), (frames, calls, triangles) in ranked[:top]
+    ]
+
+
+def check_render_budgets(render, budgets=RENDER_BUDGETS):
+    """Budget overruns as regression descriptions"""
+    overruns = []
+    for name, limit in budgets.items():
+        stat = render.get(name)
+        if stat and stat['p95'] > limit:
+            overruns.append(f"{name} p95 {stat['p95']:.0f} > budget {limit}")
+    return overruns
+
+
+def compare_to_baseline(result, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of regression descriptions (empty when within threshold)"""
+    regressions = []
+    for stat in COMPARED_STATS:
+        base = baseline.get(stat)
+        current = result.get(stat)
+        if base is None or current is None:
+            continue
+        limit = max(base * (1 + threshold), base + ABSOLUTE_SLACK_MS)
+        if current > limit:
+            regressions.append(
+                f"{stat} {current:.2f} ms > {limit:.2f} ms (baseline {base:.2f} ms, +{(current / base - 1) * 100 if base else 0:.0f}%)"
+            )
+    return regressions
+
+
+def load_baselines(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(baselines, path=BASELINE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+    print(f"💾 Baselines saved: {path}")
+
+
+def current_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return None
+
+
+def wait_for_game(driver, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        # Loaded means the base level has arrived (async fetch) and streamed in around the player
+        ready = driver.execute_script(
+            "const logic = window.gameLogic;"
+            "return !!(window.gameEngine && window.gameEngine.isLoaded && logic && window.gameTelemetry"
+            " && logic.worldManager.baseLevel && logic.worldManager.streamer.queue.length === 0);"
+        )
+        if ready:
+            return True
+        time.sleep(0.25)
+    return False
+
+
+def run_scenario(driver, name, game_url, warmup=WARMUP_SECONDS):
+    """Load a fresh game, run one scenario and return its frame-time summary"""
+    scenario = SCENARIOS[name]
+    driver.get(game_url)
+    if not wait_for_game(driver):
+        raise RuntimeError('game did not finish loading')
+
+    driver.execute_script(SCENARIO_RUNNER_JS % scenario['js'])
+    time.sleep(warmup)
+    driver.execute_script("window.gameTelemetry.drain();")  # discard warm-up frames
+
+    time.sleep(scenario['duration'])
+    drained = driver.execute_script("return window.gameTelemetry.drain();")
+    driver.execute_script("window.__rqBench && window.__rqBench.stop();")
+
+    summary = summarize_frame_times(drained['columns']['frameMs'])
+    summary['dropped'] = drained['dropped']
+    summary['duration_s'] = scenario['duration']
+    summary['render'] = summarize_render_stats(drained['columns'])
+    summary['render_regions'] = render_cost_by_region(drained['columns'])
+    return summary
+
+
+def create_driver(headless=False):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    # Keep rAF running at full rate even when the window is not focused
+    chrome_options.add_argument('--disable-background-timer-throttling')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_window_size(1280, 720)
+    return driver
+
+
+def record_history(results, regressions, durations, environment, commit):
+    """Append per-scenario frame-time stats to the results store (trend queries read p95 etc.)"""
+    try:
+        with ResultsStore() as store:
+            run_id = store.start_run('frame_benchmark', environment, commit)
+            for name, summary in results.items():
+                store.record_result(
+                    run_id, f'frame_benchmark.{name}',
+                    'failed' if name in regressions else 'passed',
+                    durations.get(name),
+                    details={'regressions': regressions.get(name, [])},
+                    metrics=flatten_metrics(summary)
+                )
+            store.finish_run(run_id)
+    except Exception as e:
+        print(f"⚠️ Could not record results history: {e}")
+
+
+def run_benchmarks(names, game_url, update_baseline=False, threshold=DEFAULT_THRESHOLD, headless=False):
+    """Run scenarios, compare to baselines and return (results, regressions)"""
+    print("⏱️ RoboQuest Frame-Time Benchmark")
+    print("=" * 40)
+
+    baselines = load_baselines()
+    results = {}
+    regressions = {}
+
+    driver = create_driver(headless)
+    environment = environment_info(driver)
+    durations = {}
+    try:
+        for name in names:
+            print(f"\n🎯 {name}: {SCENARIOS[name]['description']}")
+            started = time.perf_counter()
+            summary = run_scenario(driver, name, game_url)
+            durations[name] = round(time.perf_counter() - started, 3)
+            results[name] = summary
+            print(f"   📊 {summary['frames']} frames  p50={summary['p50']:.2f}ms  "
+                  f"p95={summary['p95']:.2f}ms  p99={summary['p99']:.2f}ms  "
+                  f"long={summary['long_frames']}  hitches={summary['very_long_frames']}")
+            render = summary['render']
+            if render:
+                print(f"   🎨 {render['drawCalls']['mean']:.0f} draw calls ({render['shadowCalls']['mean']:.0f} shadow)  "
+                      f"{render['triangles']['mean'] / 1000:.0f}k triangles  {render['programs']['max']:.0f} programs  "
+                      f"{render['textures']['max']:.0f} textures")
+            over_budget = check_render_budgets(render)
+            for line in over_budget:
+                print(f"   ❌ OVER BUDGET {line}")
+            if over_budget:
+                regressions[name] = list(over_budget)
+
+            if name in baselines and not update_baseline:
+                found = compare_to_baseline(summary, baselines[name], threshold)
+                if found:
+                    regressions.setdefault(name, []).extend(found)
+                    for line in found:
+                        print(f"   ❌ REGRESSION {line}")
+                elif not over_budget:
+                    print("   ✅ Within baseline")
+            elif not update_baseline:
+                print("   ⚠️ No baseline recorded (run with --update-baseline)")
+    finally:
+        driver.quit()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'commit': current_commit(),
+        'threshold': threshold,
+        'results': results,
+        'regressions': regressions,
+    }
+    report_path = f'frame_benchmark_{timestamp}.json'
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📋 Benchmark report saved: {report_path}")
+    record_history(results, regressions, durations, environment, report['commit'])
+
+    if update_baseline:
+        for name, summary in results.items():
+            baselines[name] = dict(summary, recorded_at=report['timestamp'], commit=report['commit'])
+        save_baselines(baselines)
+
+    return results, regressions
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    update = '--update-baseline' in args
+    headless = '--headless' in args
+    threshold = DEFAULT_THRESHOLD
+    if '--threshold' in args:
+        threshold = float(args[args.index('--threshold') + 1])
+    selected = [a for a in args if a in SCENARIOS] or list(SCENARIOS)
+
+    with DevServer() as server:
+        _, found_regressions = run_benchmarks(selected, server.game_url, update, threshold, headless)
+    if found_regressions:
+        print(f"\n❌ {len(found_regressions)} scenario(s) regressed beyond {threshold * 100:.0f}%")
+        sys.exit(1)
+    print("\n🏆 No frame-time regressions")
+    sys.exit(0)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Screenshot Comparison Engine
+Vectorized (NumPy) per-pixel deltas, SSIM, region-of-interest masks and
+frame-to-frame motion estimation, with multi-core batch comparison.
+
+Usage:
+  python image_compare.py                        # compare every before/after pair in the repo root
+  python image_compare.py path/to/screenshots    # compare pairs found in a directory
+  python image_compare.py a.png b.png            # compare two images
+
+In harness scripts:
+  from image_compare import compare_images, assert_visual_change
+  result = assert_visual_change('before.png', 'after.png', roi='scene')
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+# Screenshots are reduced (box-averaged by an integer factor) until they are at
+# most this wide; SSIM and motion stay accurate while the work drops 4-16x
+ANALYSIS_WIDTH = 640
+
+# Pixel intensity change (0-255) below which a pixel counts as unchanged
+DEFAULT_TOLERANCE = 12
+
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+# Named regions as (x, y, w, h) fractions of the frame. The HUD, controls
+# panel, FPS counter and back button are static overlays that hide or mimic
+# scene changes, so "scene" excludes them.
+OVERLAY_REGIONS = {
+    'hud': (0.0, 0.0, 0.25, 0.18),
+    'controls': (0.0, 0.70, 0.30, 0.30),
+    'top_right': (0.80, 0.0, 0.20, 0.10),
+}
+NAMED_ROIS = {
+    'full': None,
+    'center': (0.30, 0.25, 0.40, 0.50),  # Where the player robot sits in the TPS view
+    'ground': (0.0, 0.60, 1.0, 0.40),
+    'sky': (0.0, 0.0, 1.0, 0.35),
+}
+
+
+def reduction_factor(width, max_width=ANALYSIS_WIDTH):
+    """Integer downscale factor that brings width under max_width"""
+    if not max_width:
+        return 1
+    return max(1, -(-width // max_width))
+
+
+def load_image(path, max_width=ANALYSIS_WIDTH, gray=True):
+    """Load a screenshot as a float32 array (H x W grayscale or H x W x 3) and its reduction factor"""
+    with Image.open(path) as img:
+        img = img.convert('L' if gray else 'RGB')
+        factor = reduction_factor(img.width, max_width)
+        if factor > 1:
+            img = img.reduce(factor)
+        return np.asarray(img, dtype=np.float32), factor
+
+
+def as_array(image, max_width=ANALYSIS_WIDTH, gray=True):
+    """Accept a path or an in-memory array; returns (array, reduction factor)"""
+    if not isinstance(image, np.ndarray):
+        return load_image(image, max_width=max_width, gray=gray)
+
+    array = image.astype(np.float32, copy=False)
+    if gray and array.ndim == 3:
+        array = array[..., :3] @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    factor = reduction_factor(array.shape[1], max_width)
+    if factor > 1:
+        height = array.shape[0] // factor * factor
+        width = array.shape[1] // factor * factor
+        array = array[:height, :width].reshape(
+            height // factor, factor, width // factor, factor, *array.shape[2:]
+        ).mean(axis=(1, 3))
+    return array, factor
+
+
+def region_mask(shape, region):
+    """Boolean mask for an (x, y, w, h) region given as fractions or pixels"""
+    height, width = shape[:2]
+    mask = np.zeros((height, width), dtype=bool)
+    x, y, w, h = region
+    if all(0.0 <= v <= 1.0 for v in region):
+        x, w = x * width, w * width
+        y, h = y * height, h * height
+    mask[int(y):int(y + h), int(x):int(x + w)] = True
+    return mask
+
+
+def build_mask(shape, roi=None, exclude_overlays=True):
+    """Combine a named/explicit ROI with overlay exclusion into one mask"""
+    if isinstance(roi, str):
+        if roi == 'scene':
+            roi = None
+        elif roi not in NAMED_ROIS:
+            raise ValueError(f"unknown ROI '{roi}' (choose from {sorted(NAMED_ROIS) + ['scene']})")
+        else:
+            roi = NAMED_ROIS[roi]
+
+    if isinstance(roi, np.ndarray):
+        mask = roi.astype(bool)
+    elif roi is None:
+        mask = np.ones(shape[:2], dtype=bool)
+    else:
+        mask = region_mask(shape, roi)
+
+    if exclude_overlays:
+        for overlay in OVERLAY_REGIONS.values():
+            mask &= ~region_mask(shape, overlay)
+    return mask
+
+
+def pixel_delta(a, b, mask=None, tolerance=DEFAULT_TOLERANCE):
+    """Absolute per-pixel difference statistics inside a mask"""
+    diff = np.abs(a - b)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    if mask is not None:
+        diff = diff[mask]
+    if diff.size == 0:
+        return {'mean_abs': 0.0, 'max_abs': 0.0, 'changed_fraction': 0.0}
+    return {
+        'mean_abs': float(diff.mean()),
+        'max_abs': float(diff.max()),
+        'changed_fraction': float(np.count_nonzero(diff > tolerance) / diff.size),
+    }
+
+
+def _box_mean(stack, window):
+    """Mean over window x window neighbourhoods ('valid' region) with separable running sums"""
+    sums = np.cumsum(stack, axis=-2, dtype=np.float32)
+    sums = np.concatenate([sums[..., window - 1:window, :], sums[..., window:, :] - sums[..., :-window, :]], axis=-2)
+    sums = np.cumsum(sums, axis=-1, dtype=np.float32)
+    sums = np.concatenate([sums[..., window - 1:window], sums[..., window:] - sums[..., :-window]], axis=-1)
+    return sums / (window * window)
+
+
+def ssim_map(a, b, window=SSIM_WINDOW):
+    """Structural similarity map (box-window SSIM) for two grayscale arrays"""
+    # Centre each image so float32 running sums stay precise; add the means back for luminance
+    mean_a = float(a.mean())
+    mean_b = float(b.mean())
+    ca = (a - mean_a).astype(np.float32)
+    cb = (b - mean_b).astype(np.float32)
+    box_a, box_b, box_aa, box_bb, box_ab = _box_mean(np.stack([ca, cb, ca * ca, cb * cb, ca * cb]), window)
+
+    var_a = box_aa - box_a * box_a
+    var_b = box_bb - box_b * box_b
+    cov = box_ab - box_a * box_b
+    mu_a = box_a + mean_a
+    mu_b = box_b + mean_b
+    numerator = (2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2)
+    denominator = (mu_a * mu_a + mu_b * mu_b + SSIM_C1) * (var_a + var_b + SSIM_C2)
+    return numerator / denominator
+
+
+def ssim(a, b, mask=None, window=SSIM_WINDOW):
+    """Mean SSIM, optionally restricted to a mask (1.0 = identical)"""
+    values = ssim_map(a, b, window)
+    if mask is not None:
+        # ssim_map is the 'valid' region; align the mask to window centres
+        offset = window // 2
+        mask = mask[offset:offset + values.shape[0], offset:offset + values.shape[1]]
+        values = values[mask]
+    return float(values.mean()) if values.size else 1.0
+
+
+@lru_cache(maxsize=8)
+def _hann_window(height, width):
+    return np.outer(np.hanning(height), np.hanning(width)).astype(np.float32)
+
+
+def estimate_motion(a, b, mask=None):
+    """Global translation from a to b via phase correlation: (dx, dy, confidence)"""
+    if mask is not None:
+        a = np.where(mask, a, a[mask].mean() if mask.any() else 0)
+        b = np.where(mask, b, b[mask].mean() if mask.any() else 0)
+    height, width = a.shape
+    window = _hann_window(height, width)
+    fa = np.fft.rfft2((a - a.mean()) * window)
+    fb = np.fft.rfft2((b - b.mean()) * window)
+    cross = fb * np.conj(fa)
+    cross /= np.maximum(np.abs(cross), 1e-9)
+    correlation = np.fft.irfft2(cross, s=(height, width))
+
+    peak = np.unravel_index(np.argmax(correlation), correlation.shape)
+    dy, dx = peak
+    if dy > height // 2:
+        dy -= height
+    if dx > width // 2:
+        dx -= width
+    return float(dx), float(dy), float(correlation[peak])
+
+
+def compare_images(before, after, roi='scene', max_width=ANALYSIS_WIDTH,
+                   tolerance=DEFAULT_TOLERANCE, motion=True):
+    """Full comparison of two screenshots (paths or arrays)"""
+    start = time.perf_counter()
+    a, factor = as_array(before, max_width)
+    b, _ = as_array(after, max_width)
+    if a.shape != b.shape:
+        raise ValueError(f"image sizes differ: {a.shape} vs {b.shape}")
+
+    mask = build_mask(a.shape, roi)
+    result = pixel_delta(a, b, mask, tolerance)
+    result['ssim'] = ssim(a, b, mask)
+    if motion:
+        dx, dy, confidence = estimate_motion(a, b, mask)
+        # Report motion in original-resolution pixels
+        result['motion'] = {'dx': dx * factor, 'dy': dy * factor, 'confidence': confidence}
+    result['elapsed_ms'] = (time.perf_counter() - start) * 1000.0
+    if not isinstance(before, np.ndarray):
+        result['before'] = before
+        result['after'] = after
+    return result
+
+
+def _compare_pair_job(job):
+    before, after, options = job
+    try:
+        return compare_images(before, after, **options)
+    except Exception as e:
+        return {'before': before, 'after': after, 'error': str(e)}
+
+
+def batch_compare(pairs, workers=None, **options):
+    """Compare many (before, after) pairs across CPU cores"""
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    jobs = [(before, after, options) for before, after in pairs]
+    if workers == 1 or len(jobs) == 1:
+        return [_compare_pair_job(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_compare_pair_job, jobs, chunksize=chunksize))
+
+
+def find_screenshot_pairs(directory='.'):
+    """Pair up before/after captures and numbered sequences in a directory
+
+    - name_before_x.png  <->  name_after_x.png
+    - prefix_1_*.png -> prefix_2_*.png -> ... (consecutive steps)
+    """
+    paths = sorted(glob.glob(os.path.join(directory, '*.png')))
+    pairs = []
+    used = set()
+
+    for path in paths:
+        if '_before_' in os.path.basename(path):
+            after = os.path.join(directory, os.path.basename(path).replace('_before_', '_after_'))
+            if os.path.exists(after):
+                pairs.append((path, after))
+                used.update((path, after))
+
+    sequences = {}
+    for path in paths:
+        if path in used:
+            continue
+        match = re.match(r'(.+?)_(\d+)(?:_.*)?\.png$', os.path.basename(path))
+        if match:
+            sequences.setdefault(match.group(1), []).append((int(match.group(2)), path))
+    for steps in sequences.values():
+        steps.sort()
+        for (_, first), (_, second) in zip(steps, steps[1:]):
+            pairs.append((first, second))
+    return pairs
+
+
+def assert_visual_change(before, after, min_changed=0.01, max_ssim=0.98, roi='scene', **options):
+    """Assert the scene visibly changed (e.g. the character moved); returns the comparison"""
+    result = compare_images(before, after, roi=roi, **options)
+    changed = result['changed_fraction'] >= min_changed or result['ssim'] <= max_ssim
+    assert changed, (
+        f"no visual change between {before} and {after}: "
+        f"changed={result['changed_fraction']:.4f} ssim={result['ssim']:.4f}"
+    )
+    return result
+
+
+def assert_visually_similar(before, after, max_changed=0.01, min_ssim=0.98, roi='scene', **options):
+    """Assert the scene stayed the same (e.g. no drift while idle); returns the comparison"""
+    result = compare_images(before, after, roi=roi, motion=False, **options)
+    similar = result['changed_fraction'] <= max_changed and result['ssim'] >= min_ssim
+    assert similar, (
+        f"unexpected visual change between {before} and {after}: "
+        f"changed={result['changed_fraction']:.4f} ssim={result['ssim']:.4f}"
+    )
+    return result
+
+
+def print_comparison(result):
+    if 'error' in result:
+        print(f"❌ {os.path.basename(result['before'])}: {result['error']}")
+        return
+    name = f"{os.path.basename(result.get('before', 'a'))} → {os.path.basename(result.get('after', 'b'))}"
+    motion = result.get('motion')
+    motion_text = f" motion=({motion['dx']:+.0f},{motion['dy']:+.0f})px" if motion else ''
+    print(f"🖼️ {name}: changed={result['changed_fraction'] * 100:.1f}% "
+          f"ssim={result['ssim']:.3f} meanΔ={result['mean_abs']:.1f}{motion_text} "
+          f"[{result['elapsed_ms']:.0f} ms]")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    started = time.perf_counter()
+    if len(args) == 2 and all(a.endswith('.png') for a in args):
+        results = [compare_images(args[0], args[1])]
+    else:
+        directory = args[0] if args else '.'
+        pairs = find_screenshot_pairs(directory)
+        print(f"🔍 Comparing {len(pairs)} screenshot pairs in {directory}")
+        results = batch_compare(pairs)
+
+    for result in results:
+        print_comparison(result)
+    elapsed = time.perf_counter() - started
+    print(f"\n⏱️ {len(results)} comparisons in {elapsed:.2f}s")
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Input Recording & Replay
+Records real play sessions with the in-page InputRecorder and replays them
+frame-exact (through GameEngine.tick) many times faster than live, or in
+real time through DevTools Input.dispatch*Event for trusted input.
+
+Usage:
+  python input_replay.py record forest_run --seconds 30     # play, then saved to recordings/
+  python input_replay.py replay forest_run                  # as fast as possible, DOM events
+  python input_replay.py replay forest_run --mode state --repeat 5
+  python input_replay.py replay forest_run --mode cdp --speed 2
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings')
+FRAME_DT = 1 / 60
+EVENT_STRIDE = 6
+POSITION_TOLERANCE = 0.05  # World units a deterministic replay may drift from the recording
+
+# Mirrors INPUT_EVENT in game/js/InputRecorder.js
+KEY_DOWN, KEY_UP, MOUSE_DOWN, MOUSE_UP, MOUSE_MOVE, WHEEL, FRAME = range(7)
+
+# Selenium Keys values used by the hand-written movement plans -> KeyboardEvent.code
+SELENIUM_KEY_CODES = {
+    '\ue00d': 'Space',
+    '\ue013': 'ArrowUp',
+    '\ue015': 'ArrowDown',
+    '\ue012': 'ArrowLeft',
+    '\ue014': 'ArrowRight',
+    '\ue008': 'ShiftLeft',
+    '\ue00c': 'Escape',
+    '\ue007': 'Enter',
+}
+
+# KeyboardEvent.code -> (key, windowsVirtualKeyCode) for DevTools dispatch
+SPECIAL_KEYS = {
+    'Space': (' ', 32),
+    'Enter': ('Enter', 13),
+    'Escape': ('Escape', 27),
+    'ShiftLeft': ('Shift', 16),
+    'ShiftRight': ('Shift', 16),
+    'ArrowLeft': ('ArrowLeft', 37),
+    'ArrowUp': ('ArrowUp', 38),
+    'ArrowRight': ('ArrowRight', 39),
+    'ArrowDown': ('ArrowDown', 40),
+}
+
+CDP_MOUSE_BUTTONS = {0: 'left', 1: 'middle', 2: 'right'}
+
+REPLAY_JS = """
+const done = arguments[arguments.length - 1];
+const options = arguments[1];
+if (options.speed === null) options.speed = Infinity;
+window.inputReplayer.replay(arguments[0], options).then(done, (e) => done({ error: String(e) }));
+"""
+
+
+def key_code(key):
+    """Selenium key or single character -> KeyboardEvent.code"""
+    if key in SELENIUM_KEY_CODES:
+        return SELENIUM_KEY_CODES[key]
+    if len(key) == 1 and key.isalpha():
+        return 'Key' + key.upper()
+    if len(key) == 1 and key.isdigit():
+        return 'Digit' + key
+    return key
+
+
+def plan_to_recording(plan, frame_dt=FRAME_DT, settle=0.5):
+    """Convert a [(key, hold_seconds), ...] movement plan into a recording.
+
+    Each key is held for its duration, then released; fixed frame_dt frames
+    are emitted throughout, with settle seconds of idle frames at the end.
+    """
+    codes = []
+    events = []
+    t = 0.0
+
+    def frames_for(seconds):
+        nonlocal t
+        for _ in range(max(1, int(round(seconds / frame_dt)))):
+            events.extend([t * 1000.0, FRAME, frame_dt, 0, 0, 0])
+            t += frame_dt
+
+    for key, hold in plan:
+        code = key_code(key)
+        if code not in codes:
+            codes.append(code)
+        index = codes.index(code)
+        events.extend([t * 1000.0, KEY_DOWN, index, 0, 0, 0])
+        frames_for(hold)
+        events.extend([t * 1000.0, KEY_UP, index, 0, 0, 0])
+    frames_for(settle)
+
+    return {
+        'version': 1,
+        'codes': codes,
+        'events': events,
+        'frames': sum(1 for i in range(0, len(events), EVENT_STRIDE) if events[i + 1] == FRAME),
+        'duration': t * 1000.0,
+        'start': None,
+        'end': None,
+    }
+
+
+def recording_path(name):
+    return os.path.join(RECORDINGS_DIR, name if name.endswith('.json') else f'{name}.json')
+
+
+def save_recording(recording, name):
+    os.makedirs(RECORDINGS_DIR, exist_ok=True)
+    path = recording_path(name)
+    with open(path, 'w') as f:
+        json.dump(recording, f, separators=(',', ':'))
+    return path
+
+
+def load_recording(name):
+    with open(recording_path(name)) as f:
+        return json.load(f)
+
+
+def start_recording(driver):
+    driver.execute_script("window.inputRecorder.startRecording();")
+
+
+def stop_recording(driver):
+    return driver.execute_script("return window.inputRecorder.stopRecording();")
+
+
+def replay_in_page(driver, recording, mode='dom', speed=None, render_every=None, timeout=300):
+    """Frame-exact replay through GameEngine.tick(); speed None = as fast as possible"""
+    driver.set_script_timeout(timeout)
+    options = {'mode': mode, 'speed': speed}
+    if render_every:
+        options['renderEvery'] = render_every
+    result = driver.execute_async_script(REPLAY_JS, recording, options)
+    if result and result.get('error'):
+        raise RuntimeError(f"replay failed: {result['error']}")
+    return result
+
+
+def _dispatch_cdp(driver, recording, i):
+    events = recording['events']
+    kind, p0, p1, p2 = events[i + 1], events[i + 2], events[i + 3], events[i + 4]
+    if kind in (KEY_DOWN, KEY_UP):
+        code = recording['codes'][int(p0)]
+        if code in SPECIAL_KEYS:
+            key, vk = SPECIAL_KEYS[code]
+        elif code.startswith('Key'):
+            key, vk = code[3:].lower(), ord(code[3:])
+        elif code.startswith('Digit'):
+            key, vk = code[5:], ord(code[5:])
+        else:
+            key, vk = code, 0
+        params = {'type': 'keyDown' if kind == KEY_DOWN else 'keyUp', 'code': code, 'key': key,
+                  'windowsVirtualKeyCode': vk}
+        driver.execute_cdp_cmd('Input.dispatchKeyEvent', params)
+    elif kind in (MOUSE_DOWN, MOUSE_UP):
+        driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+            'type': 'mousePressed' if kind == MOUSE_DOWN else 'mouseReleased',
+            'x': p1, 'y': p2, 'button': CDP_MOUSE_BUTTONS.get(int(p0), 'left'), 'clickCount': 1,
+        })
+    elif kind == MOUSE_MOVE:
+        driver.execute_cdp_cmd('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': p0, 'y': p1})
+    elif kind == WHEEL:
+        driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+            'type': 'mouseWheel', 'x': p1, 'y': p2, 'deltaX': 0, 'deltaY': p0,
+        })
+
+
+def replay_cdp(driver, recording, speed=1.0):
+    """Real-time replay as trusted browser input (DevTools Input domain), time-compressed by speed.
+
+    The live game loop runs normally, so results are not frame-exact.
+    """
+    events = recording['events']
+    driver.execute_script("""
+        const start = arguments[0], body = window.gameLogic.player.physicsBody;
+        if (start) {
+            body.position.set(start.position.x, start.position.y, start.position.z);
+            body.velocity.set(start.velocity.x, start.velocity.y, start.velocity.z);
+        }
+    """, recording.get('start'))
+    wall_start = time.perf_counter()
+    dispatched = 0
+    for i in range(0, len(events), EVENT_STRIDE):
+        if events[i + 1] == FRAME:
+            continue
+        delay = events[i] / 1000.0 / speed - (time.perf_counter() - wall_start)
+        if delay > 0:
+            time.sleep(delay)
+        _dispatch_cdp(driver, recording, i)
+        dispatched += 1
+    remaining = recording['duration'] / 1000.0 / speed - (time.perf_counter() - wall_start)
+    if remaining > 0:
+        time.sleep(remaining)
+    wall_ms = (time.perf_counter() - wall_start) * 1000.0
+    return {
+        'events': dispatched,
+        'simulatedMs': recording['duration'],
+        'wallMs': wall_ms,
+        'speedup': recording['duration'] / wall_ms if wall_ms else 0,
+        'end': driver.execute_script("""
+            const b = window.gameLogic.player.physicsBody;
+            return { position: { x: b.position.x, y: b.position.y, z: b.position.z } };
+        """),
+    }
+
+
+def position_drift(expected, actual):
+    """Distance between two recorded player snapshots (None when either is missing)"""
+    if not expected or not actual:
+        return None
+    a, b = expected['position'], actual['position']
+    return math.sqrt(sum((a[k] - b[k]) ** 2 for k in 'xyz'))
+
+
+def record_session(name, seconds, game_url):
+    driver = create_driver()
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            print("❌ Game did not load")
+            return False
+        print(f"🔴 Recording for {seconds:.0f}s - play the game in the browser window")
+        start_recording(driver)
+        time.sleep(seconds)
+        recording = stop_recording(driver)
+        path = save_recording(recording, name)
+        print(f"💾 {recording['frames']} frames, {len(recording['events']) // EVENT_STRIDE} events "
+              f"({recording['duration'] / 1000:.1f}s) saved: {path}")
+        return True
+    finally:
+        driver.quit()
+
+
+def replay_session(name, game_url, mode='dom', speed=None, repeat=1, headless=False):
+    recording = load_recording(name)
+    driver = create_driver(headless)
+    passed = True
+    try:
+        for attempt in range(1, repeat + 1):
+            driver.get(game_url)
+            if not wait_for_game(driver):
+                print("❌ Game did not load")
+                return False
+            if mode == 'cdp':
+                result = replay_cdp(driver, recording, speed or 1.0)
+            else:
+                result = replay_in_page(driver, recording, mode, speed)
+            drift = position_drift(recording.get('end'), result.get('end'))
+            print(f"▶️ Replay {attempt}/{repeat} ({mode}): {result['simulatedMs'] / 1000:.1f}s of play "
+                  f"in {result['wallMs'] / 1000:.2f}s ({result['speedup']:.1f}x)"
+                  + (f", end drift {drift:.3f}" if drift is not None else ""))
+            # Only frame-exact replays are expected to land where the recording ended
+            if mode != 'cdp' and drift is not None and drift > POSITION_TOLERANCE:
+                print(f"   ❌ Final position drifted {drift:.3f} > {POSITION_TOLERANCE}")
+                passed = False
+    finally:
+        driver.quit()
+    return passed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if len(args) < 2 or args[0] not in ('record', 'replay'):
+        print(__doc__)
+        sys.exit(2)
+
+    def option(flag, default, cast=str):
+        return cast(args[args.index(flag) + 1]) if flag in args else default
+
+    with DevServer() as server:
+        if args[0] == 'record':
+            ok = record_session(args[1], option('--seconds', 30.0, float), server.game_url)
+        else:
+            ok = replay_session(
+                args[1],
+                server.game_url,
+                mode=option('--mode', 'dom'),
+                speed=option('--speed', None, float),
+                repeat=option('--repeat', 1, int),
+                headless='--headless' in args,
+            )
+    sys.exit(0 if ok else 1)
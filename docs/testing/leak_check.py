@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest GPU & Heap Leak Check
+Cycles level loads, game restarts and full engine restarts (scene and
+physics emptied, world, player and camera rig rebuilt) many times, sampling
+renderer.info.memory
+(geometries, textures), scene/physics object counts and the garbage-collected
+JS heap (DevTools Performance metrics) after every cycle. Fails when any of
+them keeps growing, and prints which game code created the leaked GPU
+objects (window.resourceTracker, enabled with ?track=1).
+
+Usage:
+  python leak_check.py                  # 20 cycles against an in-process dev server
+  python leak_check.py --cycles 50 --headless
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+from results_store import ResultsStore, environment_info
+
+DEFAULT_CYCLES = 20
+WARMUP_CYCLES = 2          # First cycles fill caches/JIT and are not judged
+SETTLE_FRAMES = 3          # Rendered frames after each step so uploads/frees reach the renderer
+STREAM_FRAMES_MAX = 600    # Cap on frames spent waiting for the streamer to build a new level
+HEAP_SLOPE_LIMIT = 64 * 1024   # Bytes per cycle of sustained heap growth tolerated as noise
+HEAP_RISING_FRACTION = 0.75    # ... and only when most cycles grew
+
+# Each cycle ends with a restart so every sample sees the same world
+CYCLE_STEPS = [
+    ('loadLevel', 2),
+    ('loadLevel', 3),
+    ('engineRestart', None),
+    ('restart', None),
+]
+
+# loadLevel resolves once the level file is registered, engineRestart once the rebuilt world has
+# its base level again; the streamer then builds the content over frames
+STEP_JS = """
+const done = arguments[arguments.length - 1];
+const [action, level, frames, streamFramesMax] = arguments;
+const logic = window.gameLogic;
+const steps = {
+    loadLevel: () => logic.loadLevel(level),
+    restart: () => logic.restart(),
+    engineRestart: () => {
+        window.gameEngine.restart();
+        return logic.worldManager.ready;
+    }
+};
+Promise.resolve(steps[action]()).then(() => {
+    const streamer = logic.worldManager.streamer; // A new world after an engine restart
+    let streaming = streamFramesMax;
+    let remaining = frames;
+    (function wait() {
+        if (streamer.queue.length > 0 && --streaming >= 0) requestAnimationFrame(wait);
+        else if (--remaining < 0) done(true);
+        else requestAnimationFrame(wait);
+    })();
+});
+"""
+
+SAMPLE_JS = """
+const engine = window.gameEngine;
+const memory = engine.renderer.info.memory;
+let objects = 0;
+engine.scene.traverse(() => objects++);
+return {
+    geometries: memory.geometries,
+    textures: memory.textures,
+    programs: (engine.renderer.info.programs || []).length,
+    sceneObjects: objects,
+    bodies: engine.world.bodies.length
+};
+"""
+
+GPU_SERIES = ('geometries', 'textures', 'programs', 'sceneObjects', 'bodies')
+
+
+def heap_used(driver):
+    """JS heap in use after a forced full GC, in bytes"""
+    driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+    metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})
+    return {m['name']: m['value'] for m in metrics.get('metrics', [])}.get('JSHeapUsedSize', 0)
+
+
+def take_sample(driver):
+    sample = driver.execute_script(SAMPLE_JS)
+    sample['heap'] = heap_used(driver)
+    return sample
+
+
+def run_cycle(driver):
+    for action, level in CYCLE_STEPS:
+        driver.execute_async_script(STEP_JS, action, level, SETTLE_FRAMES, STREAM_FRAMES_MAX)
+
+
+def slope(values):
+    """Least-squares growth per cycle"""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    numerator = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+    denominator = sum((i - mean_x) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def rising_fraction(values):
+    steps = list(zip(values, values[1:]))
+    return sum(1 for a, b in steps if b > a) / len(steps) if steps else 0.0
+
+
+def detect_growth(samples):
+    """Series that grow across cycles -> {name: {first, last, slope}}
+
+    Object counts are exact, so any net growth with a positive trend is a leak.
+    The heap is noisy, so it must rise by more than HEAP_SLOPE_LIMIT per cycle
+    on most cycles.
+    """
+    growth = {}
+    for name in GPU_SERIES + ('heap',):
+        values = [s[name] for s in samples]
+        trend = slope(values)
+        if name == 'heap':
+            leaking = trend > HEAP_SLOPE_LIMIT and rising_fraction(values) >= HEAP_RISING_FRACTION
+        else:
+            leaking = values[-1] > values[0] and trend > 0
+        if leaking:
+            growth[name] = {'first': values[0], 'last': values[-1], 'slope': round(trend, 2)}
+    return growth
+
+
+def run_leak_check(game_url, cycles=DEFAULT_CYCLES, headless=False):
+    print("🧹 RoboQuest Leak Check")
+    print("=" * 40)
+
+    driver = create_driver(headless)
+    environment = environment_info(driver)
+    started = time.perf_counter()
+    try:
+        driver.get(game_url + ('&' if '?' in game_url else '?') + 'track=1')
+        if not wait_for_game(driver):
+            print("❌ Game did not load")
+            return None
+        driver.set_script_timeout(30)
+        driver.execute_cdp_cmd('Performance.enable', {})
+
+        for _ in range(WARMUP_CYCLES):
+            run_cycle(driver)
+        generation = driver.execute_script("return window.resourceTracker.mark();")
+
+        samples = [take_sample(driver)]
+        for cycle in range(1, cycles + 1):
+            run_cycle(driver)
+            sample = take_sample(driver)
+            samples.append(sample)
+            print(f"🔁 {cycle:3d}: {sample['geometries']} geometries, {sample['textures']} textures, "
+                  f"{sample['sceneObjects']} scene objects, {sample['bodies']} bodies, "
+                  f"heap {sample['heap'] / 1048576:.1f} MB")
+
+        tracker = driver.execute_script("return window.resourceTracker.report(window.gameEngine.scene, arguments[0]);",
+                                        generation)
+        driver.execute_cdp_cmd('Performance.disable', {})
+    finally:
+        driver.quit()
+
+    growth = detect_growth(samples)
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'cycles': cycles,
+        'steps': [f'{a}({l})' if l is not None else f'{a}()' for a, l in CYCLE_STEPS],
+        'samples': samples,
+        'growth': growth,
+        'tracker': tracker,
+        'duration_s': round(time.perf_counter() - started, 3),
+        'passed': not growth,
+    }
+    record_history(report, environment)
+    return report
+
+
+def print_leak_report(report):
+    print()
+    for name, g in report['growth'].items():
+        unit = ' bytes' if name == 'heap' else ''
+        print(f"❌ {name} grew {g['first']:.0f} → {g['last']:.0f}{unit} (+{g['slope']:.1f}{unit}/cycle)")
+    leaks = report['tracker']['leaks']
+    if leaks:
+        print("🔎 Undisposed GPU objects no longer in the scene, by creation site:")
+        for leak in leaks[:15]:
+            print(f"   {leak['count']:5d} {leak['kind']:<9} {leak['site']}")
+    if report['passed']:
+        print(f"✅ No growth across {report['cycles']} cycles")
+
+
+def record_history(report, environment):
+    try:
+        with ResultsStore() as store:
+            run_id = store.start_run('leak_check', environment)
+            last = report['samples'][-1]
+            store.record_result(
+                run_id, 'leak_check', 'passed' if report['passed'] else 'failed', report['duration_s'],
+                details={'growth': report['growth'], 'leaks': report['tracker']['leaks'][:15]},
+                metrics={name: last[name] for name in GPU_SERIES + ('heap',)}
+            )
+            store.finish_run(run_id)
+    except Exception as e:
+        print(f"⚠️ Could not record results history: {e}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    cycle_count = int(args[args.index('--cycles') + 1]) if '--cycles' in args else DEFAULT_CYCLES
+    with DevServer() as server:
+        leak_report = run_leak_check(server.game_url, cycle_count, headless='--headless' in args)
+    if leak_report is None:
+        sys.exit(1)
+    print_leak_report(leak_report)
+
+    path = f"leak_check_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump(leak_report, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if leak_report['passed'] else 1)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Level Load Benchmark
+Compiles stress levels of increasing size with level_tools/level_compiler.py,
+hands each binary to the running game and times, in the page: parsing the
+buffer into typed-array views, registering every object with the world
+streamer, and building the chunks around the spawn point (the only
+construction that happens before the next frame). Every size must load
+within LOAD_BUDGET_MS, and with the player still at the spawn point every
+newly registered chunk within the streamer's load radius must finish
+building over the following frames.
+
+Usage:
+  python level_load_benchmark.py
+  python level_load_benchmark.py --headless
+"""
+
+import base64
+import json
+import os
+import sys
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'level_tools'))
+from level_compiler import compile_level, read_header, stress_level  # noqa: E402
+
+OBJECT_COUNTS = [100, 1000, 5000, 20000]
+LOAD_BUDGET_MS = 16
+
+LOAD_JS = """
+const [encoded] = arguments;
+const world = window.gameLogic.worldManager;
+const binary = atob(encoded);
+const bytes = new Uint8Array(binary.length);
+for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+
+const t0 = performance.now();
+const level = world.parseLevel(bytes.buffer);
+const t1 = performance.now();
+world.loadLevelData(level);
+const t2 = performance.now();
+world.streamer.update({ x: 0, z: 0 }); // Sync chunks around the spawn point plus one budget slice
+const t3 = performance.now();
+const streaming = world.streamer.getDebugInfo();
+
+// Keep streaming without moving the focus: every in-radius chunk of the new level must build
+const streamer = world.streamer;
+let frames = 0;
+while (streamer.queue.length > 0 && frames < 10000) {
+    streamer.update({ x: 0, z: 0 });
+    frames++;
+}
+let unbuilt = 0;
+for (const chunk of streamer.chunks.values()) {
+    if (chunk.items.length > 0 && chunk.state !== 2 && streamer.chunkDistance(chunk) <= streamer.config.loadRadius) {
+        unbuilt++;
+    }
+}
+world.reset(); // Drop the level again before the next size
+return {
+    parse_ms: t1 - t0,
+    register_ms: t2 - t1,
+    first_build_ms: t3 - t2,
+    load_ms: t3 - t0,
+    chunks: streaming.chunks,
+    chunks_loaded: streaming.loaded,
+    chunks_queued: streaming.queued,
+    stream_frames: frames,
+    unbuilt_in_radius: unbuilt
+};
+"""
+
+
+def run_level_load_benchmark(game_url, headless=False):
+    levels = []
+    for count in OBJECT_COUNTS:
+        data = compile_level(stress_level(count))
+        levels.append((count, read_header(data), base64.b64encode(data).decode('ascii')))
+
+    driver = create_driver(headless)
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            raise RuntimeError('game did not finish loading')
+        driver.execute_script("window.gameEngine.pause();")  # Only the measured calls touch the world
+
+        results = []
+        for count, header, encoded in levels:
+            timing = driver.execute_script(LOAD_JS, encoded)
+            timing.update({
+                'objects': header['platforms'] + header['collectibles'] + header['trees'],
+                'bytes': header['bytes'],
+                'passed': timing['load_ms'] <= LOAD_BUDGET_MS and timing['unbuilt_in_radius'] == 0
+            })
+            results.append(timing)
+            print(f"  {timing['objects']:>6} objects {timing['bytes'] / 1024:>7.1f} KB: "
+                  f"parse {timing['parse_ms']:.2f} ms, register {timing['register_ms']:.2f} ms, "
+                  f"first build {timing['first_build_ms']:.2f} ms "
+                  f"({timing['chunks_loaded']}/{timing['chunks']} chunks)")
+        return results
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    print("🗺️ RoboQuest Level Load Benchmark")
+    print("=" * 40)
+    with DevServer() as server:
+        benchmark = run_level_load_benchmark(server.game_url, headless='--headless' in args)
+
+    failures = [r for r in benchmark if not r['passed']]
+    for r in failures:
+        if r['unbuilt_in_radius']:
+            print(f"❌ {r['objects']} objects: {r['unbuilt_in_radius']} in-radius chunks never built")
+        if r['load_ms'] > LOAD_BUDGET_MS:
+            print(f"❌ {r['objects']} objects took {r['load_ms']:.1f} ms (budget {LOAD_BUDGET_MS} ms)")
+    if not failures:
+        print(f"\n✅ Every level size loaded within {LOAD_BUDGET_MS} ms and streamed in around the spawn point")
+
+    path = f"level_load_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'budget_ms': LOAD_BUDGET_MS,
+                   'results': benchmark, 'passed': not failures}, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if not failures else 1)
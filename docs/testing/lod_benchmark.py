@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Scenery LOD Benchmark
+Renders fixed camera views of the default world with SceneryRenderer's LOD
+tiers switched off (every tree and cloud at full detail, nothing culled) and
+with each quality tier, and compares draw calls and triangles (shadow passes
+included) from the in-page RenderStats. Wide views must draw fewer triangles
+with every tier than with LOD off. Then the live camera is turned around
+through the camera rig: trees culled outside the view before the turn must
+be drawn again after it.
+
+Usage:
+  python lod_benchmark.py
+  python lod_benchmark.py --headless
+"""
+
+import json
+import sys
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+
+TIERS = ['off', 'high', 'medium', 'low']
+
+# name -> camera position, look-at target; all but 'player' see most of the world
+VIEWS = {
+    'player': ([0, 10, 15], [0, 0, 0]),
+    'overview': ([0, 80, 120], [0, 0, 0]),
+    'ground_long': ([-100, 6, 0], [100, 4, 0]),
+    'corner': ([100, 30, 100], [-50, 0, -50])
+}
+WIDE_VIEWS = ('overview', 'ground_long', 'corner')
+
+BENCHMARK_JS = """
+const [tiers, views] = arguments;
+const engine = window.gameEngine;
+const scenery = window.gameLogic.worldManager.scenery;
+const rig = window.gameLogic.cameraController;
+const camera = engine.camera;
+const savedTier = scenery.lodTierName;
+const parent = camera.parent;
+const savedPosition = camera.position.clone();
+const savedQuaternion = camera.quaternion.clone();
+const wasPaused = engine.isPaused;
+engine.isPaused = true; // Hold the live loop so only these renders touch the counters
+
+// Fixed views are world coordinates: take the camera off the rig while placing it
+if (parent) parent.remove(camera);
+engine.scene.add(camera);
+const results = [];
+try {
+    for (const tier of tiers) {
+        scenery.setLodTier(tier);
+        for (const [name, [position, target]] of Object.entries(views)) {
+            camera.position.set(...position);
+            camera.lookAt(...target);
+            scenery.update(0, camera);
+            engine.renderer.render(engine.scene, camera);
+            engine.renderStats.capture(camera);
+            const stats = engine.renderStats.snapshot();
+            const lod = scenery.getDebugInfo();
+            results.push({
+                tier: tier,
+                view: name,
+                draw_calls: stats.drawCalls,
+                triangles: stats.triangles,
+                shadow_calls: stats.shadowCalls,
+                trees_near: lod.treesNear,
+                trees_mid: lod.treesMid,
+                trees_far: lod.treesFar,
+                trees_culled: lod.treesCulled,
+                scenery_draw_calls: lod.drawCalls
+            });
+        }
+    }
+} finally {
+    engine.scene.remove(camera);
+    if (parent) parent.add(camera);
+    camera.position.copy(savedPosition);
+    camera.quaternion.copy(savedQuaternion);
+}
+
+// Turn the live camera through the rig: trees outside the view facing one way must come back facing the other
+let turn = null;
+if (rig && rig.yawPivot) {
+    const saved = [rig.yaw, rig.yawTarget, rig.target.mesh.rotation.y];
+    const culledAt = (yaw) => {
+        rig.yaw = rig.yawTarget = yaw;
+        rig.update(0);
+        scenery.update(0, camera);
+        return new Set(scenery.trees.filter(tree => tree.tier === 3)); // LOD_CULLED
+    };
+    try {
+        scenery.setLodTier('high');
+        const before = culledAt(0);
+        const after = culledAt(Math.PI);
+        let reentered = 0;
+        for (const tree of before) if (!after.has(tree)) reentered++;
+        turn = { culled_before: before.size, culled_after: after.size, reentered: reentered };
+    } finally {
+        rig.yaw = saved[0];
+        rig.yawTarget = saved[1];
+        rig.update(0);
+        rig.target.mesh.rotation.y = saved[2];
+    }
+}
+scenery.setLodTier(savedTier);
+engine.isPaused = wasPaused;
+return { views: results, turn: turn };
+"""
+
+
+def run_lod_benchmark(game_url, headless=False):
+    driver = create_driver(headless)
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            raise RuntimeError('game did not finish loading')
+        measured = driver.execute_script(BENCHMARK_JS, TIERS, VIEWS)
+        return measured['views'], measured['turn']
+    finally:
+        driver.quit()
+
+
+def compare_to_baseline(results):
+    """Per tier and view: draw call and triangle deltas against LOD off."""
+    baseline = {r['view']: r for r in results if r['tier'] == 'off'}
+    rows = []
+    for r in results:
+        if r['tier'] == 'off':
+            continue
+        base = baseline[r['view']]
+        rows.append({
+            'tier': r['tier'],
+            'view': r['view'],
+            'draw_calls': r['draw_calls'],
+            'draw_call_delta': r['draw_calls'] - base['draw_calls'],
+            'triangles': r['triangles'],
+            'triangle_reduction': 1 - r['triangles'] / base['triangles'] if base['triangles'] else 0.0
+        })
+    return rows
+
+
+def print_lod_report(results, comparison):
+    print(f"{'tier':>7} {'view':>12} {'calls':>6} {'tris':>9} {'near':>5} {'mid':>5} {'far':>5} {'culled':>7}")
+    for r in results:
+        print(f"{r['tier']:>7} {r['view']:>12} {r['draw_calls']:>6} {r['triangles']:>9} "
+              f"{r['trees_near']:>5} {r['trees_mid']:>5} {r['trees_far']:>5} {r['trees_culled']:>7}")
+    print("\nAgainst LOD off:")
+    for c in comparison:
+        print(f"  {c['tier']:>7} {c['view']:>12}: {c['draw_call_delta']:+d} draw calls, "
+              f"{c['triangle_reduction']:.0%} fewer triangles")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    print("🌲 RoboQuest Scenery LOD Benchmark")
+    print("=" * 40)
+    with DevServer() as server:
+        benchmark, turn = run_lod_benchmark(server.game_url, headless='--headless' in args)
+    comparison = compare_to_baseline(benchmark)
+    print_lod_report(benchmark, comparison)
+
+    failures = [c for c in comparison if c['view'] in WIDE_VIEWS and c['triangle_reduction'] <= 0]
+    for c in failures:
+        print(f"❌ {c['tier']} / {c['view']}: no triangle reduction")
+    if not failures:
+        print("\n✅ Every tier draws fewer triangles in all wide views")
+    turn_passed = turn is not None and turn['reentered'] > 0
+    if turn is None:
+        print("❌ Turn check needs the camera rig (default controller)")
+    else:
+        print(f"{'✅' if turn_passed else '❌'} Camera turn: {turn['reentered']} of {turn['culled_before']} "
+              f"culled trees re-entered the view")
+    passed = not failures and turn_passed
+
+    path = f"lod_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'results': benchmark,
+                   'comparison': comparison, 'turn': turn, 'passed': passed}, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Console / Error Stream
+Pushes console calls, uncaught exceptions and failed network requests from
+DevTools into a queue as they happen, instead of polling driver.get_log().
+Entries are filtered by level and message pattern before they are queued and
+carry the browser's own timestamp, so they can be ordered against input.
+
+Usage:
+    with ConsoleStream(driver, min_level='WARNING') as logs:
+        body.send_keys('d')
+        logs.wait_for('collected', timeout=5)
+        for entry in logs.drain():
+            print(entry['level'], entry['message'])
+
+Nothing is subscribed until start() is called, so tests that don't read
+logs pay nothing.
+"""
+
+import queue
+import re
+import time
+
+from devtools_events import DevToolsEventPump
+
+# Selenium's browser-log level names, lowest first
+LEVELS = ('DEBUG', 'INFO', 'WARNING', 'SEVERE')
+
+CONSOLE_LEVELS = {
+    'debug': 'DEBUG',
+    'trace': 'DEBUG',
+    'log': 'INFO',
+    'info': 'INFO',
+    'dir': 'INFO',
+    'table': 'INFO',
+    'warning': 'WARNING',
+    'error': 'SEVERE',
+    'assert': 'SEVERE',
+}
+
+
+def _format_arg(arg):
+    """Render a Runtime.RemoteObject roughly as the DevTools console would"""
+    if arg.value is not None:
+        return str(arg.value)
+    if arg.unserializable_value is not None:
+        return str(arg.unserializable_value)
+    return arg.description or arg.type_
+
+
+class ConsoleStream:
+    """Filtered, timestamped push stream of browser console output"""
+
+    def __init__(self, driver, min_level='INFO', patterns=None, exclude=None, network=True, maxsize=10000):
+        if min_level not in LEVELS:
+            raise ValueError(f"unknown level '{min_level}' (choose from {LEVELS})")
+        self.driver = driver
+        self.min_rank = LEVELS.index(min_level)
+        self.patterns = [re.compile(p, re.IGNORECASE) for p in (patterns or [])]
+        self.exclude = [re.compile(p, re.IGNORECASE) for p in (exclude or [])]
+        self.network = network
+        self.entries = queue.Queue(maxsize=maxsize)
+        self.history = []     # Every entry handed out by get()/drain()/wait_for()
+        self.filtered = 0     # Events dropped by level/pattern filters
+        self.overflowed = 0   # Events dropped because nobody drained the queue
+        self._request_urls = {}
+        self._pump = None
+
+    def _accept(self, level, message):
+        if LEVELS.index(level) < self.min_rank:
+            return False
+        if self.patterns and not any(p.search(message) for p in self.patterns):
+            return False
+        if any(p.search(message) for p in self.exclude):
+            return False
+        return True
+
+    def _put(self, level, source, message, timestamp_ms, url=None, line=None):
+        if not self._accept(level, message):
+            self.filtered += 1
+            return
+        entry = {
+            'level': level,
+            'source': source,
+            'message': message,
+            'timestamp': timestamp_ms / 1000.0,  # Epoch seconds, comparable with time.time()
+            'url': url,
+            'line': line,
+        }
+        try:
+            self.entries.put_nowait(entry)
+        except queue.Full:
+            self.overflowed += 1
+
+    async def _on_console(self, event, session, devtools):
+        frame = event.stack_trace.call_frames[0] if event.stack_trace and event.stack_trace.call_frames else None
+        self._put(
+            CONSOLE_LEVELS.get(event.type_, 'INFO'),
+            'console',
+            ' '.join(_format_arg(arg) for arg in event.args),
+            float(event.timestamp),
+            frame.url if frame else None,
+            frame.line_number + 1 if frame else None,
+        )
+
+    async def _on_exception(self, event, session, devtools):
+        details = event.exception_details
+        message = details.exception.description if details.exception and details.exception.description else details.text
+        self._put('SEVERE', 'javascript', message, float(event.timestamp), details.url, details.line_number + 1)
+
+    async def _on_request(self, event, session, devtools):
+        self._request_urls[event.request_id] = event.request.url
+
+    async def _on_loading_failed(self, event, session, devtools):
+        url = self._request_urls.pop(event.request_id, None)
+        if event.canceled:
+            return
+        self._put('SEVERE', 'network', f"{url or event.request_id} failed: {event.error_text}",
+                  time.time() * 1000.0, url)
+
+    async def _on_response(self, event, session, devtools):
+        self._request_urls.pop(event.request_id, None)
+        if event.response.status >= 400:
+            self._put('SEVERE', 'network', f"{event.response.url} returned {event.response.status}",
+                      time.time() * 1000.0, event.response.url)
+
+    def start(self):
+        """Subscribe to DevTools events (runs on a background thread)"""
+        async def enable(session, devtools):
+            await session.execute(devtools.runtime.enable())
+            if self.network:
+                await session.execute(devtools.network.enable())
+
+        self._pump = DevToolsEventPump(self.driver)
+        self._pump.on_start(enable)
+        self._pump.subscribe(lambda devtools: devtools.runtime.ConsoleAPICalled, self._on_console)
+        self._pump.subscribe(lambda devtools: devtools.runtime.ExceptionThrown, self._on_exception)
+        if self.network:
+            self._pump.subscribe(lambda devtools: devtools.network.RequestWillBeSent, self._on_request)
+            self._pump.subscribe(lambda devtools: devtools.network.ResponseReceived, self._on_response)
+            self._pump.subscribe(lambda devtools: devtools.network.LoadingFailed, self._on_loading_failed)
+        self._pump.start()
+        return self
+
+    def stop(self):
+        if self._pump:
+            self._pump.stop()
+            self._pump = None
+        return self
+
+    @property
+    def running(self):
+        return self._pump is not None and self._pump.running
+
+    def get(self, timeout=None):
+        """Next entry, blocking up to timeout seconds (None when nothing arrived)"""
+        try:
+            entry = self.entries.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        self.history.append(entry)
+        return entry
+
+    def drain(self):
+        """All queued entries, oldest first by browser timestamp"""
+        drained = []
+        while True:
+            try:
+                drained.append(self.entries.get_nowait())
+            except queue.Empty:
+                break
+        drained.sort(key=lambda e: e['timestamp'])
+        self.history.extend(drained)
+        return drained
+
+    def wait_for(self, pattern, timeout=10.0, level=None):
+        """Block until an entry matching pattern (and level) arrives; returns it or None"""
+        matcher = re.compile(pattern, re.IGNORECASE)
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            entry = self.get(timeout=remaining)
+            if entry and matcher.search(entry['message']) and (level is None or entry['level'] == level):
+                return entry
+
+    def errors(self):
+        return [e for e in self.history if e['level'] == 'SEVERE']
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def print_entry(entry, prefix=''):
+    icon = {'SEVERE': '❌', 'WARNING': '⚠️', 'INFO': '🎮', 'DEBUG': '🔍'}[entry['level']]
+    print(f"{prefix}{icon} [{entry['source']}] {entry['message']}")
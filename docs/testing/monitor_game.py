@@ -21,63 +21,9 @@ def monitor_game_console():
     
     # JavaScript snippet to inject into browser console for monitoring
     monitor_script = """
-// RoboQuest Console Monitor
-console.log('🔍 Console monitor activated');
-
-// Store original console methods
-const originalLog = console.log;
-const originalError = console.error;
-const originalWarn = console.warn;
-
-// Monitor array
-window.gameMonitor = {
-    logs: [],
-    startTime: Date.now(),
-    addLog: function(type, message) {
-        const entry = {
-            type: type,
-            message: message,
-            timestamp: Date.now() - this.startTime,
-            time: new Date().toISOString()
-        };
-        this.logs.push(entry);
-        
-        // Keep only last 100 logs
-        if (this.logs.length > 100) {
-            this.logs.shift();
-        }
-    }
-};
-
-// Override console methods
-console.log = function(...args) {
-    const message = args.join(' ');
-    window.gameMonitor.addLog('log', message);
-    originalLog.apply(console, args);
-};
-
-console.error = function(...args) {
-    const message = args.join(' ');
-    window.gameMonitor.addLog('error', message);
-    originalError.apply(console, args);
-};
-
-console.warn = function(...args) {
-    const message = args.join(' ');
-    window.gameMonitor.addLog('warn', message);
-    originalWarn.apply(console, args);
-};
-
-// Game-specific monitoring
-if (window.gameLogic) {
-    const originalCollectCoin = window.gameLogic.player.collectCoin;
-    window.gameLogic.player.collectCoin = function() {
-        originalCollectCoin.call(this);
-        console.log(`🪙 Coin collected! Total: ${this.coins}`);
-    };
-}
-
-console.log('✅ Game monitoring active - check window.gameMonitor.logs for history');
+// RoboQuest Console Monitor (uses the built-in game logger - no console patching)
+gameLog.configure({ level: 'debug' });  // or gameLog.configure({ categories: ['player', 'collect'] })
+console.log('✅ Game monitoring active - gameLog.entries() for history, gameLog.drain() to read and clear');
 """
     
     print("📋 COPY THIS SCRIPT TO BROWSER CONSOLE:")
@@ -90,8 +36,9 @@ console.log('✅ Game monitoring active - check window.gameMonitor.logs for hist
     print("2. Open DevTools (F12) → Console tab")
     print("3. Paste the script above and press Enter")
     print("4. Play the game for testing")
-    print("5. Run: window.gameMonitor.logs to see captured events")
-    print("6. Run: JSON.stringify(window.gameMonitor.logs, null, 2) for formatted output")
+    print("5. Run: gameLog.entries() to see captured events")
+    print("6. Run: JSON.stringify(gameLog.drain().entries, null, 2) for formatted output")
+    print("   (or open index.html?log=debug&logcat=player,collect to log from startup)")
     
     print("\n🎮 EXPECTED CONSOLE OUTPUT:")
     print("✅ '🎮 Game engine ready'")
@@ -106,13 +53,8 @@ def create_monitoring_bookmarklet():
     
     # Minified monitoring script
     bookmarklet = """javascript:(function(){
-        if(window.gameMonitor) return console.log('Monitor already active');
-        window.gameMonitor={logs:[],startTime:Date.now(),addLog:function(t,m){this.logs.push({type:t,message:m,timestamp:Date.now()-this.startTime,time:new Date().toISOString()});if(this.logs.length>100)this.logs.shift()}};
-        const ol=console.log,oe=console.error,ow=console.warn;
-        console.log=function(...a){const m=a.join(' ');window.gameMonitor.addLog('log',m);ol.apply(console,a)};
-        console.error=function(...a){const m=a.join(' ');window.gameMonitor.addLog('error',m);oe.apply(console,a)};
-        console.warn=function(...a){const m=a.join(' ');window.gameMonitor.addLog('warn',m);ow.apply(console,a)};
-        console.log('✅ RoboQuest monitor active - check window.gameMonitor.logs');
+        gameLog.configure({level:'debug'});
+        console.log('✅ RoboQuest monitor active - check gameLog.entries()');
     })();"""
     
     print("\n🔖 BOOKMARKLET FOR EASY MONITORING:")
@@ -141,7 +83,7 @@ def show_live_testing_guide():
     print("   - Space for jumping")
     print("   - Mouse click for hover")
     print("5. 🪙 Try to collect coins and gems")
-    print("6. 📊 Check window.gameMonitor.logs for captured events")
+    print("6. 📊 Check gameLog.entries() for captured events")
     print("7. ✅ Verify no red errors in console")
     
     print("\n🎯 SUCCESS CRITERIA:")
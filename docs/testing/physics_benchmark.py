@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Physics Step Benchmark
+Times CANNON world.step() in the game page for growing procedural levels
+(static platforms along a strip plus a few dynamic bodies) under each
+broadphase: naive, grid, sweep-and-prune, and sweep-and-prune with static
+platforms merged into compound cluster bodies as World.createPlatform does.
+Also reports which broadphase GameEngine's 'auto' mode picks per size.
+
+Usage:
+  python physics_benchmark.py
+  python physics_benchmark.py --headless --steps 240
+"""
+
+import json
+import sys
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+
+PLATFORM_COUNTS = [10, 50, 200, 1000, 4000]
+DEFAULT_STEPS = 120
+NAIVE_MAX = 1000            # O(n^2) pairs: larger sizes take minutes
+FRAME_BUDGET_MS = 4.0       # Physics share of a 60 Hz frame
+
+BENCHMARK_JS = """
+const [counts, steps, naiveMax, clusterSize, sapThreshold] = arguments;
+const DYNAMIC_BODIES = 20;
+let seed = 4242;
+const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647;
+
+function platforms(n) {
+    // generatePlatformSequence-style strip: 8 units apart, wavy heights
+    const list = [];
+    for (let i = 0; i < n; i++) {
+        list.push({ x: i * 8, y: 5 + Math.sin(i * 0.5) * 3, z: (random() - 0.5) * 6 });
+    }
+    return list;
+}
+
+function build(kind, layout, compound) {
+    const world = new CANNON.World();
+    world.gravity.set(0, -30, 0);
+    world.solver.iterations = 10;
+    world.allowSleep = true;
+    const length = layout.length * 8;
+    if (kind === 'sap') world.broadphase = new CANNON.SAPBroadphase(world);
+    else if (kind === 'grid') world.broadphase = new CANNON.GridBroadphase(
+        new CANNON.Vec3(-10, -20, -20), new CANNON.Vec3(length + 10, 40, 20), Math.max(1, Math.round(length / 16)), 4, 2);
+    else world.broadphase = new CANNON.NaiveBroadphase();
+
+    const clusters = new Map();
+    for (const p of layout) {
+        const shape = new CANNON.Box(new CANNON.Vec3(2, 0.5, 2));
+        if (compound) {
+            const cx = Math.floor(p.x / clusterSize), cz = Math.floor(p.z / clusterSize);
+            const key = cx + ',' + cz;
+            let body = clusters.get(key);
+            if (!body) {
+                body = new CANNON.Body({ mass: 0 });
+                body.position.set((cx + 0.5) * clusterSize, 0, (cz + 0.5) * clusterSize);
+                world.add(body);
+                clusters.set(key, body);
+            }
+            body.addShape(shape, new CANNON.Vec3(p.x - body.position.x, p.y, p.z - body.position.z));
+        } else {
+            const body = new CANNON.Body({ mass: 0 });
+            body.addShape(shape);
+            body.position.set(p.x, p.y, p.z);
+            world.add(body);
+        }
+    }
+    // Dynamic bodies dropped onto the first platforms: some settle and sleep
+    for (let i = 0; i < DYNAMIC_BODIES; i++) {
+        const p = layout[i % layout.length];
+        const body = new CANNON.Body({ mass: 1 });
+        body.addShape(new CANNON.Sphere(0.5));
+        body.position.set(p.x + (random() - 0.5), p.y + 2 + i * 0.1, p.z);
+        world.add(body);
+    }
+    if (kind === 'sap') world.broadphase.autoDetectAxis();
+    return world;
+}
+
+function time(world) {
+    for (let i = 0; i < 10; i++) world.step(1 / 60); // Warm-up
+    const start = performance.now();
+    for (let i = 0; i < steps; i++) world.step(1 / 60);
+    return (performance.now() - start) / steps;
+}
+
+const results = [];
+for (const n of counts) {
+    const layout = platforms(n);
+    const row = { platforms: n, auto: n + DYNAMIC_BODIES > sapThreshold ? 'sap' : 'naive' };
+    row.naive_ms = n <= naiveMax ? time(build('naive', layout, false)) : null;
+    row.grid_ms = time(build('grid', layout, false));
+    row.sap_ms = time(build('sap', layout, false));
+    const compound = build('sap', layout, true);
+    row.sap_compound_ms = time(compound);
+    row.compound_bodies = compound.bodies.length;
+    row.sleeping = compound.bodies.filter(b => b.sleepState === CANNON.Body.SLEEPING).length;
+    results.push(row);
+}
+return results;
+"""
+
+CONFIG_COLUMNS = ('naive_ms', 'grid_ms', 'sap_ms', 'sap_compound_ms')
+
+
+def run_physics_benchmark(game_url, steps=DEFAULT_STEPS, headless=False):
+    driver = create_driver(headless)
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            raise RuntimeError('game did not finish loading')
+        config = driver.execute_script(
+            "const w = window.gameLogic.worldManager;"
+            "return { clusterSize: w.clusterSize, sapThreshold: window.gameEngine.physicsConfig.sapThreshold };"
+        )
+        driver.set_script_timeout(600)
+        return driver.execute_script(
+            BENCHMARK_JS, PLATFORM_COUNTS, steps, NAIVE_MAX, config['clusterSize'], config['sapThreshold']
+        )
+    finally:
+        driver.quit()
+
+
+def print_physics_report(results):
+    print(f"{'platforms':>9} {'naive':>9} {'grid':>9} {'sap':>9} {'sap+cmpd':>9} {'bodies':>7} {'asleep':>7}  auto")
+    for r in results:
+        cells = [f"{r[c]:.3f}" if r[c] is not None else '-' for c in CONFIG_COLUMNS]
+        print(f"{r['platforms']:>9} " + ' '.join(f"{c:>9}" for c in cells)
+              + f" {r['compound_bodies']:>7} {r['sleeping']:>7}  {r['auto']}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    step_count = int(args[args.index('--steps') + 1]) if '--steps' in args else DEFAULT_STEPS
+
+    print("⚙️ RoboQuest Physics Step Benchmark (ms per step)")
+    print("=" * 40)
+    with DevServer() as server:
+        benchmark = run_physics_benchmark(server.game_url, step_count, headless='--headless' in args)
+    print_physics_report(benchmark)
+
+    # The game's configuration (sap + compound clusters) must fit the frame budget at every size
+    over = [r for r in benchmark if r['sap_compound_ms'] > FRAME_BUDGET_MS]
+    for r in over:
+        print(f"❌ {r['platforms']} platforms: {r['sap_compound_ms']:.2f} ms/step > {FRAME_BUDGET_MS} ms budget")
+    if not over:
+        print(f"\n✅ Game configuration within {FRAME_BUDGET_MS} ms/step up to {PLATFORM_COUNTS[-1]} platforms")
+
+    path = f"physics_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'steps': step_count,
+                   'results': benchmark, 'passed': not over}, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if not over else 1)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Test Results Store
+SQLite history of every harness run: per-test outcome and duration,
+numeric performance metrics and an environment fingerprint, with queries
+for metric trends across commits, flaky tests and the slowest tests.
+
+Usage:
+    with ResultsStore() as store:
+        run_id = store.start_run('game_suite')
+        store.record_result(run_id, 'game_loading', 'passed', 4.2, metrics={'fps': 58})
+        store.finish_run(run_id)
+        store.metric_trend('p95', test='frame_benchmark.idle_spawn', last_commits=10)
+
+  python results_store.py trend p95 frame_benchmark.idle_spawn
+  python results_store.py flaky
+  python results_store.py slowest
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+
+DEFAULT_DB_PATH = os.environ.get(
+    'ROBOQUEST_RESULTS_DB',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_history.db'),
+)
+
+OUTCOMES = ('passed', 'failed', 'error', 'skipped')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    git_commit TEXT,
+    git_branch TEXT,
+    fingerprint TEXT,
+    environment TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration_s REAL,
+    details TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_test ON results(test, run_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_name ON metrics(name, test, run_id);
+"""
+
+
+def _git(*args):
+    try:
+        return subprocess.check_output(['git', *args], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def environment_info(driver=None):
+    """Machine/browser description used to tell runs on different setups apart"""
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+    if driver is not None:
+        capabilities = getattr(driver, 'capabilities', {}) or {}
+        info['browser'] = capabilities.get('browserName')
+        info['browser_version'] = capabilities.get('browserVersion')
+        info['window'] = driver.get_window_size() if hasattr(driver, 'get_window_size') else None
+    return info
+
+
+def fingerprint(environment):
+    return hashlib.sha1(json.dumps(environment, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def flatten_metrics(values, prefix=''):
+    """Numeric leaves of nested dicts as {'a.b': value} (lists and strings are skipped)"""
+    flat = {}
+    for key, value in (values or {}).items():
+        name = f'{prefix}{key}'
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            flat[name] = float(value)
+        elif isinstance(value, dict):
+            flat.update(flatten_metrics(value, name + '.'))
+    return flat
+
+
+class ResultsStore:
+    """Append-only SQLite store of harness runs"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets parallel runner workers record while others read
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # Recording
+
+    def start_run(self, suite, environment=None, commit=None):
+        environment = environment or environment_info()
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (suite, started_at, git_commit, git_branch, fingerprint, environment) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (suite, datetime.now().isoformat(), commit or _git('rev-parse', '--short', 'HEAD'),
+                 _git('rev-parse', '--abbrev-ref', 'HEAD'), fingerprint(environment), json.dumps(environment)),
+            )
+        return cursor.lastrowid
+
+    def record_result(self, run_id, test, outcome, duration_s=None, details=None, metrics=None):
+        if outcome not in OUTCOMES:
+            raise ValueError(f"unknown outcome '{outcome}' (choose from {OUTCOMES})")
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO results (run_id, test, outcome, duration_s, details) VALUES (?, ?, ?, ?, ?)',
+                (run_id, test, outcome, duration_s, json.dumps(details, default=str) if details is not None else None),
+            )
+            if metrics:
+                self.conn.executemany(
+                    'INSERT INTO metrics (run_id, test, name, value) VALUES (?, ?, ?, ?)',
+                    [(run_id, test, name, float(value)) for name, value in metrics.items()],
+                )
+
+    def finish_run(self, run_id):
+        with self.conn:
+            self.conn.execute('UPDATE runs SET finished_at = ? WHERE id = ?', (datetime.now().isoformat(), run_id))
+
+    # Queries
+
+    def metric_trend(self, metric, test=None, last_commits=10):
+        """Per-commit mean/min/max of a metric over the most recent commits (oldest first)"""
+        rows = self.conn.execute(
+            """
+            SELECT r.git_commit AS git_commit, MAX(r.started_at) AS last_run, COUNT(*) AS samples,
+                   AVG(m.value) AS mean, MIN(m.value) AS min, MAX(m.value) AS max
+            FROM metrics m JOIN runs r ON r.id = m.run_id
+            WHERE m.name = ? AND (? IS NULL OR m.test = ?)
+            GROUP BY r.git_commit
+            ORDER BY last_run DESC
+            LIMIT ?
+            """,
+            (metric, test, test, last_commits),
+        ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def flakiness(self, last_results=20, min_results=5):
+        """Tests ranked by how often their outcome flips between consecutive recent runs.
+
+        score = flips / (results - 1); a test that alternates every run scores 1.0.
+        mixed_commits counts commits where the same test both passed and failed.
+        """
+        rows = self.conn.execute(
+            """
+            WITH recent AS (
+                SELECT test, run_id, outcome,
+                       ROW_NUMBER() OVER (PARTITION BY test ORDER BY run_id DESC) AS age
+                FROM results WHERE outcome != 'skipped'
+            ), ordered AS (
+                SELECT test, outcome,
+                       LAG(outcome) OVER (PARTITION BY test ORDER BY run_id) AS previous
+                FROM recent WHERE age <= ?
+            )
+            SELECT test, COUNT(*) AS results,
+                   SUM(CASE WHEN previous IS NOT NULL AND previous != outcome THEN 1 ELSE 0 END) AS flips,
+                   SUM(CASE WHEN outcome = 'passed' THEN 1 ELSE 0 END) AS passes
+            FROM ordered GROUP BY test HAVING COUNT(*) >= ?
+            """,
+            (last_results, min_results),
+        ).fetchall()
+        mixed = dict(self.conn.execute(
+            """
+            SELECT test, COUNT(*) FROM (
+                SELECT res.test AS test, r.git_commit
+                FROM results res JOIN runs r ON r.id = res.run_id
+                WHERE res.outcome != 'skipped'
+                GROUP BY res.test, r.git_commit
+                HAVING SUM(res.outcome = 'passed') > 0 AND SUM(res.outcome != 'passed') > 0
+            ) GROUP BY test
+            """
+        ).fetchall())
+
+        report = []
+        for row in rows:
+            report.append({
+                'test': row['test'],
+                'results': row['results'],
+                'pass_rate': round(row['passes'] / row['results'], 3),
+                'flips': row['flips'],
+                'score': round(row['flips'] / (row['results'] - 1), 3) if row['results'] > 1 else 0.0,
+                'mixed_commits': mixed.get(row['test'], 0),
+            })
+        return sorted(report, key=lambda r: (-r['score'], -r['mixed_commits'], r['test']))
+
+    def slowest_tests(self, limit=10, last_results=20):
+        """Tests by mean duration over their most recent results"""
+        rows = self.conn.execute(
+            """
+            SELECT test, COUNT(*) AS results, AVG(duration_s) AS mean_s, MAX(duration_s) AS max_s
+            FROM (
+                SELECT test, duration_s,
+                       ROW_NUMBER() OVER (PARTITION BY test ORDER BY run_id DESC) AS age
+                FROM results WHERE duration_s IS NOT NULL
+            ) WHERE age <= ?
+            GROUP BY test ORDER BY mean_s DESC LIMIT ?
+            """,
+            (last_results, limit),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def expected_durations(self, last_results=10):
+        """test -> median of recent durations (for scheduling)"""
+        rows = self.conn.execute(
+            """
+            SELECT test, duration_s FROM (
+                SELECT test, duration_s,
+                       ROW_NUMBER() OVER (PARTITION BY test ORDER BY run_id DESC) AS age
+                FROM results WHERE duration_s IS NOT NULL
+            ) WHERE age <= ?
+            """,
+            (last_results,),
+        ).fetchall()
+        samples = {}
+        for row in rows:
+            samples.setdefault(row['test'], []).append(row['duration_s'])
+        return {test: sorted(values)[len(values) // 2] for test, values in samples.items()}
+
+
+def print_table(rows):
+    if not rows:
+        print("(no data)")
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(_fmt(r[c])) for r in rows)) for c in columns}
+    print('  '.join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print('  '.join(_fmt(row[c]).ljust(widths[c]) for c in columns))
+
+
+def _fmt(value):
+    return f'{value:.3f}' if isinstance(value, float) else str(value)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'slowest'
+    with ResultsStore() as store:
+        if command == 'trend':
+            metric = sys.argv[2] if len(sys.argv) > 2 else 'p95'
+            test = sys.argv[3] if len(sys.argv) > 3 else None
+            print(f"📈 {metric} trend{f' for {test}' if test else ''}")
+            print_table(store.metric_trend(metric, test))
+        elif command == 'flaky':
+            print("🎲 Flaky tests")
+            print_table(store.flakiness())
+        elif command == 'slowest':
+            print("🐢 Slowest tests")
+            print_table(store.slowest_tests())
+        else:
+            print(f"❌ Unknown command '{command}' (trend, flaky, slowest)")
+            sys.exit(1)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Parallel Test Runner
+Runs the harness scripts as parallel subprocesses. Scripts are scheduled
+longest-first using median durations from the results store, so the slow
+browser suites start immediately and short checks fill the gaps. Every
+script's outcome and duration is recorded back into the store.
+
+Usage:
+  python run_suite.py                        # everything, 2 workers
+  python run_suite.py --workers 3
+  python run_suite.py --only asset_check,test_game
+"""
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from results_store import ResultsStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(HERE, 'suite_logs')
+DEFAULT_WORKERS = 2             # Each browser suite wants a few cores of its own
+DEFAULT_TIMEOUT = 600
+UNKNOWN_DURATION_S = 1e6        # Never-seen scripts are scheduled first
+LEGACY_PORT = 8000              # Scripts that still hard-code http://localhost:8000
+
+SUITE = {
+    'asset_check': ['asset_check.py'],
+    'test_game': ['test_game.py', '--full'],
+    'frame_benchmark': ['frame_benchmark.py', '--headless'],
+    'velocity_test': ['velocity_test.py'],
+    'tps_integration_test': ['tps_integration_test.py'],
+    'test_character_rotation': ['test_character_rotation.py'],
+    'leak_check': ['leak_check.py', '--headless'],
+    'alloc_benchmark': ['alloc_benchmark.py', '--headless'],
+}
+
+
+def schedule(names, expected):
+    """Longest expected duration first (LPT), unknown durations at the front"""
+    return sorted(names, key=lambda n: -expected.get(f'run_suite.{n}', UNKNOWN_DURATION_S))
+
+
+def run_script(name, argv, timeout, stamp):
+    """Run one harness script, logging its output to suite_logs/; returns a result dict"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_path = os.path.join(LOG_DIR, f'{name}_{stamp}.log')
+    started = time.perf_counter()
+    with open(log_path, 'w') as log:
+        try:
+            completed = subprocess.run(
+                [sys.executable, *argv], cwd=HERE, stdout=log, stderr=subprocess.STDOUT, timeout=timeout
+            )
+            outcome = 'passed' if completed.returncode == 0 else 'failed'
+            returncode = completed.returncode
+        except subprocess.TimeoutExpired:
+            outcome, returncode = 'error', None
+            log.write(f"\n⏰ Timed out after {timeout}s\n")
+    return {
+        'name': name,
+        'outcome': outcome,
+        'returncode': returncode,
+        'duration_s': round(time.perf_counter() - started, 3),
+        'log': log_path,
+    }
+
+
+def legacy_server():
+    """Serve the repo on :8000 for scripts with a hard-coded URL, unless something already is"""
+    import socket
+    from dev_server import DevServer
+
+    with socket.socket() as probe:
+        if probe.connect_ex(('127.0.0.1', LEGACY_PORT)) == 0:
+            return None
+    return DevServer(host='localhost', port=LEGACY_PORT).start()
+
+
+def run_suite(names, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT):
+    print("🧪 RoboQuest Test Suite")
+    print("=" * 40)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    with ResultsStore() as store:
+        expected = store.expected_durations()
+        order = schedule(names, expected)
+        print("📅 Schedule (longest first): " + ', '.join(
+            f"{n} (~{expected[f'run_suite.{n}']:.0f}s)" if f'run_suite.{n}' in expected else f"{n} (new)"
+            for n in order
+        ))
+
+        server = legacy_server()
+        results = []
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_script, n, SUITE[n], timeout, stamp) for n in order]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    icon = '✅' if result['outcome'] == 'passed' else '❌'
+                    print(f"{icon} {result['name']}: {result['outcome']} in {result['duration_s']:.1f}s")
+        finally:
+            if server:
+                server.stop()
+        wall = time.perf_counter() - started
+
+        run_id = store.start_run('run_suite')
+        for result in results:
+            store.record_result(
+                run_id, f"run_suite.{result['name']}", result['outcome'], result['duration_s'],
+                details={'returncode': result['returncode'], 'log': result['log']}
+            )
+        store.finish_run(run_id)
+
+    serial = sum(r['duration_s'] for r in results)
+    failed = [r for r in results if r['outcome'] != 'passed']
+    print(f"\n⏱️ Wall time {wall:.1f}s (serial {serial:.1f}s, {workers} workers)")
+    for result in failed:
+        print(f"❌ {result['name']}: see {result['log']}")
+    return not failed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    worker_count = int(args[args.index('--workers') + 1]) if '--workers' in args else DEFAULT_WORKERS
+    selected = args[args.index('--only') + 1].split(',') if '--only' in args else list(SUITE)
+    unknown = [n for n in selected if n not in SUITE]
+    if unknown:
+        print(f"❌ Unknown suite entries: {', '.join(unknown)} (choose from {', '.join(SUITE)})")
+        sys.exit(2)
+    sys.exit(0 if run_suite(selected, worker_count) else 1)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Frame-Pacing / Stutter Analysis
+Records a Page.startScreencast stream into a bounded ring buffer, detects
+duplicated frames, dropped frames and inter-frame interval outliers, and
+correlates each stutter with in-page performance marks/measures and
+long frames from window.gameTelemetry.
+
+Usage:
+  python screencast_stutter.py                   # every frame_benchmark scenario
+  python screencast_stutter.py forest_orbit      # selected scenarios
+"""
+
+import hashlib
+import json
+import sys
+import time
+from collections import deque
+from datetime import datetime
+
+from devtools_events import DevToolsEventPump
+
+DEFAULT_CAPACITY = 1800          # ~30 s of 60 Hz frames
+EXPECTED_INTERVAL_MS = 1000 / 60
+OUTLIER_FACTOR = 1.5             # Interval > 1.5x the typical interval is a stutter
+CORRELATION_SLACK_MS = 8.0       # Marks this close to a stutter window are attributed to it
+
+
+class ScreencastRecorder:
+    """Bounded in-memory record of screencast frames (timestamp, content hash, size)"""
+
+    def __init__(self, driver, capacity=DEFAULT_CAPACITY, max_width=320, quality=40, keep_images=0):
+        self.driver = driver
+        self.frames = deque(maxlen=capacity)
+        self.images = deque(maxlen=keep_images) if keep_images else None
+        self.max_width = max_width
+        self.quality = quality
+        self.received = 0
+        self._pump = None
+
+    async def _on_frame(self, event, session, devtools):
+        # Ack first so the compositor keeps streaming
+        await session.execute(devtools.page.screencast_frame_ack(session_id=event.session_id))
+        digest = hashlib.blake2b(event.data.encode('ascii'), digest_size=8).hexdigest()
+        timestamp_ms = float(event.metadata.timestamp) * 1000.0 if event.metadata.timestamp else time.time() * 1000.0
+        self.frames.append((timestamp_ms, digest, len(event.data)))
+        if self.images is not None:
+            self.images.append((timestamp_ms, event.data))
+        self.received += 1
+
+    def start(self):
+        async def begin(session, devtools):
+            await session.execute(devtools.page.enable())
+            await session.execute(devtools.page.start_screencast(
+                format_='jpeg', quality=self.quality, max_width=self.max_width, every_nth_frame=1
+            ))
+
+        async def end(session, devtools):
+            await session.execute(devtools.page.stop_screencast())
+
+        self.frames.clear()
+        self.received = 0
+        self._pump = DevToolsEventPump(self.driver)
+        self._pump.on_start(begin).on_stop(end)
+        self._pump.subscribe(lambda devtools: devtools.page.ScreencastFrame, self._on_frame)
+        self._pump.start()
+        return self
+
+    def stop(self):
+        if self._pump:
+            self._pump.stop()
+            self._pump = None
+        return list(self.frames)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def _median(values):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def analyze_frames(frames, expected_interval_ms=EXPECTED_INTERVAL_MS, outlier_factor=OUTLIER_FACTOR):
+    """Find duplicates, dropped frames and interval outliers in (timestamp_ms, hash, size) frames"""
+    intervals = [b[0] - a[0] for a, b in zip(frames, frames[1:])]
+    typical = _median(intervals) if intervals else expected_interval_ms
+    # The screencast can run slower than the display; never judge against less than vsync
+    baseline = max(typical, expected_interval_ms)
+
+    duplicates = 0
+    dropped = 0
+    stutters = []
+    for i, interval in enumerate(intervals):
+        previous, current = frames[i], frames[i + 1]
+        if current[1] == previous[1]:
+            duplicates += 1
+        if interval > baseline * outlier_factor:
+            missed = max(1, round(interval / baseline) - 1)
+            dropped += missed
+            stutters.append({
+                'start_ms': previous[0],
+                'end_ms': current[0],
+                'interval_ms': round(interval, 2),
+                'missed_frames': missed,
+                'duplicate': current[1] == previous[1],
+            })
+
+    return {
+        'frames': len(frames),
+        'span_ms': round(frames[-1][0] - frames[0][0], 1) if len(frames) > 1 else 0.0,
+        'typical_interval_ms': round(typical, 2),
+        'max_interval_ms': round(max(intervals), 2) if intervals else 0.0,
+        'duplicate_frames': duplicates,
+        'dropped_frames': dropped,
+        'stutters': stutters,
+    }
+
+
+def read_page_timeline(driver):
+    """Performance marks/measures and long telemetry frames, in epoch milliseconds"""
+    return driver.execute_script("""
+        const origin = performance.timeOrigin;
+        const entries = performance.getEntries()
+            .filter(e => e.entryType === 'mark' || e.entryType === 'measure')
+            .map(e => ({ name: e.name, type: e.entryType, start: origin + e.startTime, duration: e.duration }));
+        const longFrames = [];
+        const telemetry = window.gameTelemetry;
+        if (telemetry) {
+            const snapshot = telemetry.drain();
+            const stamps = snapshot.columns.timestamp, frameMs = snapshot.columns.frameMs;
+            for (let i = 0; i < snapshot.frames; i++) {
+                if (frameMs[i] > 1000 / 60) {
+                    longFrames.push({ name: 'long-frame', type: 'telemetry',
+                                      start: origin + stamps[i] - frameMs[i], duration: frameMs[i] });
+                }
+            }
+        }
+        return { entries: entries, longFrames: longFrames };
+    """)
+
+
+def correlate_stutters(stutters, timeline, slack_ms=CORRELATION_SLACK_MS):
+    """Attach overlapping marks/measures/long frames to each stutter"""
+    events = timeline.get('entries', []) + timeline.get('longFrames', [])
+    for stutter in stutters:
+        window_start = stutter['start_ms'] - slack_ms
+        window_end = stutter['end_ms'] + slack_ms
+        causes = []
+        for event in events:
+            event_end = event['start'] + max(event.get('duration') or 0, 0)
+            if event['start'] <= window_end and event_end >= window_start:
+                causes.append({
+                    'name': event['name'],
+                    'type': event['type'],
+                    'offset_ms': round(event['start'] - stutter['start_ms'], 2),
+                    'duration_ms': round(event.get('duration') or 0, 2),
+                })
+        stutter['correlated'] = causes
+        stutter['attributed'] = any(c['type'] != 'telemetry' for c in causes)
+    return stutters
+
+
+def stutter_report(scenario, frames, timeline, recorder=None):
+    """Full per-scenario stutter report"""
+    analysis = analyze_frames(frames)
+    correlate_stutters(analysis['stutters'], timeline)
+    unattributed = [s for s in analysis['stutters'] if not s['attributed']]
+    return {
+        'scenario': scenario,
+        'timestamp': datetime.now().isoformat(),
+        'frames_received': recorder.received if recorder else len(frames),
+        'frames_retained': len(frames),
+        'summary': {
+            key: analysis[key] for key in (
+                'frames', 'span_ms', 'typical_interval_ms', 'max_interval_ms',
+                'duplicate_frames', 'dropped_frames')
+        },
+        'stutter_count': len(analysis['stutters']),
+        'unattributed_stutters': len(unattributed),
+        'stutters': analysis['stutters'],
+    }
+
+
+def print_stutter_report(report):
+    summary = report['summary']
+    print(f"🎞️ {report['scenario']}: {summary['frames']} frames over {summary['span_ms'] / 1000:.1f}s, "
+          f"typical {summary['typical_interval_ms']:.1f} ms, max {summary['max_interval_ms']:.1f} ms")
+    print(f"   🔁 duplicates={summary['duplicate_frames']}  ⏭️ dropped={summary['dropped_frames']}  "
+          f"⚠️ stutters={report['stutter_count']} ({report['unattributed_stutters']} unattributed)")
+    for stutter in sorted(report['stutters'], key=lambda s: -s['interval_ms'])[:5]:
+        causes = ', '.join(sorted({c['name'] for c in stutter['correlated']})) or 'no marks (GC?)'
+        print(f"   • {stutter['interval_ms']:.1f} ms gap → {causes}")
+
+
+if __name__ == "__main__":
+    from dev_server import DevServer
+    from frame_benchmark import SCENARIOS, SCENARIO_RUNNER_JS, create_driver, wait_for_game
+
+    selected = [a for a in sys.argv[1:] if a in SCENARIOS] or list(SCENARIOS)
+    server = DevServer().start()
+    driver = create_driver()
+    try:
+        for name in selected:
+            driver.get(server.game_url)
+            if not wait_for_game(driver):
+                print(f"❌ {name}: game did not load")
+                continue
+            driver.execute_script("performance.clearMarks(); performance.clearMeasures(); window.gameTelemetry.drain();")
+            driver.execute_script(SCENARIO_RUNNER_JS % SCENARIOS[name]['js'])
+
+            recorder = ScreencastRecorder(driver)
+            with recorder:
+                time.sleep(SCENARIOS[name]['duration'])
+            timeline = read_page_timeline(driver)
+            driver.execute_script("window.__rqBench && window.__rqBench.stop();")
+
+            report = stutter_report(name, list(recorder.frames), timeline, recorder)
+            print_stutter_report(report)
+            path = f"stutter_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"   📋 Report saved: {path}")
+    finally:
+        driver.quit()
+        server.stop()
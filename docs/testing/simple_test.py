@@ -10,61 +10,44 @@ import time
 import requests
 import webbrowser
 from datetime import datetime
+from dev_server import DevServer
+from asset_check import check_assets, print_asset_report
 
-def test_local_server():
+def test_local_server(base_url):
     """Test if local server is running"""
     try:
-        response = requests.get('http://localhost:8000', timeout=5)
+        response = requests.get(base_url, timeout=5)
         return response.status_code == 200
     except:
         return False
 
-def test_game_files():
-    """Test if game files are accessible"""
-    game_files = [
-        'http://localhost:8000/game/index.html',
-        'http://localhost:8000/game/js/GameEngine.js',
-        'http://localhost:8000/game/js/Player.js',
-        'http://localhost:8000/game/js/World.js',
-        'http://localhost:8000/game/js/GameLogic.js',
-        'http://localhost:8000/game/js/main.js'
-    ]
-    
-    results = {}
-    
-    for url in game_files:
-        try:
-            response = requests.get(url, timeout=5)
-            results[url] = response.status_code == 200
-            print(f"{'✅' if results[url] else '❌'} {url.split('/')[-1]}")
-        except Exception as e:
-            results[url] = False
-            print(f"❌ {url.split('/')[-1]} - Error: {e}")
-    
-    return all(results.values())
+def test_game_files(base_url):
+    """Test that every script and texture the game loads is reachable and within budget"""
+    report = check_assets(base_url)
+    print_asset_report(report)
+    return report['passed']
 
-def quick_visual_test():
+def quick_visual_test(base_url):
     """Open game in browser for visual testing"""
     print("🎮 Opening RoboQuest game for visual testing...")
     print("=" * 50)
     
     # Test server first
-    if not test_local_server():
-        print("❌ Local server not running!")
-        print("💡 Run: python3 -m http.server 8000")
+    if not test_local_server(base_url):
+        print(f"❌ Server not reachable at {base_url}!")
         return False
     
-    print("✅ Local server running")
+    print(f"✅ Server running at {base_url}")
     
     # Test game files
-    if not test_game_files():
+    if not test_game_files(base_url):
         print("❌ Some game files not accessible!")
         return False
     
     print("✅ All game files accessible")
     
     # Open browser
-    game_url = 'http://localhost:8000/game/index.html'
+    game_url = f'{base_url}/game/index.html'
     print(f"🌐 Opening browser: {game_url}")
     
     try:
@@ -103,7 +86,7 @@ def quick_visual_test():
         print(f"❌ Failed to open browser: {e}")
         return False
 
-def create_test_report():
+def create_test_report(game_url):
     """Create a simple test report template"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report = f"""
@@ -111,7 +94,7 @@ def create_test_report():
 Generated: {datetime.now().isoformat()}
 
 ## Test Environment
-- URL: http://localhost:8000/game/index.html
+- URL: {game_url}
 - Browser: Chrome/Safari/Firefox
 - Platform: Web (Desktop)
 
@@ -175,12 +158,15 @@ if __name__ == "__main__":
     print("🤖 RoboQuest Game Testing Tool")
     print("=" * 35)
     
+    # Serve the repo in-process (gzip, ETags, ranges) - no separate http.server needed
+    server = DevServer(log_requests=True).start()
+    
     # Run quick visual test
-    success = quick_visual_test()
+    success = quick_visual_test(server.base_url)
     
     if success:
         # Create test report template
-        create_test_report()
+        create_test_report(server.game_url)
         
         print("\n🎯 TESTING COMPLETE!")
         print("📋 Fill out the generated test report")
@@ -189,4 +175,12 @@ if __name__ == "__main__":
         print("\n❌ TESTING FAILED!")
         print("🔧 Check server and file setup")
     
-    print("\n🚀 Next: Test the game and report results!")
\ No newline at end of file
+    print("\n🚀 Next: Test the game and report results!")
+    
+    if success:
+        try:
+            input("\n⏸️ Press Enter to stop the server when you're done testing...")
+        except (KeyboardInterrupt, EOFError):
+            pass
+    print(f"📊 Server: {server.stats()}")
+    server.stop()
\ No newline at end of file
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Spatial Hash Benchmark
+Times collectible pickup queries against the in-page SpatialHash from 10 to
+100,000 collectibles at constant density (levels grow longer, not denser),
+next to the old linear distance scan. Query cost should stay flat as the
+level grows.
+
+Then the game's own per-frame collectible path at the same sizes: the
+collectibles are registered with the live World (streamed like level
+content), and each frame runs World.update (bobbing, index updates),
+World.checkCollectibleCollisions along a walk that picks items up (removal
+through removeObject) and ShadowSystem.updateBlobs. That work scales with
+the collectibles streamed in around the player, not with the level: frame
+cost must stay flat across the sizes whose level extends past the streamed
+window. The run fails when either cost doesn't stay flat.
+
+Usage:
+  python spatial_benchmark.py
+  python spatial_benchmark.py --headless --queries 20000 --frames 600
+"""
+
+import json
+import sys
+from datetime import datetime
+
+from dev_server import DevServer
+from frame_benchmark import create_driver, wait_for_game
+
+SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_QUERIES = 10000
+DEFAULT_FRAMES = 600
+LINEAR_SCAN_MAX = 10000     # Beyond this the linear scan alone takes seconds
+FLAT_RATIO_LIMIT = 5.0      # Largest/smallest per-query cost for "flat" (cache misses grow a little with size; a linear scan grows 10000x)
+
+BENCHMARK_JS = """
+const [sizes, queries, linearMax] = arguments;
+const DENSITY = 0.02;       // Collectibles per square world unit
+const PICKUP_RADIUS = 2;
+let seed = 12345;
+const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647;
+
+function run(n, queries) {
+    const side = Math.sqrt(n / DENSITY);
+    const hash = new SpatialHash(4);
+    const handles = [];
+    const points = [];
+    for (let i = 0; i < n; i++) {
+        const p = { x: random() * side, y: 2 + random() * 18, z: random() * side };
+        points.push(p);
+        handles.push(hash.insert(p, p));
+    }
+    const path = [];
+    for (let q = 0; q < queries; q++) {
+        path.push({ x: random() * side, y: 2 + random() * 18, z: random() * side });
+    }
+
+    const out = [];
+    let hits = 0;
+    let start = performance.now();
+    for (let q = 0; q < queries; q++) {
+        hash.query(path[q], PICKUP_RADIUS, out);
+        hits += out.length;
+        out.length = 0;
+    }
+    const queryMs = performance.now() - start;
+
+    // Bobbing: small vertical moves, the per-frame update pattern of World.update
+    const moved = { x: 0, y: 0, z: 0 };
+    start = performance.now();
+    for (let q = 0; q < queries; q++) {
+        const i = q % n;
+        moved.x = points[i].x;
+        moved.y = points[i].y + Math.sin(q) * 0.3;
+        moved.z = points[i].z;
+        hash.update(handles[i], moved);
+    }
+    const updateMs = performance.now() - start;
+
+    let linearMs = null;
+    if (n <= linearMax) {
+        let linearHits = 0;
+        start = performance.now();
+        for (let q = 0; q < queries; q++) {
+            const c = path[q];
+            for (let i = 0; i < n; i++) {
+                const dx = points[i].x - c.x, dy = points[i].y - c.y, dz = points[i].z - c.z;
+                if (dx * dx + dy * dy + dz * dz < PICKUP_RADIUS * PICKUP_RADIUS) linearHits++;
+            }
+        }
+        linearMs = performance.now() - start;
+    }
+
+    return {
+        collectibles: n,
+        cells: hash.cells.size,
+        hits: hits,
+        query_us: queryMs * 1000 / queries,
+        update_us: updateMs * 1000 / queries,
+        linear_us: linearMs === null ? null : linearMs * 1000 / queries
+    };
+}
+
+run(1000, queries); // Warm up the JIT so the smallest size isn't timed cold
+return sizes.map(n => run(n, queries));
+"""
+
+FRAME_JS = """
+const [sizes, frames] = arguments;
+const DENSITY = 0.02;
+const engine = window.gameEngine;
+const world = window.gameLogic.worldManager;
+const streamer = world.streamer;
+const focus = { x: 0, z: 0 };
+const streamedSide = (2 * streamer.config.loadRadius + 1) * streamer.chunkSize; // Side of the streamed area
+let seed = 54321;
+const random = () => (seed = (seed * 16807) % 2147483647) / 2147483647;
+
+function run(n) {
+    streamer.removeGroup('collectible');
+    const side = Math.sqrt(n / DENSITY);
+    for (let i = 0; i < n; i++) {
+        world.addCoin((random() - 0.5) * side, 2 + random() * 18, (random() - 0.5) * side);
+    }
+    let guard = 0;
+    while (streamer.queue.length > 0 && guard++ < 100000) streamer.update(focus);
+    const loaded = world.collectibles.length;
+
+    const dt = 1 / 60;
+    const player = { x: 0, y: 0, z: 0 };
+    let picked = 0;
+    const start = performance.now();
+    for (let f = 0; f < frames; f++) {
+        const angle = f * 0.05;
+        player.x = Math.cos(angle) * 20;
+        player.y = 2 + (f % 90) * 0.2;
+        player.z = Math.sin(angle) * 20;
+        world.update(dt, focus);
+        picked += world.checkCollectibleCollisions(player).length;
+        engine.shadows.updateBlobs();
+    }
+    const frameMs = performance.now() - start;
+    return {
+        collectibles: n,
+        loaded: loaded,
+        picked: picked,
+        past_window: side > streamedSide,
+        frame_us: frameMs * 1000 / frames
+    };
+}
+
+const wasPaused = engine.isPaused;
+engine.isPaused = true; // Only these calls touch the world
+try {
+    run(1000); // Warm-up
+    return sizes.map(run);
+} finally {
+    streamer.removeGroup('collectible');
+    world.reset(); // The base level's collectibles come back
+    engine.isPaused = wasPaused;
+}
+"""
+
+
+def run_spatial_benchmark(game_url, queries=DEFAULT_QUERIES, frames=DEFAULT_FRAMES, headless=False):
+    driver = create_driver(headless)
+    try:
+        driver.get(game_url)
+        if not wait_for_game(driver):
+            raise RuntimeError('game did not finish loading')
+        driver.set_script_timeout(300)
+        index = driver.execute_script(BENCHMARK_JS, SIZES, queries, LINEAR_SCAN_MAX)
+        frame = driver.execute_script(FRAME_JS, SIZES, frames)
+        return index, frame
+    finally:
+        driver.quit()
+
+
+def flat_ratio(results, key='query_us'):
+    costs = [r[key] for r in results if r[key] > 0]
+    return max(costs) / min(costs) if costs else 0.0
+
+
+def print_spatial_report(results):
+    print(f"{'collectibles':>12} {'cells':>8} {'query':>10} {'update':>10} {'linear scan':>12}")
+    for r in results:
+        linear = f"{r['linear_us']:.2f}us" if r['linear_us'] is not None else '-'
+        print(f"{r['collectibles']:>12} {r['cells']:>8} {r['query_us']:>8.3f}us {r['update_us']:>8.3f}us {linear:>12}")
+
+
+def print_frame_report(results):
+    print(f"\n{'collectibles':>12} {'streamed':>9} {'picked':>7} {'frame':>10}")
+    for r in results:
+        window = '' if r['past_window'] else '  (whole level streamed)'
+        print(f"{r['collectibles']:>12} {r['loaded']:>9} {r['picked']:>7} {r['frame_us']:>8.1f}us{window}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    query_count = int(args[args.index('--queries') + 1]) if '--queries' in args else DEFAULT_QUERIES
+    frame_count = int(args[args.index('--frames') + 1]) if '--frames' in args else DEFAULT_FRAMES
+
+    print("🗺️ RoboQuest Spatial Hash Benchmark")
+    print("=" * 40)
+    with DevServer() as server:
+        benchmark, frame_costs = run_spatial_benchmark(server.game_url, query_count, frame_count,
+                                                       headless='--headless' in args)
+    print_spatial_report(benchmark)
+    print_frame_report(frame_costs)
+
+    ratio = flat_ratio(benchmark)
+    windowed = [r for r in frame_costs if r['past_window']]
+    frame_ratio = flat_ratio(windowed, 'frame_us')
+    passed = ratio <= FLAT_RATIO_LIMIT and len(windowed) >= 2 and frame_ratio <= FLAT_RATIO_LIMIT
+    print(f"\n{'✅' if ratio <= FLAT_RATIO_LIMIT else '❌'} Query cost ratio across sizes {ratio:.2f}x "
+          f"(limit {FLAT_RATIO_LIMIT}x)")
+    print(f"{'✅' if passed else '❌'} Frame cost ratio across {len(windowed)} streamed-window sizes "
+          f"{frame_ratio:.2f}x (limit {FLAT_RATIO_LIMIT}x)")
+
+    path = f"spatial_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, 'w') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'queries': query_count,
+                   'results': benchmark, 'flat_ratio': ratio, 'frames': frame_count,
+                   'frame_results': frame_costs, 'frame_flat_ratio': frame_ratio, 'passed': passed}, f, indent=2)
+    print(f"📋 Report saved: {path}")
+    sys.exit(0 if passed else 1)
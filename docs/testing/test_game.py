@@ -15,18 +15,31 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
+from cdp_tracing import DevToolsTracer, print_report
+from log_stream import ConsoleStream, print_entry
+from dev_server import DevServer
+from results_store import ResultsStore, environment_info, flatten_metrics
+from input_replay import plan_to_recording, replay_in_page
 
 class RoboQuestGameTester:
-    def __init__(self):
+    def __init__(self, capture_logs=True, game_url=None):
         self.driver = None
-        self.game_url = 'http://localhost:8000/game/index.html'
+        self.server = None
+        self.game_url = game_url  # None: serve the repo in-process on a free port
         self.test_results = []
         self.console_logs = []
+        self.capture_logs = capture_logs
+        self.log_stream = None
         
     def setup_driver(self):
         """Initialize Chrome WebDriver with console logging"""
         print("🔧 Setting up test environment...")
         
+        if self.game_url is None:
+            self.server = DevServer().start()
+            self.game_url = self.server.game_url
+            print(f"🌐 Dev server: {self.server.base_url}")
+        
         chrome_options = Options()
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -37,27 +50,34 @@ class RoboQuestGameTester:
         chrome_options.add_argument('--enable-logging')
         chrome_options.add_argument('--log-level=0')
         
+        # DevTools trace events for performance reports
+        DevToolsTracer.configure_options(chrome_options)
+        
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.set_window_size(1280, 720)
             print("✅ Chrome WebDriver initialized")
+            if self.capture_logs:
+                # Console/error events are pushed as they happen; capture_console_logs drains them
+                self.log_stream = ConsoleStream(self.driver, min_level='INFO').start()
             return True
         except WebDriverException as e:
             print(f"❌ Failed to initialize WebDriver: {e}")
             return False
     
     def capture_console_logs(self):
-        """Capture browser console logs"""
+        """Collect browser console entries pushed since the last call"""
+        if not self.log_stream:
+            return
         try:
-            logs = self.driver.get_log('browser')
-            for log in logs:
-                if log['level'] in ['INFO', 'WARNING', 'SEVERE']:
-                    self.console_logs.append({
-                        'level': log['level'],
-                        'message': log['message'],
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    print(f"🎮 Console: {log['message']}")
+            for entry in self.log_stream.drain():
+                self.console_logs.append({
+                    'level': entry['level'],
+                    'source': entry['source'],
+                    'message': entry['message'],
+                    'timestamp': datetime.fromtimestamp(entry['timestamp']).isoformat()
+                })
+                print_entry(entry, '🎮 Console: ')
         except Exception as e:
             print(f"⚠️ Could not capture console logs: {e}")
     
@@ -215,8 +235,9 @@ class RoboQuestGameTester:
         print("\n🧪 Testing game performance...")
         
         try:
-            # Let game run for a few seconds to stabilize
-            time.sleep(3)
+            # Let game run for a few seconds to stabilize, tracing the whole window
+            with DevToolsTracer(self.driver, 'game_performance') as tracer:
+                time.sleep(3)
             
             performance_stats = self.driver.execute_script("""
                 return {
@@ -233,6 +254,8 @@ class RoboQuestGameTester:
                 'test': 'performance',
                 'passed': fps_good,
                 'performance_stats': performance_stats,
+                'trace_summary': tracer.report,
+                'trace_report': tracer.report_path,
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -240,6 +263,7 @@ class RoboQuestGameTester:
             print(f"{'✅' if fps_good else '❌'} Performance: {'GOOD' if fps_good else 'POOR'}")
             print(f"📊 FPS: {performance_stats['fps']}")
             print(f"📦 Objects: {performance_stats['objects']} (visual), {performance_stats['physicsObjects']} (physics)")
+            print_report(tracer.report)
             
             return fps_good
             
@@ -252,9 +276,7 @@ class RoboQuestGameTester:
         print("\n🎮 Running automated gameplay test...")
         
         try:
-            body = self.driver.find_element(By.TAG_NAME, 'body')
-            
-            # Automated movement sequence
+            # Automated movement sequence (key, hold seconds)
             movements = [
                 ('d', 1.0),  # Move right
                 (Keys.SPACE, 0.2),  # Jump
@@ -264,10 +286,11 @@ class RoboQuestGameTester:
                 ('s', 0.5),  # Move back
             ]
             
-            for key, duration in movements:
-                body.send_keys(key)
-                time.sleep(duration)
-                self.capture_console_logs()
+            # Replayed frame-exact in the page instead of live key presses and sleeps
+            replay = replay_in_page(self.driver, plan_to_recording(movements))
+            print(f"⏩ Replayed {replay['simulatedMs'] / 1000:.1f}s of input in "
+                  f"{replay['wallMs'] / 1000:.2f}s ({replay['speedup']:.1f}x)")
+            self.capture_console_logs()
             
             # Get final game state
             final_state = self.driver.execute_script("""
@@ -300,10 +323,10 @@ class RoboQuestGameTester:
         try:
             # Run all tests
             tests = [
-                self.test_game_loading(),
-                self.test_player_movement(),
-                self.test_jumping(),
-                self.test_game_performance()
+                self.run_timed(self.test_game_loading),
+                self.run_timed(self.test_player_movement),
+                self.run_timed(self.test_jumping),
+                self.run_timed(self.test_game_performance)
             ]
             
             # Run automated gameplay
@@ -330,6 +353,47 @@ class RoboQuestGameTester:
         finally:
             self.cleanup_driver()
     
+    def run_timed(self, test):
+        """Run one test method and attach its duration to the result it recorded"""
+        recorded = len(self.test_results)
+        start = time.perf_counter()
+        passed = test()
+        duration = round(time.perf_counter() - start, 3)
+        if len(self.test_results) > recorded:
+            self.test_results[-1]['duration_s'] = duration
+        else:
+            # Tests that hit an exception return False without recording a result
+            self.test_results.append({
+                'test': test.__name__.replace('test_', '', 1),
+                'passed': False,
+                'error': 'test raised before recording a result',
+                'duration_s': duration,
+                'timestamp': datetime.now().isoformat()
+            })
+        return passed
+    
+    def record_history(self):
+        """Append this run's results and metrics to the SQLite results store"""
+        try:
+            with ResultsStore() as store:
+                run_id = store.start_run('test_game', environment_info(self.driver))
+                for result in self.test_results:
+                    metrics = {}
+                    metrics.update(flatten_metrics(result.get('performance_stats')))
+                    metrics.update(flatten_metrics(result.get('trace_summary'), 'trace.'))
+                    store.record_result(
+                        run_id,
+                        f"test_game.{result['test']}",
+                        'passed' if result.get('passed') else ('error' if 'error' in result else 'failed'),
+                        result.get('duration_s'),
+                        details={k: v for k, v in result.items() if k not in ('trace_summary',)},
+                        metrics=metrics
+                    )
+                store.finish_run(run_id)
+            print(f"🗄️ Results recorded in {store.path}")
+        except Exception as e:
+            print(f"⚠️ Could not record results history: {e}")
+    
     def save_test_report(self):
         """Save detailed test report"""
         report = {
@@ -339,6 +403,7 @@ class RoboQuestGameTester:
             'url': self.game_url,
             'test_results': self.test_results,
             'console_logs': self.console_logs,
+            'server': self.server.stats() if self.server else None,
             'summary': {
                 'total_tests': len([r for r in self.test_results if 'passed' in r]),
                 'passed_tests': len([r for r in self.test_results if r.get('passed', False)]),
@@ -351,12 +416,19 @@ class RoboQuestGameTester:
             json.dump(report, f, indent=2)
         
         print(f"📋 Test report saved: game-test-report.json")
+        self.record_history()
     
     def cleanup_driver(self):
         """Clean up WebDriver"""
+        if self.log_stream:
+            self.log_stream.stop()
+            self.log_stream = None
         if self.driver:
             self.driver.quit()
             print("🧹 Browser closed")
+        if self.server:
+            self.server.stop()
+            self.server = None
 
 def quick_game_test():
     """Quick test function for immediate feedback"""
@@ -16,6 +16,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from cdp_capture import ScreenshotCapture
 
 def get_debug(driver):
     return driver.execute_script("""
@@ -31,6 +32,7 @@ def run():
     opts.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
     driver = webdriver.Chrome(options=opts)
     driver.set_window_size(1280, 720)
+    capture = ScreenshotCapture(driver)
     try:
         import sys
         qp = ('?' + sys.argv[1]) if len(sys.argv) > 1 else ''
@@ -92,10 +94,10 @@ def run():
             actions.key_down('w').perform(); time.sleep(0.4); actions.key_up('w').perform()
             actions.key_down('s').perform(); time.sleep(0.2); actions.key_up('s').perform()
 
-            # Screenshot every ~5s
+            # Screenshot every ~5s (half-size, written off the timing loop)
             if int(time.time()-start) % 5 == 0:
                 fn = f"tps_debug_{int(time.time()-start)}.png"
-                driver.save_screenshot(fn)
+                capture.capture(scale=0.5, save_to=fn, decode=False)
                 screenshots.append(fn)
 
         logs = driver.get_log('browser')
@@ -103,6 +105,7 @@ def run():
         print(f"Camera-behind issues: {behind_errors}")
         print(f"Free-yaw turn detected: {free_yaw_success}")
         print(f"Screenshots: {screenshots}")
+        print(f"Capture latency: {capture.stats()}")
         err_logs = [L for L in logs if L['level'] in ('SEVERE','ERROR')]
         print(f"Console errors: {len(err_logs)}")
         for L in err_logs[-5:]:
@@ -110,6 +113,7 @@ def run():
         return yaw_errors, behind_errors, len(err_logs)
     finally:
         try:
+            capture.close()
             driver.quit()
         except:
             pass
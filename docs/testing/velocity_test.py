@@ -11,6 +11,7 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
+from image_compare import assert_visual_change, print_comparison
 import time
 
 def quick_velocity_test():
@@ -59,12 +60,16 @@ def quick_velocity_test():
         for log in sync_logs[-3:]:
             print(f"🔧 {log}")
         
-        print("\n🎯 VISUAL ANALYSIS NEEDED:")
-        print("📸 Compare: velocity_test_1_initial.png vs velocity_test_2_after_D.png")
-        print("👀 Look for character moving to different grid square")
-        print("❓ If no movement: Physics/mesh sync broken")
-        
-        return True
+        # Automatic visual analysis: the scene around the character must change
+        print("\n🎯 VISUAL ANALYSIS:")
+        try:
+            comparison = assert_visual_change('velocity_test_1_initial.png', 'velocity_test_2_after_D.png')
+            print_comparison(comparison)
+            print("✅ Character view changed - movement visible on screen")
+            return True
+        except AssertionError as e:
+            print(f"❌ No visible movement: Physics/mesh sync broken ({e})")
+            return False
         
     except Exception as e:
         print(f"❌ Quick test failed: {e}")
@@ -78,4 +83,5 @@ def quick_velocity_test():
             pass
 
 if __name__ == "__main__":
-    quick_velocity_test()
\ No newline at end of file
+    import sys
+    sys.exit(0 if quick_velocity_test() else 1)
\ No newline at end of file
@@ -0,0 +1,253 @@
+/*
+ROBOQUEST ASSET MANAGER
+One shared THREE.Texture per URL. Manifest textures are preloaded behind the
+loading screen with progress events; a texture that fails to load gets its
+procedural fallback painted into the same object, so every material already
+using it switches over without a second request. Textures are reference
+counted: release() the last user and the GPU copy is disposed.
+*/
+
+// Textures the game needs before the first frame: key -> url + sampling options + fallback painter
+const ASSET_MANIFEST = {
+    grass: {
+        url: 'https://threejs.org/examples/textures/terrain/grasslight-big.jpg',
+        repeat: [20, 20],
+        fallback: 'grass'
+    },
+    brick: {
+        url: 'https://threejs.org/examples/textures/brick_diffuse.jpg',
+        repeat: [2, 2],
+        fallback: 'brick'
+    },
+    bark: {
+        url: './textures/gemini_bark.png',
+        repeat: [1, 2],
+        fallback: 'bark'
+    },
+    leaves: {
+        url: './textures/leaves_variation_1_20250915_124330.png',
+        repeat: [4, 4],
+        fallback: 'foliage'
+    }
+};
+
+function proceduralCanvas(size, paint) {
+    const canvas = document.createElement('canvas');
+    canvas.width = size;
+    canvas.height = size;
+    paint(canvas.getContext('2d'), size);
+    return canvas;
+}
+
+// Procedural stand-ins for textures that fail to load (painted once, on failure)
+const PROCEDURAL_TEXTURES = {
+    grass: () => proceduralCanvas(256, (ctx, size) => {
+        const gradient = ctx.createLinearGradient(0, 0, 0, size);
+        gradient.addColorStop(0, '#90EE90');
+        gradient.addColorStop(0.5, '#228B22');
+        gradient.addColorStop(1, '#006400');
+        ctx.fillStyle = gradient;
+        ctx.fillRect(0, 0, size, size);
+
+        // Grass blades
+        ctx.strokeStyle = '#32CD32';
+        ctx.lineWidth = 1;
+        for (let i = 0; i < 100; i++) {
+            const x = Math.random() * size;
+            const y = Math.random() * size;
+            ctx.beginPath();
+            ctx.moveTo(x, y);
+            ctx.lineTo(x + Math.random() * 4 - 2, y - (Math.random() * 20 + 10));
+            ctx.stroke();
+        }
+    }),
+
+    // Light neutral bricks: platform materials tint them with their own color
+    brick: () => proceduralCanvas(128, (ctx, size) => {
+        ctx.fillStyle = '#e0e0e0';
+        ctx.fillRect(0, 0, size, size);
+        ctx.strokeStyle = 'rgba(0,0,0,0.2)';
+        ctx.lineWidth = 2;
+        for (let y = 0; y < size; y += 32) {
+            ctx.beginPath();
+            ctx.moveTo(0, y);
+            ctx.lineTo(size, y);
+            ctx.stroke();
+        }
+        for (let x = 0; x < size; x += 64) {
+            ctx.beginPath();
+            ctx.moveTo(x, 0);
+            ctx.lineTo(x, size);
+            ctx.stroke();
+        }
+    }),
+
+    bark: () => proceduralCanvas(256, (ctx, size) => {
+        ctx.fillStyle = '#8B4513';
+        ctx.fillRect(0, 0, size, size);
+
+        // Bark lines
+        ctx.strokeStyle = '#654321';
+        ctx.lineWidth = 3;
+        for (let i = 0; i < 20; i++) {
+            const y = Math.random() * size;
+            ctx.beginPath();
+            ctx.moveTo(0, y);
+            ctx.lineTo(size, y + Math.random() * 20 - 10);
+            ctx.stroke();
+        }
+
+        // Vertical grain
+        ctx.strokeStyle = '#A0522D';
+        ctx.lineWidth = 1;
+        for (let i = 0; i < 50; i++) {
+            const x = Math.random() * size;
+            ctx.beginPath();
+            ctx.moveTo(x, 0);
+            ctx.lineTo(x + Math.random() * 10 - 5, size);
+            ctx.stroke();
+        }
+    }),
+
+    foliage: () => proceduralCanvas(256, (ctx, size) => {
+        const gradient = ctx.createRadialGradient(size / 2, size / 2, 0, size / 2, size / 2, size / 2);
+        gradient.addColorStop(0, '#90EE90');
+        gradient.addColorStop(0.5, '#32CD32');
+        gradient.addColorStop(1, '#228B22');
+        ctx.fillStyle = gradient;
+        ctx.fillRect(0, 0, size, size);
+
+        // Leaves
+        ctx.fillStyle = '#228B22';
+        for (let i = 0; i < 100; i++) {
+            ctx.beginPath();
+            ctx.arc(Math.random() * size, Math.random() * size, Math.random() * 8 + 2, 0, Math.PI * 2);
+            ctx.fill();
+        }
+    })
+};
+
+class AssetManager {
+    constructor(manifest = ASSET_MANIFEST, loader = new THREE.TextureLoader()) {
+        this.manifest = manifest;
+        this.loader = loader;
+        this.entries = new Map(); // url -> { url, texture, state, refs, fallback, promise }
+        this.listeners = { progress: [], error: [], complete: [] };
+        this.ready = null;
+    }
+
+    on(event, callback) {
+        this.listeners[event].push(callback);
+        return this;
+    }
+
+    emit(event, data) {
+        this.listeners[event].forEach(callback => callback(data));
+    }
+
+    // Manifest key or plain URL -> { url, repeat, fallback }
+    resolve(keyOrUrl, options = {}) {
+        const declared = this.manifest[keyOrUrl];
+        return Object.assign({ url: keyOrUrl }, declared, options);
+    }
+
+    // Start (or join) the single load of a URL; never creates a second texture for it
+    load(keyOrUrl, options = {}) {
+        const spec = this.resolve(keyOrUrl, options);
+        let entry = this.entries.get(spec.url);
+        if (entry) return entry;
+
+        entry = { url: spec.url, texture: null, state: 'loading', refs: 0, fallback: spec.fallback, promise: null };
+        entry.promise = new Promise((resolve) => {
+            entry.texture = this.loader.load(
+                spec.url,
+                () => {
+                    entry.state = 'loaded';
+                    gameLog.debug('textures', `✅ Texture loaded: ${spec.url}`);
+                    resolve(entry);
+                },
+                undefined,
+                () => {
+                    entry.state = 'failed';
+                    this.applyFallback(entry);
+                    this.emit('error', { url: spec.url, fallback: entry.fallback || null });
+                    resolve(entry);
+                }
+            );
+        });
+        entry.texture.userData.assetUrl = spec.url;
+        entry.texture.wrapS = THREE.RepeatWrapping;
+        entry.texture.wrapT = THREE.RepeatWrapping;
+        if (spec.repeat) entry.texture.repeat.set(spec.repeat[0], spec.repeat[1]);
+
+        this.entries.set(spec.url, entry);
+        return entry;
+    }
+
+    applyFallback(entry) {
+        const paint = PROCEDURAL_TEXTURES[entry.fallback];
+        if (!paint) {
+            console.warn(`⚠️ Texture failed with no fallback: ${entry.url}`);
+            return;
+        }
+        entry.texture.image = paint();
+        entry.texture.needsUpdate = true;
+        console.warn(`⚠️ Texture failed, using procedural ${entry.fallback}: ${entry.url}`);
+    }
+
+    // Shared texture for a manifest key or URL; each call holds one reference
+    texture(keyOrUrl, options = {}) {
+        const entry = this.load(keyOrUrl, options);
+        entry.refs++;
+        return entry.texture;
+    }
+
+    // Drop one reference (key, URL or the texture itself); the last one disposes it
+    release(keyOrTexture) {
+        const url = keyOrTexture && keyOrTexture.isTexture
+            ? keyOrTexture.userData.assetUrl
+            : this.resolve(keyOrTexture).url;
+        const entry = this.entries.get(url);
+        if (!entry) return;
+        entry.refs = Math.max(0, entry.refs - 1);
+        if (entry.refs === 0) {
+            entry.texture.dispose();
+            this.entries.delete(url);
+        }
+    }
+
+    // Load every manifest texture; resolves when all have loaded or fallen back (or after timeoutMs)
+    preload(keys = Object.keys(this.manifest), timeoutMs = 8000) {
+        if (this.ready) return this.ready;
+        const total = keys.length;
+        let settled = 0;
+        const all = Promise.all(keys.map(key => this.load(key).promise.then((entry) => {
+            settled++;
+            this.emit('progress', { loaded: settled, total: total, url: entry.url, state: entry.state });
+            return entry;
+        })));
+        const timeout = new Promise(resolve => setTimeout(resolve, timeoutMs));
+        this.ready = Promise.race([all, timeout]).then(() => {
+            const stats = this.stats();
+            this.emit('complete', stats);
+            return stats;
+        });
+        return this.ready;
+    }
+
+    stats() {
+        const stats = { total: this.entries.size, loading: 0, loaded: 0, failed: 0, refs: 0 };
+        for (const entry of this.entries.values()) {
+            stats[entry.state]++;
+            stats.refs += entry.refs;
+        }
+        return stats;
+    }
+}
+
+AssetManager.MANIFEST = ASSET_MANIFEST;
+AssetManager.PROCEDURAL_TEXTURES = PROCEDURAL_TEXTURES;
+
+// Global asset manager (GameEngine starts the manifest preload behind the loading screen)
+window.AssetManager = AssetManager;
+window.assetManager = new AssetManager();
@@ -36,6 +36,18 @@ class CameraController {
         this.minVerticalAngle = options.minPitch ?? -0.6;
         this.maxVerticalAngle = options.maxPitch ?? 0.45;
         
+        // Scratch vectors and the debug record, reused every frame
+        this.desiredPosition = new THREE.Vector3();
+        this.lookTarget = new THREE.Vector3();
+        this.forward = new THREE.Vector3();
+        this.upAxis = new THREE.Vector3(0, 1, 0);
+        this.debugState = {
+            yaw: null, pitch: null, targetYaw: null, targetPitch: null, playerYaw: 0,
+            followBehind: false, pointerLocked: false,
+            pos: { x: 0, y: 0, z: 0 },
+            target: { x: 0, y: 0, z: 0 }
+        };
+        
         // Camera pivot point
         this.pivot = new THREE.Object3D();
         
@@ -139,10 +151,12 @@ class CameraController {
                 this.previousMouseX = event.clientX;
                 this.previousMouseY = event.clientY;
                 
-                console.log('🖱️ Camera rotation:', {
-                    horizontal: this.targetHorizontalAngle,
-                    vertical: this.targetVerticalAngle
-                });
+                if (gameLog.enabled('debug', 'camera') && gameLog.every('camera.rotation', 30)) {
+                    gameLog.debug('camera', '🖱️ Camera rotation', {
+                        horizontal: this.targetHorizontalAngle,
+                        vertical: this.targetVerticalAngle
+                    });
+                }
             }
         });
         
@@ -151,7 +165,7 @@ class CameraController {
             this.distance += event.deltaY * 0.01;
             this.distance = Math.max(5, Math.min(20, this.distance)); // Clamp zoom
             
-            console.log('🔍 Camera zoom:', this.distance);
+            gameLog.debug('camera', '🔍 Camera zoom', this.distance);
         });
         
         console.log('✅ Camera mouse controls initialized');
@@ -169,34 +183,15 @@ class CameraController {
 
             // Have the character face away from the camera (TPS style)
             if (this.lockCharacterYawToCamera && this.target && this.target.mesh) {
-                const forward = new THREE.Vector3();
+                const forward = this.forward;
                 this.camera.getWorldDirection(forward); // from camera into world (towards player)
                 forward.y = 0; forward.normalize();
-                const faceDir = forward.clone().multiplyScalar(-1); // away from camera
-                const desiredYaw = Math.atan2(faceDir.x, faceDir.z);
-                const lerpAngle = (a, b, t) => {
-                    let d = ((b - a + Math.PI) % (Math.PI * 2)) - Math.PI;
-                    return a + d * t;
-                };
-                this.target.mesh.rotation.y = lerpAngle(this.target.mesh.rotation.y, desiredYaw, 0.25);
+                const desiredYaw = Math.atan2(-forward.x, -forward.z); // away from camera
+                this.target.mesh.rotation.y = this.lerpAngle(this.target.mesh.rotation.y, desiredYaw, 0.25);
             }
 
             // Debug telemetry
-            try {
-                const camPos = this.camera.position;
-                const playerYaw = this.target && this.target.mesh ? this.target.mesh.rotation.y : 0;
-                window.__camDebug = {
-                    yaw: null,
-                    pitch: null,
-                    targetYaw: null,
-                    targetPitch: null,
-                    playerYaw: playerYaw,
-                    followBehind: true,
-                    pointerLocked: false,
-                    pos: { x: camPos.x, y: camPos.y, z: camPos.z },
-                    target: { x: targetPosition.x, y: targetPosition.y, z: targetPosition.z }
-                };
-            } catch (e) {}
+            this.writeDebug(targetPosition, null, null, null, null, true, false);
             return;
         }
 
@@ -204,13 +199,8 @@ class CameraController {
         const targetPosition = this.target.mesh ? this.target.mesh.position : this.target.position;
         
         // Smooth angles towards targets with shortest-path and speed caps to prevent oscillation
-        const shortestDelta = (a, b) => {
-            let d = b - a;
-            d = (d + Math.PI) % (Math.PI * 2) - Math.PI; // wrap to [-PI, PI]
-            return d;
-        };
         // Yaw update
-        const yawDelta = shortestDelta(this.horizontalAngle, this.targetHorizontalAngle);
+        const yawDelta = this.shortestDelta(this.horizontalAngle, this.targetHorizontalAngle);
         const clampedYawDelta = Math.max(-this.maxYawSpeed, Math.min(this.maxYawSpeed, yawDelta));
         this.horizontalAngle += clampedYawDelta;
         // Pitch update
@@ -234,13 +224,13 @@ class CameraController {
         const desiredY = targetPosition.y + this.height + Math.sin(this.verticalAngle) * this.distance;
         const desiredZ = targetPosition.z + Math.cos(yawForCamera) * this.distance * cosPitch;
         
-        const desiredPosition = new THREE.Vector3(desiredX, desiredY, desiredZ);
+        const desiredPosition = this.desiredPosition.set(desiredX, desiredY, desiredZ);
         
         // Smooth camera movement (lerp)
         this.camera.position.lerp(desiredPosition, this.smoothness);
         
         // Always look at the target
-        const lookTarget = new THREE.Vector3(
+        const lookTarget = this.lookTarget.set(
             targetPosition.x,
             targetPosition.y + this.height / 2,
             targetPosition.z
@@ -248,39 +238,55 @@ class CameraController {
         this.camera.lookAt(lookTarget);
 
         // Debug telemetry for automated tests
-        try {
-            const camPos = this.camera.position;
-            const playerYaw = this.target && this.target.mesh ? this.target.mesh.rotation.y : 0;
-            window.__camDebug = {
-                yaw: this.horizontalAngle,
-                pitch: this.verticalAngle,
-                targetYaw: this.targetHorizontalAngle,
-                targetPitch: this.targetVerticalAngle,
-                playerYaw: playerYaw,
-                followBehind: !!this.followBehindTarget,
-                pointerLocked: !!this.isPointerLocked,
-                pos: { x: camPos.x, y: camPos.y, z: camPos.z },
-                target: { x: targetPosition.x, y: targetPosition.y, z: targetPosition.z }
-            };
-        } catch (e) { /* ignore */ }
+        this.writeDebug(
+            targetPosition, this.horizontalAngle, this.verticalAngle,
+            this.targetHorizontalAngle, this.targetVerticalAngle,
+            !!this.followBehindTarget, !!this.isPointerLocked
+        );
+    }
+    
+    shortestDelta(a, b) {
+        return (b - a + Math.PI) % (Math.PI * 2) - Math.PI; // wrap to [-PI, PI]
+    }
+    
+    lerpAngle(a, b, t) {
+        return a + this.shortestDelta(a, b) * t;
+    }
+    
+    // window.__camDebug for automated tests: one record, rewritten in place
+    writeDebug(targetPosition, yaw, pitch, targetYaw, targetPitch, followBehind, pointerLocked) {
+        const debug = this.debugState;
+        const camPos = this.camera.position;
+        debug.yaw = yaw;
+        debug.pitch = pitch;
+        debug.targetYaw = targetYaw;
+        debug.targetPitch = targetPitch;
+        debug.playerYaw = this.target && this.target.mesh ? this.target.mesh.rotation.y : 0;
+        debug.followBehind = followBehind;
+        debug.pointerLocked = pointerLocked;
+        debug.pos.x = camPos.x;
+        debug.pos.y = camPos.y;
+        debug.pos.z = camPos.z;
+        debug.target.x = targetPosition.x;
+        debug.target.y = targetPosition.y;
+        debug.target.z = targetPosition.z;
+        window.__camDebug = debug;
     }
     
-    // Get camera forward direction for movement
-    getCameraForward() {
-        const direction = new THREE.Vector3();
-        this.camera.getWorldDirection(direction);
-        direction.y = 0; // Remove vertical component for ground movement
-        direction.normalize();
-        return direction;
+    // Get camera forward direction for movement (into target when given)
+    getCameraForward(target = new THREE.Vector3()) {
+        this.camera.getWorldDirection(target);
+        target.y = 0; // Remove vertical component for ground movement
+        target.normalize();
+        return target;
     }
     
-    // Get camera right direction for movement
-    getCameraRight() {
-        const forward = this.getCameraForward();
-        const right = new THREE.Vector3();
-        right.crossVectors(forward, new THREE.Vector3(0, 1, 0));
-        right.normalize();
-        return right;
+    // Get camera right direction for movement (into target when given)
+    getCameraRight(target = new THREE.Vector3()) {
+        const forward = this.getCameraForward(this.forward);
+        target.crossVectors(forward, this.upAxis);
+        target.normalize();
+        return target;
     }
     
     // Reset camera to default position
@@ -44,6 +44,15 @@ class EgloffCameraRig {
     this.yaw = 0; this.pitch = 0;
     this.yawTarget = 0; this.pitchTarget = 0.15;
 
+    // Scratch vectors and the debug record, reused every frame
+    this.lookTarget = new THREE.Vector3();
+    this.cameraWorldPosition = new THREE.Vector3();
+    this.debugState = {
+      yaw: 0, pitch: 0, playerYaw: 0,
+      pos: { x: 0, y: 0, z: 0 },
+      target: { x: 0, y: 0, z: 0 }
+    };
+
     // Input state
     this.pointerLocked = false;
     this._bindPointerLock();
@@ -124,7 +133,7 @@ class EgloffCameraRig {
 
     // Compute camera world position from rig
     // Camera already offset at (0,0,distance) under pitch pivot; just ensure lookAt
-    const lookTarget = new THREE.Vector3(p.x, p.y + this.height, p.z);
+    const lookTarget = this.lookTarget.set(p.x, p.y + this.height, p.z);
     this.camera.lookAt(lookTarget);
 
     // Rotate character to face aim
@@ -135,17 +144,19 @@ class EgloffCameraRig {
     const turnT = Math.abs(deltaYaw) > 0.5 ? 1.0 : this.charTurnLerp;
     this.target.mesh.rotation.y = this._lerpAngle(curYaw, aimYaw, turnT);
 
-    // Telemetry for tests
-    try {
-      const camPos = this.camera.getWorldPosition(new THREE.Vector3());
-      window.__camDebug = {
-        yaw: this.yaw,
-        pitch: this.pitch,
-        playerYaw: this.target.mesh.rotation.y,
-        pos: { x: camPos.x, y: camPos.y, z: camPos.z },
-        target: { x: p.x, y: p.y + this.height, z: p.z }
-      };
-    } catch (e) {}
+    // Telemetry for tests (one record, rewritten in place)
+    const camPos = this.camera.getWorldPosition(this.cameraWorldPosition);
+    const debug = this.debugState;
+    debug.yaw = this.yaw;
+    debug.pitch = this.pitch;
+    debug.playerYaw = this.target.mesh.rotation.y;
+    debug.pos.x = camPos.x;
+    debug.pos.y = camPos.y;
+    debug.pos.z = camPos.z;
+    debug.target.x = lookTarget.x;
+    debug.target.y = lookTarget.y;
+    debug.target.z = lookTarget.z;
+    window.__camDebug = debug;
   }
 }
 
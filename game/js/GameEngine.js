@@ -11,6 +11,29 @@ class GameEngine {
         this.world = null; // Physics world (disabled for initial testing)
         this.clock = new THREE.Clock();
         
+        // Physics tuning: broadphase 'auto' starts naive (cheapest for a handful of
+        // bodies) and switches to sweep-and-prune once the level grows past sapThreshold
+        const params = new URLSearchParams(window.location.search);
+        this.physicsConfig = {
+            broadphase: params.get('broadphase') || 'auto', // auto | naive | sap | grid
+            sapThreshold: 24,
+            iterations: 10,
+            allowSleep: true,
+            fixedTimeStep: 1 / 60, // Physics always advances in steps of this size
+            maxSubSteps: 5         // Per frame; a longer stall is dropped, not replayed
+        };
+        this.broadphaseKind = null;
+        this.broadphaseBodyCount = -1;
+        
+        // Fixed-step state: unsimulated time carried between frames, and how far
+        // (0..1) the frame sits between the last two physics states
+        this.physicsAccumulator = 0;
+        this.physicsAlpha = 1;
+        this.physicsSteps = 0;
+        this.interpolatedBodies = new Map(); // body -> state before the last step
+        this.interpolatedStates = [];        // The same states, for allocation-free iteration
+        this.interpolationQuaternion = new THREE.Quaternion();
+        
         // Game state
         this.isLoaded = false;
         this.isPaused = false;
@@ -23,15 +46,28 @@ class GameEngine {
     }
     
     init() {
+        // Quality tier first: the renderer's antialiasing and pixel ratio depend on it
+        this.quality = new QualityScaler(this);
+        this.profiler = new Profiler(window.gameTelemetry);
         this.createScene();
         this.createRenderer();
         this.createCamera();
         this.createPhysicsWorld(); // Re-enabled with working Cannon.js v0.6.2
         this.setupLighting();
         this.setupEventListeners();
+        this.preloadAssets();
         this.hideLoading();
     }
     
+    // Manifest textures load behind the loading screen, which shows their progress
+    preloadAssets() {
+        const status = document.querySelector('#loading > div:last-child');
+        window.assetManager.on('progress', ({ loaded, total }) => {
+            if (status) status.textContent = `Loading RoboQuest... ${loaded}/${total}`;
+        });
+        window.assetManager.preload();
+    }
+    
     createScene() {
         this.scene = new THREE.Scene();
         
@@ -47,21 +83,27 @@ class GameEngine {
     createRenderer() {
         this.renderer = new THREE.WebGLRenderer({ 
             canvas: document.getElementById('gameCanvas'),
-            antialias: true,
+            antialias: this.quality.tier.antialias,
             alpha: false
         });
         
         this.renderer.setSize(window.innerWidth, window.innerHeight);
-        this.renderer.setPixelRatio(Math.min(window.devicePixelRatio, 2));
+        this.renderer.setPixelRatio(this.quality.pixelRatio());
         
         // Enable shadows for realistic lighting
-        this.renderer.shadowMap.enabled = true;
+        this.renderer.shadowMap.enabled = this.quality.tier.shadows;
         this.renderer.shadowMap.type = THREE.PCFSoftShadowMap;
         
         // Color space and tone mapping for vibrant colors
         this.renderer.outputColorSpace = THREE.SRGBColorSpace;
         this.renderer.toneMapping = THREE.ACESFilmicToneMapping;
         this.renderer.toneMappingExposure = 1.2;
+        
+        // Per-frame draw call/triangle counters for telemetry and the stats overlay
+        this.renderStats = new RenderStats(this.renderer);
+        if (new URLSearchParams(window.location.search).get('stats') === '1') {
+            this.renderStats.showOverlay();
+        }
     }
     
     createCamera() {
@@ -88,8 +130,11 @@ class GameEngine {
         // Cannon.js physics world
         this.world = new CANNON.World();
         this.world.gravity.set(0, -30, 0); // Strong gravity for responsive platforming
-        this.world.broadphase = new CANNON.NaiveBroadphase();
-        this.world.solver.iterations = 10;
+        this.world.solver.iterations = this.physicsConfig.iterations;
+        this.selectBroadphase();
+        
+        // Idle dynamic bodies stop being integrated until something touches them
+        this.world.allowSleep = this.physicsConfig.allowSleep;
         
         // Contact materials for different surfaces
         const defaultMaterial = new CANNON.Material('default');
@@ -109,6 +154,39 @@ class GameEngine {
         this.world.addContactMaterial(defaultContactMaterial);
     }
     
+    createBroadphase(kind) {
+        switch (kind) {
+            case 'sap': {
+                const broadphase = new CANNON.SAPBroadphase(this.world);
+                broadphase.autoDetectAxis();
+                return broadphase;
+            }
+            case 'grid':
+                // Uniform grid over the playable area
+                return new CANNON.GridBroadphase(
+                    new CANNON.Vec3(-150, -20, -150), new CANNON.Vec3(150, 80, 150), 15, 5, 15
+                );
+            default:
+                return new CANNON.NaiveBroadphase();
+        }
+    }
+    
+    // Pick the broadphase for the current body count. 'auto' only ever upgrades
+    // naive -> sap: SAP stays cheap when the level shrinks again and keeps
+    // listeners on the world that a downgrade would have to unhook.
+    selectBroadphase() {
+        const count = this.world.bodies.length;
+        this.broadphaseBodyCount = count;
+        let kind = this.physicsConfig.broadphase;
+        if (kind === 'auto') {
+            kind = this.broadphaseKind === 'sap' || count > this.physicsConfig.sapThreshold ? 'sap' : 'naive';
+        }
+        if (kind === this.broadphaseKind) return;
+        this.world.broadphase = this.createBroadphase(kind);
+        this.broadphaseKind = kind;
+        gameLog.info('physics', `Broadphase: ${kind} (${count} bodies)`);
+    }
+    
     setupLighting() {
         // Ambient light for overall scene brightness
         const ambientLight = new THREE.AmbientLight(0x404040, 0.6);
@@ -117,20 +195,15 @@ class GameEngine {
         // Directional light (sun) - Astro Bot style bright lighting
         const directionalLight = new THREE.DirectionalLight(0xffffff, 1.0);
         directionalLight.position.set(50, 100, 50);
-        directionalLight.castShadow = true;
-        
-        // Shadow camera setup for better shadow quality
-        directionalLight.shadow.camera.near = 0.1;
-        directionalLight.shadow.camera.far = 500;
-        directionalLight.shadow.camera.left = -100;
-        directionalLight.shadow.camera.right = 100;
-        directionalLight.shadow.camera.top = 100;
-        directionalLight.shadow.camera.bottom = -100;
-        directionalLight.shadow.mapSize.width = 2048;
-        directionalLight.shadow.mapSize.height = 2048;
-        
+        directionalLight.castShadow = this.renderer.shadowMap.enabled;
         this.scene.add(directionalLight);
         
+        // Shadow frustum fitted around the player and cached; dynamic objects get blob shadows.
+        // After restart() the objects that had blobs are gone; the ones rebuilt register again
+        this.shadows = new ShadowSystem(this.renderer, this.scene, directionalLight, this.world, {
+            mapSize: this.quality.tier.shadowMapSize
+        });
+        
         // Hemisphere light for softer fill lighting
         const hemisphereLight = new THREE.HemisphereLight(0x87CEEB, 0x9370DB, 0.4);
         this.scene.add(hemisphereLight);
@@ -180,13 +253,13 @@ class GameEngine {
     hideLoading() {
         const loadingElement = document.getElementById('loading');
         if (loadingElement) {
-            setTimeout(() => {
+            window.assetManager.ready.then(() => {
                 loadingElement.style.opacity = '0';
                 setTimeout(() => {
                     loadingElement.style.display = 'none';
                     this.isLoaded = true;
                 }, 500);
-            }, 1000);
+            });
         }
     }
     
@@ -196,20 +269,125 @@ class GameEngine {
         
         if (!this.isLoaded || this.isPaused) return;
         
+        const frameStart = performance.now();
         const deltaTime = this.clock.getDelta();
         
-        // Update physics world (re-enabled with working Cannon.js)
+        this.tick(deltaTime);
+        this.quality.sample(deltaTime * 1000);
+        this.profiler.endFrame(deltaTime * 1000);
+        
+        // Per-frame CPU time for the harness benchmarks
+        if (window.gameTelemetry) {
+            window.gameTelemetry.endFrame(performance.now() - frameStart, deltaTime * 1000);
+        }
+    }
+    
+    // Advance the simulation by one frame (also driven directly by the input replayer)
+    tick(deltaTime, render = true) {
+        // Frame boundary for input recordings (events before it belong to this frame)
+        if (window.inputRecorder && window.inputRecorder.recording) {
+            window.inputRecorder.frame(deltaTime);
+        }
+        
+        // Update physics world in fixed steps (re-enabled with working Cannon.js)
         if (this.world) {
-            this.world.step(deltaTime);
+            if (this.world.bodies.length !== this.broadphaseBodyCount) this.selectBroadphase();
+            this.profiler.begin('physics');
+            this.stepPhysics(deltaTime);
+            this.profiler.end('physics');
         }
         
-        // Update game objects (will be called by game logic)
+        // Update game objects (will be called by game logic); meshes interpolate by physicsAlpha
         if (window.gameLogic) {
             window.gameLogic.update(deltaTime);
         }
         
         // Render the scene
-        this.renderer.render(this.scene, this.camera);
+        if (render) {
+            const player = window.gameLogic && window.gameLogic.player;
+            this.shadows.update(player ? player.mesh.position : null);
+            this.profiler.begin('render');
+            this.renderer.render(this.scene, this.camera);
+            this.profiler.end('render');
+            this.renderStats.capture(this.camera);
+        }
+    }
+    
+    // Advance physics by whole fixed steps covering deltaTime; the remainder carries over
+    stepPhysics(deltaTime) {
+        const step = this.physicsConfig.fixedTimeStep;
+        this.physicsAccumulator += deltaTime;
+        
+        let steps = 0;
+        while (this.physicsAccumulator >= step && steps < this.physicsConfig.maxSubSteps) {
+            this.savePhysicsStates();
+            if (window.gameLogic) window.gameLogic.fixedUpdate(step);
+            this.world.step(step);
+            this.physicsAccumulator -= step;
+            steps++;
+        }
+        
+        // Stalled (tab switch, breakpoint): drop the backlog instead of spiralling
+        if (this.physicsAccumulator >= step) {
+            this.physicsAccumulator %= step;
+        }
+        
+        this.physicsSteps = steps;
+        this.physicsAlpha = this.physicsAccumulator / step;
+        if (window.gameTelemetry) window.gameTelemetry.set('physicsSteps', steps);
+    }
+    
+    // Interpolated bodies keep their pre-step state so meshes can render between steps
+    trackInterpolation(body) {
+        const state = { body: body, position: new CANNON.Vec3(), quaternion: new CANNON.Quaternion() };
+        state.position.copy(body.position);
+        state.quaternion.copy(body.quaternion);
+        this.interpolatedBodies.set(body, state);
+        this.interpolatedStates.push(state);
+    }
+    
+    untrackInterpolation(body) {
+        const state = this.interpolatedBodies.get(body);
+        if (!state) return;
+        this.interpolatedBodies.delete(body);
+        this.interpolatedStates.splice(this.interpolatedStates.indexOf(state), 1);
+    }
+    
+    // After a teleport: no interpolation from the old position
+    snapInterpolation(body) {
+        const state = this.interpolatedBodies.get(body);
+        if (!state) return;
+        state.position.copy(body.position);
+        state.quaternion.copy(body.quaternion);
+    }
+    
+    savePhysicsStates() {
+        for (let i = 0; i < this.interpolatedStates.length; i++) {
+            const state = this.interpolatedStates[i];
+            state.position.copy(state.body.position);
+            state.quaternion.copy(state.body.quaternion);
+        }
+    }
+    
+    // Write the body's transform at physicsAlpha between its last two states
+    interpolateBody(body, position, quaternion = null) {
+        const state = this.interpolatedBodies.get(body);
+        if (!state) {
+            position.copy(body.position);
+            if (quaternion) quaternion.copy(body.quaternion);
+            return;
+        }
+        
+        const alpha = this.physicsAlpha;
+        const previous = state.position;
+        position.set(
+            previous.x + (body.position.x - previous.x) * alpha,
+            previous.y + (body.position.y - previous.y) * alpha,
+            previous.z + (body.position.z - previous.z) * alpha
+        );
+        if (quaternion) {
+            quaternion.copy(state.quaternion).slerp(this.interpolationQuaternion.copy(body.quaternion), alpha);
+        }
     }
     
     // Utility methods for game objects
@@ -334,22 +512,53 @@ class GameEngine {
         this.isPaused = false;
     }
     
+    // Free the GPU side of an object tree removed from the scene. Materials in
+    // keep (shared libraries) and their textures are left for their owner;
+    // materials in disposed were already freed by an earlier call.
+    disposeObject(object, keep = null, disposed = new Set()) {
+        object.traverse((child) => {
+            if (child.geometry) child.geometry.dispose();
+            if (child.shadow && child.shadow.dispose) child.shadow.dispose(); // Light shadow map render target
+            const materials = Array.isArray(child.material) ? child.material : [child.material];
+            materials.forEach(material => {
+                if (!material || (keep && keep.has(material)) || disposed.has(material)) return;
+                disposed.add(material);
+                for (const key in material) {
+                    const texture = material[key];
+                    if (!texture || !texture.isTexture) continue;
+                    // Shared AssetManager textures are reference counted, one reference per material
+                    if (texture.userData.assetUrl) window.assetManager.release(texture);
+                    else texture.dispose();
+                }
+                material.dispose();
+            });
+        });
+    }
+    
     restart() {
-        // Clear scene and reset game state
+        // Clear scene and reset game state, releasing GPU buffers, programs and textures
+        const disposed = new Set();
         while(this.scene.children.length > 0) {
-            this.scene.remove(this.scene.children[0]);
+            const child = this.scene.children[0];
+            this.scene.remove(child);
+            this.disposeObject(child, null, disposed);
         }
         
         while(this.world.bodies.length > 0) {
             this.world.remove(this.world.bodies[0]);
         }
+        this.interpolatedBodies.clear();
+        this.interpolatedStates.length = 0;
+        this.physicsAccumulator = 0;
         
-        // Reinitialize lighting and world
+        // Reinitialize lighting and the debug grid
         this.setupLighting();
+        this.addDebugGrid();
         
-        // Reset game logic
+        // Rebuild world, player and camera rig, then reset game logic
         if (window.gameLogic) {
-            window.gameLogic.restart();
+            window.gameLogic.rebuild();
+            this.quality.apply(); // The new player and scenery start at defaults
         }
     }
 }
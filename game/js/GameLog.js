@@ -0,0 +1,131 @@
+/*
+ROBOQUEST GAME LOG
+Leveled, categorized logger with deterministic sampling and a ring buffer the
+test harness drains. Below-threshold calls are no-ops; hot paths guard with
+gameLog.enabled()/gameLog.every() so disabled logging allocates nothing.
+
+Enable from the URL:  index.html?log=debug             (all categories)
+                      index.html?log=debug&logcat=player,camera
+*/
+
+const LOG_LEVELS = { debug: 0, info: 1, warn: 2, error: 3, off: 4 };
+
+class GameLog {
+    constructor(options = {}) {
+        this.capacity = options.capacity || 512;
+        this.buffer = new Array(this.capacity);
+        this.head = 0;
+        this.count = 0;
+        this.dropped = 0;
+        this.counters = new Map(); // Sample key -> calls seen
+        this.startTime = performance.now();
+
+        this.configure({
+            level: options.level || 'info',
+            categories: options.categories || null,
+            console: options.console !== undefined ? options.console : true
+        });
+    }
+
+    configure({ level, categories, console: mirror } = {}) {
+        if (level !== undefined) {
+            if (LOG_LEVELS[level] === undefined) throw new Error(`Unknown log level: ${level}`);
+            this.level = level;
+            this.threshold = LOG_LEVELS[level];
+        }
+        if (categories !== undefined) {
+            this.categories = categories && categories.length ? new Set(categories) : null;
+        }
+        if (mirror !== undefined) this.mirror = mirror;
+
+        // Swap disabled levels for a shared no-op so callers pay only a call
+        for (const name of ['debug', 'info', 'warn', 'error']) {
+            this[name] = LOG_LEVELS[name] >= this.threshold
+                ? GameLog.prototype[name]
+                : GameLog.NOOP;
+        }
+        return this;
+    }
+
+    // Cheap guard for hot paths: build log arguments only when this is true
+    enabled(level, category) {
+        return LOG_LEVELS[level] >= this.threshold &&
+            (this.categories === null || this.categories.has(category));
+    }
+
+    // Deterministic rate limit: true on the first call and then every nth call for this key
+    every(key, n) {
+        const seen = this.counters.get(key) || 0;
+        this.counters.set(key, seen + 1);
+        return seen % n === 0;
+    }
+
+    debug(category, message, data) { this.write('debug', category, message, data); }
+    info(category, message, data) { this.write('info', category, message, data); }
+    warn(category, message, data) { this.write('warn', category, message, data); }
+    error(category, message, data) { this.write('error', category, message, data); }
+
+    write(level, category, message, data) {
+        if (this.categories !== null && !this.categories.has(category) && LOG_LEVELS[level] < LOG_LEVELS.warn) {
+            return;
+        }
+
+        const entry = {
+            time: performance.now() - this.startTime,
+            level: level,
+            category: category,
+            message: message,
+            data: data
+        };
+        this.buffer[this.head] = entry;
+        this.head = (this.head + 1) % this.capacity;
+        if (this.count < this.capacity) {
+            this.count++;
+        } else {
+            this.dropped++;
+        }
+
+        if (this.mirror) {
+            const method = level === 'debug' ? 'log' : level;
+            if (data !== undefined) {
+                console[method](`[${category}] ${message}`, data);
+            } else {
+                console[method](`[${category}] ${message}`);
+            }
+        }
+    }
+
+    // Buffered entries, oldest first, without clearing
+    entries() {
+        const start = (this.head - this.count + this.capacity) % this.capacity;
+        const result = new Array(this.count);
+        for (let i = 0; i < this.count; i++) {
+            result[i] = this.buffer[(start + i) % this.capacity];
+        }
+        return result;
+    }
+
+    // Buffered entries since the last drain (oldest first), then clear
+    drain() {
+        const result = { entries: this.entries(), dropped: this.dropped };
+        this.count = 0;
+        this.dropped = 0;
+        return result;
+    }
+
+    static fromLocation(search = window.location.search) {
+        const params = new URLSearchParams(search);
+        const categories = params.get('logcat');
+        return new GameLog({
+            level: params.get('log') || 'info',
+            categories: categories ? categories.split(',') : null
+        });
+    }
+}
+
+GameLog.LEVELS = LOG_LEVELS;
+GameLog.NOOP = function () {};
+
+// Global logger (configure at runtime with gameLog.configure({ level: 'debug' }))
+window.GameLog = GameLog;
+window.gameLog = GameLog.fromLocation();
@@ -27,11 +27,7 @@ class GameLogic {
     }
     
     init() {
-        // Create world first
-        this.worldManager = new World(this.gameEngine);
-        
-        // Create player
-        this.player = new Player(this.gameEngine);
+        this.createWorld();
         
         // Create camera controller (A/B by query: ?controller=egloff)
         const params = new URLSearchParams(window.location.search);
@@ -56,6 +52,27 @@ class GameLogic {
         console.log('🤖 Use WASD/Arrow keys to move, Space to jump, Mouse to hover');
     }
     
+    // World, then the player on it; the world's base level arrives asynchronously
+    createWorld() {
+        const world = new World(this.gameEngine);
+        this.worldManager = world;
+        this.loadingLevel = true; // No level-complete check until the collectibles exist
+        world.ready.then(() => { if (this.worldManager === world) this.loadingLevel = false; });
+        
+        this.player = new Player(this.gameEngine);
+    }
+    
+    // GameEngine.restart() emptied the scene and physics world: build world and player
+    // again and hang the camera rig (kept, with its input listeners) back in the scene
+    rebuild() {
+        this.createWorld();
+        if (this.cameraController) {
+            this.cameraController.target = this.player;
+            if (this.cameraController.yawPivot) this.scene.add(this.cameraController.yawPivot);
+        }
+        this.restart();
+    }
+    
     initAudio() {
         try {
             this.audioContext = new (window.AudioContext || window.webkitAudioContext)();
@@ -68,36 +85,57 @@ class GameLogic {
         if (this.gameState !== 'playing') return;
         
         this.time += deltaTime;
+        const profiler = this.gameEngine.profiler;
         
         // Update game objects
         if (this.player) {
+            profiler.begin('player');
             this.player.update(deltaTime);
+            profiler.end('player');
         }
         
         // Update camera controller
         if (this.cameraController) {
+            profiler.begin('camera');
             this.cameraController.update(deltaTime);
+            profiler.end('camera');
         }
         
         if (this.worldManager) {
-            this.worldManager.update(deltaTime);
+            profiler.begin('world');
+            this.worldManager.update(deltaTime, this.player ? this.player.mesh.position : null);
+            profiler.end('world');
         }
         
         // Game logic checks
+        profiler.begin('collectibles');
         this.checkCollectibles();
+        profiler.end('collectibles');
         this.checkGameState();
         this.checkPlayerBounds();
     }
     
+    // Called by GameEngine before every fixed physics step
+    fixedUpdate(step) {
+        if (this.gameState !== 'playing') return;
+        
+        if (this.player) {
+            this.player.fixedUpdate(step);
+        }
+        
+        if (this.worldManager) {
+            this.worldManager.fixedUpdate(step);
+        }
+    }
+    
     checkCollectibles() {
         if (!this.player || !this.worldManager) return;
         
-        const playerPos = this.player.getPosition();
-        const collected = this.worldManager.checkCollectibleCollisions(playerPos);
-        
-        collected.forEach(item => {
-            this.collectItem(item);
-        });
+        // Read-only query: the live mesh position avoids a per-frame clone
+        const collected = this.worldManager.checkCollectibleCollisions(this.player.mesh.position);
+        for (let i = 0; i < collected.length; i++) {
+            this.collectItem(collected[i]);
+        }
     }
     
     collectItem(item) {
@@ -121,7 +159,7 @@ class GameLogic {
     
     checkGameState() {
         // Check level completion
-        if (this.worldManager && this.worldManager.isLevelComplete()) {
+        if (!this.loadingLevel && this.worldManager && this.worldManager.isLevelComplete()) {
             this.completeLevel();
         }
         
@@ -134,7 +172,7 @@ class GameLogic {
     checkPlayerBounds() {
         if (!this.player) return;
         
-        const playerY = this.player.getPosition().y;
+        const playerY = this.player.mesh.position.y;
         
         // If player falls too far, respawn
         if (playerY < -20) {
@@ -376,7 +414,7 @@ class GameLogic {
         return this.score + timeBonus + coinBonus + healthBonus;
     }
     
-    // Level management (for future expansion)
+    // Level management: compiled levels from game/levels, procedural when none exists
     loadLevel(levelNumber) {
         this.level = levelNumber;
         
@@ -385,19 +423,17 @@ class GameLogic {
             this.worldManager.reset();
         }
         
-        // Generate level-specific content
-        switch(levelNumber) {
-            case 1:
-                // Tutorial level (current level)
-                break;
-            case 2:
-                // Add more challenging platforms
-                this.worldManager.generatePlatformSequence(100, 5, 0, 10);
-                break;
-            default:
-                // Procedurally generated content
-                this.generateProceduralLevel(levelNumber);
-        }
+        // Level 1 is the base level, always loaded
+        if (levelNumber === 1) return Promise.resolve();
+        
+        this.loadingLevel = true;
+        return this.worldManager.fetchLevel(`levels/level${levelNumber}.rql`).then(level => {
+            if (this.level === levelNumber) this.worldManager.loadLevelData(level);
+        }).catch(() => {
+            if (this.level === levelNumber) this.generateProceduralLevel(levelNumber);
+        }).then(() => {
+            if (this.level === levelNumber) this.loadingLevel = false;
+        });
     }
     
     generateProceduralLevel(level) {
@@ -411,12 +447,16 @@ class GameLogic {
     }
     
     // Performance monitoring
+    // Read-only: the main loop owns clock.getDelta(), so FPS and delta come from the profiler
     getPerformanceStats() {
+        const profile = this.gameEngine.profiler.snapshot();
         return {
-            fps: this.gameEngine.clock.getFPS ? this.gameEngine.clock.getFPS() : 60,
-            deltaTime: this.gameEngine.clock.getDelta(),
+            fps: profile.fps,
+            deltaTime: profile.frame.last / 1000,
+            spans: profile.spans,
             objects: this.scene.children.length,
-            physicsObjects: this.world.bodies.length
+            physicsObjects: this.world.bodies.length,
+            render: this.gameEngine.renderStats ? this.gameEngine.renderStats.snapshot() : null
         };
     }
     
@@ -452,21 +492,6 @@ class GameLogic {
         return false;
     }
     
-    // Mobile-specific optimizations
-    optimizeForMobile() {
-        // Reduce shadow quality on mobile
-        if (window.innerWidth < 768) {
-            this.gameEngine.renderer.shadowMap.enabled = false;
-            
-            // Reduce particle counts
-            if (this.player && this.player.hoverParticles) {
-                this.player.hoverParticles.geometry.attributes.position.count *= 0.5;
-            }
-            
-            console.log('📱 Mobile optimizations applied');
-        }
-    }
-    
     // Debug helpers
     enableDebugMode() {
         // Add debug helpers to scene
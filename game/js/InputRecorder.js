@@ -0,0 +1,328 @@
+/*
+ROBOQUEST INPUT RECORDING & REPLAY
+Records key/mouse events and frame boundaries with high-resolution timestamps
+into a compact flat array, and replays them frame-exact through
+GameEngine.tick() - live, time-compressed, or as fast as the CPU allows.
+
+Recording format (version 1):
+    {
+        version: 1,
+        codes: ['KeyW', 'Space', ...],          // key code table
+        events: [t, type, p0, p1, p2, p3, ...], // stride 6, t in ms since start
+        frames: 1234, duration: 20512.3,
+        start: { position, velocity,          // player state when recording began,
+                 physicsAccumulator,          // the fixed-step phase,
+                 camera,                      // camera rig angles (they set the movement direction)
+                 platforms },                 // and each loaded moving platform's path and phase
+        end: { ... }                          // ... and when it stopped (for replay checks)
+    }
+*/
+
+const INPUT_EVENT_STRIDE = 6;
+
+const INPUT_EVENT = {
+    KEY_DOWN: 0,   // p0 = code index
+    KEY_UP: 1,     // p0 = code index
+    MOUSE_DOWN: 2, // p0 = button, p1 = clientX, p2 = clientY
+    MOUSE_UP: 3,   // p0 = button, p1 = clientX, p2 = clientY
+    MOUSE_MOVE: 4, // p0 = clientX, p1 = clientY, p2 = movementX, p3 = movementY
+    WHEEL: 5,      // p0 = deltaY, p1 = clientX, p2 = clientY
+    FRAME: 6       // p0 = deltaTime (seconds) the engine stepped with
+};
+
+// Egloff rig (yaw/pitch) or the legacy CameraController (horizontal/vertical angles)
+function snapshotCamera(rig) {
+    if (!rig) return null;
+    const playerYaw = rig.target && rig.target.mesh ? rig.target.mesh.rotation.y : 0;
+    if (rig.yawPivot) {
+        return { yaw: rig.yaw, yawTarget: rig.yawTarget, pitch: rig.pitch, pitchTarget: rig.pitchTarget, playerYaw };
+    }
+    return {
+        yaw: rig.horizontalAngle, yawTarget: rig.targetHorizontalAngle,
+        pitch: rig.verticalAngle, pitchTarget: rig.targetVerticalAngle, playerYaw
+    };
+}
+
+function platformKey(origin) {
+    return `${origin.x},${origin.y},${origin.z}`;
+}
+
+function snapshotPlayer() {
+    const logic = window.gameLogic;
+    const body = logic && logic.player && logic.player.physicsBody;
+    if (!body) return null;
+    const world = logic.worldManager;
+    return {
+        position: { x: body.position.x, y: body.position.y, z: body.position.z },
+        velocity: { x: body.velocity.x, y: body.velocity.y, z: body.velocity.z },
+        physicsAccumulator: window.gameEngine ? window.gameEngine.physicsAccumulator : 0, // Fixed-step phase
+        camera: snapshotCamera(logic.cameraController),
+        // Paths are picked at random per page load, so keep them with the phase
+        platforms: world ? world.movingPlatforms.map(platform => ({
+            key: platformKey(platform.originalPosition),
+            direction: { x: platform.moveDirection.x, y: platform.moveDirection.y, z: platform.moveDirection.z },
+            moveTime: platform.moveTime
+        })) : []
+    };
+}
+
+class InputRecorder {
+    constructor() {
+        this.recording = false;
+        this.events = [];
+        this.codes = [];
+        this.codeIndex = new Map();
+        this.frames = 0;
+        this.startTime = 0;
+        this.start = null;
+
+        this.handlers = {
+            keydown: (e) => { if (!e.repeat) this.push(INPUT_EVENT.KEY_DOWN, this.code(e.code)); },
+            keyup: (e) => this.push(INPUT_EVENT.KEY_UP, this.code(e.code)),
+            mousedown: (e) => this.push(INPUT_EVENT.MOUSE_DOWN, e.button, e.clientX, e.clientY),
+            mouseup: (e) => this.push(INPUT_EVENT.MOUSE_UP, e.button, e.clientX, e.clientY),
+            mousemove: (e) => this.push(INPUT_EVENT.MOUSE_MOVE, e.clientX, e.clientY, e.movementX || 0, e.movementY || 0),
+            wheel: (e) => this.push(INPUT_EVENT.WHEEL, e.deltaY, e.clientX, e.clientY)
+        };
+    }
+
+    code(code) {
+        let index = this.codeIndex.get(code);
+        if (index === undefined) {
+            index = this.codes.length;
+            this.codes.push(code);
+            this.codeIndex.set(code, index);
+        }
+        return index;
+    }
+
+    push(type, p0 = 0, p1 = 0, p2 = 0, p3 = 0) {
+        if (!this.recording) return;
+        this.events.push(performance.now() - this.startTime, type, p0, p1, p2, p3);
+    }
+
+    // Called by GameEngine.tick() at the start of every simulated frame
+    frame(deltaTime) {
+        this.push(INPUT_EVENT.FRAME, deltaTime);
+        this.frames++;
+    }
+
+    startRecording() {
+        this.events = [];
+        this.codes = [];
+        this.codeIndex = new Map();
+        this.frames = 0;
+        this.start = snapshotPlayer();
+        this.startTime = performance.now();
+        this.recording = true;
+        // Capture phase so handlers that stop propagation can't hide input from the recording
+        for (const type in this.handlers) {
+            document.addEventListener(type, this.handlers[type], { capture: true, passive: true });
+        }
+        return this;
+    }
+
+    stopRecording() {
+        this.recording = false;
+        for (const type in this.handlers) {
+            document.removeEventListener(type, this.handlers[type], { capture: true });
+        }
+        return {
+            version: 1,
+            codes: this.codes.slice(),
+            events: this.events.slice(),
+            frames: this.frames,
+            duration: performance.now() - this.startTime,
+            start: this.start,
+            end: snapshotPlayer()
+        };
+    }
+}
+
+class InputReplayer {
+    constructor(gameEngine) {
+        this.gameEngine = gameEngine;
+        this.running = false;
+    }
+
+    // Apply one recorded event: 'dom' dispatches synthetic events to every listener,
+    // 'state' writes straight into GameEngine.keys/mouse (engine-only, fastest)
+    apply(recording, i, mode) {
+        const events = recording.events;
+        const type = events[i + 1];
+        const p0 = events[i + 2], p1 = events[i + 3], p2 = events[i + 4], p3 = events[i + 5];
+        const engine = this.gameEngine;
+
+        if (type === INPUT_EVENT.KEY_DOWN || type === INPUT_EVENT.KEY_UP) {
+            const code = recording.codes[p0];
+            if (mode === 'state') {
+                engine.keys[code] = type === INPUT_EVENT.KEY_DOWN;
+            } else {
+                document.dispatchEvent(new KeyboardEvent(type === INPUT_EVENT.KEY_DOWN ? 'keydown' : 'keyup', { code: code, bubbles: true }));
+            }
+        } else if (type === INPUT_EVENT.MOUSE_DOWN || type === INPUT_EVENT.MOUSE_UP) {
+            if (mode === 'state') {
+                if (p0 === 0) engine.mouse.clicked = type === INPUT_EVENT.MOUSE_DOWN;
+            } else {
+                document.dispatchEvent(new MouseEvent(type === INPUT_EVENT.MOUSE_DOWN ? 'mousedown' : 'mouseup', {
+                    button: p0, clientX: p1, clientY: p2, bubbles: true
+                }));
+            }
+        } else if (type === INPUT_EVENT.MOUSE_MOVE) {
+            if (mode === 'state') {
+                engine.mouse.x = (p0 / window.innerWidth) * 2 - 1;
+                engine.mouse.y = -(p1 / window.innerHeight) * 2 + 1;
+            } else {
+                document.dispatchEvent(new MouseEvent('mousemove', {
+                    clientX: p0, clientY: p1, movementX: p2, movementY: p3, bubbles: true
+                }));
+            }
+        } else if (type === INPUT_EVENT.WHEEL && mode !== 'state') {
+            document.dispatchEvent(new WheelEvent('wheel', { deltaY: p0, clientX: p1, clientY: p2, bubbles: true }));
+        }
+    }
+
+    restore(snapshot) {
+        const logic = window.gameLogic;
+        const body = logic && logic.player && logic.player.physicsBody;
+        if (!snapshot || !body) return;
+        body.position.set(snapshot.position.x, snapshot.position.y, snapshot.position.z);
+        body.velocity.set(snapshot.velocity.x, snapshot.velocity.y, snapshot.velocity.z);
+        body.angularVelocity.set(0, 0, 0);
+        // Same fixed-step phase as the recording, so every frame runs the same physics steps
+        this.gameEngine.physicsAccumulator = snapshot.physicsAccumulator || 0;
+        this.gameEngine.snapInterpolation(body);
+        this.restoreCamera(logic.cameraController, snapshot.camera);
+        if (logic.worldManager) this.restorePlatforms(logic.worldManager, snapshot.platforms);
+    }
+
+    // The rig's angles turn movement input into a direction, so they are part of the start state
+    restoreCamera(rig, camera) {
+        if (!rig || !camera) return;
+        if (rig.yawPivot) {
+            rig.yaw = camera.yaw;
+            rig.yawTarget = camera.yawTarget;
+            rig.pitch = camera.pitch;
+            rig.pitchTarget = camera.pitchTarget;
+        } else {
+            rig.horizontalAngle = camera.yaw;
+            rig.targetHorizontalAngle = camera.yawTarget;
+            rig.verticalAngle = camera.pitch;
+            rig.targetVerticalAngle = camera.pitchTarget;
+        }
+        if (rig.target && rig.target.mesh) rig.target.mesh.rotation.y = camera.playerYaw;
+    }
+
+    // Moving platforms resume the recorded path and phase; bodies are placed as World.fixedUpdate would
+    restorePlatforms(world, platforms) {
+        if (!platforms) return;
+        const byKey = new Map(platforms.map(p => [p.key, p]));
+        for (const platform of world.movingPlatforms) {
+            const saved = byKey.get(platformKey(platform.originalPosition));
+            if (!saved) continue;
+            platform.moveDirection.set(saved.direction.x, saved.direction.y, saved.direction.z);
+            platform.moveTime = saved.moveTime;
+            if (!platform.body) continue;
+            const offset = Math.sin(platform.moveTime * platform.moveSpeed) * platform.moveDistance;
+            const origin = platform.originalPosition;
+            const direction = platform.moveDirection;
+            platform.body.position.set(
+                origin.x + direction.x * offset,
+                origin.y + direction.y * offset,
+                origin.z + direction.z * offset
+            );
+            this.gameEngine.snapInterpolation(platform.body);
+        }
+    }
+
+    /*
+    Replay a recording frame-by-frame through GameEngine.tick().
+    options.mode        'dom' (default) or 'state'
+    options.speed       Infinity (default) = as fast as possible, or a time-compression factor (1 = live)
+    options.renderEvery Render one of every N simulated frames (default 8 when accelerated)
+    options.chunkMs     Wall-clock budget per chunk before yielding to the browser
+    Resolves with { frames, simulatedMs, wallMs, speedup, end }.
+    */
+    replay(recording, options = {}) {
+        const mode = options.mode || 'dom';
+        const speed = options.speed === undefined ? Infinity : options.speed;
+        const renderEvery = options.renderEvery || (speed === Infinity ? 8 : 1);
+        const chunkMs = options.chunkMs || 12;
+        const engine = this.gameEngine;
+        const events = recording.events;
+
+        const wasPaused = engine.isPaused;
+        engine.isPaused = true; // Stop the live loop; the replayer owns tick() now
+        engine.keys = {};
+        this.restore(recording.start);
+        this.running = true;
+
+        let cursor = 0;
+        let frames = 0;
+        let simulatedMs = 0;
+        const wallStart = performance.now();
+
+        // Apply events up to the next frame marker, then step that frame; false when finished
+        const step = () => {
+            while (cursor < events.length && events[cursor + 1] !== INPUT_EVENT.FRAME) {
+                this.apply(recording, cursor, mode);
+                cursor += INPUT_EVENT_STRIDE;
+            }
+            if (cursor >= events.length) return false;
+            const deltaTime = events[cursor + 2];
+            cursor += INPUT_EVENT_STRIDE;
+            frames++;
+            simulatedMs += deltaTime * 1000;
+            engine.tick(deltaTime, frames % renderEvery === 0);
+            return true;
+        };
+
+        return new Promise((resolve) => {
+            const finish = () => {
+                engine.keys = {};
+                engine.mouse.clicked = false;
+                engine.clock.getDelta(); // Don't hand the live loop the whole replay as one delta
+                engine.isPaused = wasPaused;
+                this.running = false;
+                const wallMs = performance.now() - wallStart;
+                resolve({
+                    frames: frames,
+                    simulatedMs: simulatedMs,
+                    wallMs: wallMs,
+                    speedup: wallMs > 0 ? simulatedMs / wallMs : 0,
+                    end: snapshotPlayer()
+                });
+            };
+
+            const run = () => {
+                if (!this.running) return finish();
+                const chunkStart = performance.now();
+                if (speed === Infinity) {
+                    while (performance.now() - chunkStart < chunkMs) {
+                        if (!step()) return finish();
+                    }
+                    setTimeout(run, 0);
+                } else {
+                    // Keep simulated time at speed x wall time
+                    const target = (performance.now() - wallStart) * speed;
+                    while (simulatedMs < target) {
+                        if (!step()) return finish();
+                    }
+                    requestAnimationFrame(run);
+                }
+            };
+            run();
+        });
+    }
+
+    stop() {
+        this.running = false;
+    }
+}
+
+// Global recorder/replayer (GameEngine.tick() reports frame boundaries to the recorder)
+window.INPUT_EVENT = INPUT_EVENT;
+window.InputRecorder = InputRecorder;
+window.InputReplayer = InputReplayer;
+window.inputRecorder = new InputRecorder();
+window.inputReplayer = new InputReplayer(window.gameEngine);
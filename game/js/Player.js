@@ -3,6 +3,15 @@ ROBOQUEST PLAYER CHARACTER
 Astro Bot-inspired robot with platforming mechanics
 */
 
+const HOVER_PARTICLES = 50;
+const BURST_PARTICLES = 5;
+const BURST_POOL_SIZE = 15;
+
+function lerpAngle(a, b, t) {
+    const delta = ((b - a + Math.PI) % (Math.PI * 2)) - Math.PI;
+    return a + delta * t;
+}
+
 class Player {
     constructor(gameEngine) {
         this.gameEngine = gameEngine;
@@ -27,6 +36,26 @@ class Player {
         this.hoverForce = 6;  // Softer hover assist
         this.accelLerp = 0.6; // Faster acceleration to reach target speed quickly
         this.turnLerp = 0.25; // Snappier turning
+        
+        // Movement intent from the last input frame, applied every fixed physics step
+        this.moveIntent = new THREE.Vector3();
+        this.hasMoveIntent = false;
+        
+        // Scratch vectors reused by the per-frame paths (no allocations while playing)
+        this.aimDir = new THREE.Vector3();
+        this.moveDir = new THREE.Vector3();
+        this.indicatorDir = new THREE.Vector3();
+        this.debugState = {
+            yaw: 0,
+            pos: { x: 0, y: 0, z: 0 },
+            isMoving: false,
+            desiredDir: { x: 0, y: 0, z: 0 }
+        };
+        this.hudState = { coins: null, lives: null };
+        
+        // Pooled coin-burst particles (up to BURST_PARTICLES per burst, BURST_POOL_SIZE in flight)
+        this.bursts = [];
+        this.burstParticles = BURST_PARTICLES;
         this.maxHoverTime = 1.0; // 1 second hover like Astro Bot
         this.currentHoverTime = 0;
         this.isHovering = false;
@@ -48,7 +77,6 @@ class Player {
             emissive: 0x111111
         });
         const body = new THREE.Mesh(bodyGeometry, bodyMaterial);
-        body.castShadow = true;
         body.receiveShadow = true;
         robotGroup.add(body);
         
@@ -60,7 +88,6 @@ class Player {
         });
         const head = new THREE.Mesh(headGeometry, headMaterial);
         head.position.set(0, 1.2, 0);
-        head.castShadow = true;
         robotGroup.add(head);
         
         // Visor (cyan like Astro Bot)
@@ -82,12 +109,10 @@ class Player {
         
         const leftArm = new THREE.Mesh(armGeometry, armMaterial);
         leftArm.position.set(-0.7, 0.5, 0);
-        leftArm.castShadow = true;
         robotGroup.add(leftArm);
         
         const rightArm = new THREE.Mesh(armGeometry, armMaterial);
         rightArm.position.set(0.7, 0.5, 0);
-        rightArm.castShadow = true;
         robotGroup.add(rightArm);
         
         // Legs
@@ -96,12 +121,10 @@ class Player {
         
         const leftLeg = new THREE.Mesh(legGeometry, legMaterial);
         leftLeg.position.set(-0.3, -0.8, 0);
-        leftLeg.castShadow = true;
         robotGroup.add(leftLeg);
         
         const rightLeg = new THREE.Mesh(legGeometry, legMaterial);
         rightLeg.position.set(0.3, -0.8, 0);
-        rightLeg.castShadow = true;
         robotGroup.add(rightLeg);
         
         // Jetpack (for hover ability)
@@ -112,9 +135,11 @@ class Player {
         });
         const jetpack = new THREE.Mesh(jetpackGeometry, jetpackMaterial);
         jetpack.position.set(0, 0.2, -0.6);
-        jetpack.castShadow = true;
         robotGroup.add(jetpack);
         
+        // The robot moves every frame: it gets a blob shadow rather than dirtying the cached shadow map
+        gameEngine.shadows.addBlob(robotGroup, 1.0, 1.2);
+        
         // Store references for animations
         this.mesh = robotGroup;
         this.head = head;
@@ -150,7 +175,11 @@ class Player {
             this.physicsBody.fixedRotation = true;
             this.physicsBody.updateMassProperties();
             
+            // Input drives velocity directly, which would not wake a sleeping body
+            this.physicsBody.allowSleep = false;
+            
             this.world.add(this.physicsBody);
+            this.gameEngine.trackInterpolation(this.physicsBody);
             console.log('✅ Player physics body created and added to world');
         } catch (e) {
             console.error('❌ Player physics creation failed:', e);
@@ -172,7 +201,7 @@ class Player {
     
     createHoverEffects() {
         // Particle system for jetpack effects
-        const particleCount = 50;
+        const particleCount = HOVER_PARTICLES;
         const particles = new THREE.BufferGeometry();
         const positions = new Float32Array(particleCount * 3);
         
@@ -220,12 +249,11 @@ class Player {
 
     updateDirectionIndicator(worldDir) {
         if (!this.directionHelper) return;
-        const dir = worldDir.clone();
+        const dir = this.indicatorDir.copy(worldDir);
         dir.y = 0;
         if (dir.lengthSq() < 1e-4) {
             // Default to character forward if no input
-            const forward = new THREE.Vector3(0, 0, 1).applyEuler(this.mesh.rotation);
-            dir.copy(forward);
+            dir.set(0, 0, 1).applyEuler(this.mesh.rotation);
         }
         dir.normalize();
         this.directionHelper.setDirection(dir);
@@ -239,15 +267,16 @@ class Player {
         this.handleInput(deltaTime);
         this.updatePhysics(deltaTime); // Re-enabled with physics-free version
         this.updateAnimations(deltaTime);
+        this.updateBursts(deltaTime);
         // Camera is now handled by CameraController in GameLogic
         // this.updateCamera(deltaTime);
         this.updateHUD();
         
-        // Sync visual mesh with physics body (Step 6: Physics movement)
+        // Sync visual mesh with physics body, interpolated between fixed steps
         if (this.physicsBody) {
-            // Debug the sync issue
-            if (Math.random() < 0.01) {
-                console.log('🔄 Syncing positions:', {
+            // Debug the sync issue (sampled, and only built when player debug logging is on)
+            if (gameLog.enabled('debug', 'player') && gameLog.every('player.sync', 100)) {
+                gameLog.debug('player', '🔄 Syncing positions', {
                     physicsPosX: this.physicsBody.position.x,
                     physicsPosZ: this.physicsBody.position.z,
                     meshPosX: this.mesh.position.x,
@@ -255,23 +284,43 @@ class Player {
                 });
             }
             
-            this.mesh.position.copy(this.physicsBody.position);
-            this.mesh.quaternion.copy(this.physicsBody.quaternion);
+            this.gameEngine.interpolateBody(this.physicsBody, this.mesh.position, this.mesh.quaternion);
+        }
+    }
+    
+    // Once per fixed physics step: steering and forces (cleared by every world.step)
+    fixedUpdate(step) {
+        if (!this.physicsBody) return;
+        
+        if (this.hasMoveIntent) {
+            // Smooth velocity towards desired for fluid feel
+            this.physicsBody.velocity.x = THREE.MathUtils.lerp(
+                this.physicsBody.velocity.x, this.moveIntent.x, this.accelLerp
+            );
+            this.physicsBody.velocity.z = THREE.MathUtils.lerp(
+                this.physicsBody.velocity.z, this.moveIntent.z, this.accelLerp
+            );
             
-            // Force immediate sync verification
-            if (Math.abs(this.physicsBody.position.x - this.mesh.position.x) > 0.1) {
-                console.warn('⚠️ Position sync mismatch detected!');
-            }
+            // Small assisting force helps overcome friction hiccups
+            this.physicsBody.force.x += this.moveIntent.x * 0.5;
+            this.physicsBody.force.z += this.moveIntent.z * 0.5;
+        } else {
+            // Apply gentle damping to stop sliding
+            this.physicsBody.velocity.x *= 0.90;
+            this.physicsBody.velocity.z *= 0.90;
+        }
+        
+        if (this.isHovering) {
+            this.physicsBody.force.y += this.hoverForce;
         }
     }
     
     handleInput(deltaTime) {
         // Physics-based movement aligned to camera (WASD relative to camera)
-        const force = new CANNON.Vec3();
         let isMoving = false;
         
         // Aim direction from camera (XZ)
-        const aimDir = new THREE.Vector3();
+        const aimDir = this.aimDir;
         this.gameEngine.camera.getWorldDirection(aimDir);
         aimDir.y = 0;
         if (aimDir.lengthSq() > 0) aimDir.normalize();
@@ -281,8 +330,8 @@ class Player {
         let backward = false;
         
         // Debug input every 60 frames (1 second) to avoid spam
-        if (Math.floor(Date.now() / 1000) % 2 === 0 && Math.random() < 0.02) {
-            console.log('🎮 Input check - Keys pressed:', {
+        if (gameLog.enabled('debug', 'input') && gameLog.every('player.input', 60)) {
+            gameLog.debug('input', '🎮 Input check - Keys pressed', {
                 W: this.gameEngine.isKeyPressed('KeyW'),
                 A: this.gameEngine.isKeyPressed('KeyA'), 
                 S: this.gameEngine.isKeyPressed('KeyS'),
@@ -300,41 +349,26 @@ class Player {
         }
         
         // Build movement vector in world space from aim direction
-        const moveDirThree = new THREE.Vector3();
+        const moveDirThree = this.moveDir.set(0, 0, 0);
         if (isMoving && aimDir.lengthSq() > 0) {
             moveDirThree.copy(aimDir);
             if (backward && !forward) moveDirThree.multiplyScalar(-1);
         }
         
-        // Apply movement to physics body with damping when idle
+        // Desired velocity in the xz plane; fixedUpdate steers the body toward it
+        // every physics step, so acceleration doesn't depend on the display rate
         if (this.physicsBody) {
+            this.hasMoveIntent = isMoving;
             if (isMoving) {
-                // Desired velocity in xz plane
-                const desiredVX = moveDirThree.x * this.moveSpeed;
-                const desiredVZ = moveDirThree.z * this.moveSpeed;
-                
-                // Smooth velocity towards desired for fluid feel
-                this.physicsBody.velocity.x = THREE.MathUtils.lerp(
-                    this.physicsBody.velocity.x, desiredVX, this.accelLerp
-                );
-                this.physicsBody.velocity.z = THREE.MathUtils.lerp(
-                    this.physicsBody.velocity.z, desiredVZ, this.accelLerp
-                );
-                
-                // Small assisting force helps overcome friction hiccups
-                this.physicsBody.force.x += desiredVX * 0.5;
-                this.physicsBody.force.z += desiredVZ * 0.5;
+                this.moveIntent.set(moveDirThree.x * this.moveSpeed, 0, moveDirThree.z * this.moveSpeed);
                 this.animationState = 'walking';
             } else {
-                // Apply gentle damping to stop sliding
-                this.physicsBody.velocity.x *= 0.90;
-                this.physicsBody.velocity.z *= 0.90;
                 this.animationState = 'idle';
             }
 
             // More frequent debugging
-            if (Math.random() < 0.05) {
-                console.log('🚀 Movement Debug:', {
+            if (gameLog.enabled('debug', 'player') && gameLog.every('player.movement', 20)) {
+                gameLog.debug('player', '🚀 Movement Debug', {
                     aimDir: {x: aimDir.x.toFixed(2), z: aimDir.z.toFixed(2)},
                     moveDir: {x: moveDirThree.x.toFixed(2), z: moveDirThree.z.toFixed(2)},
                     desiredVelocity: this.physicsBody ? {x: this.physicsBody.velocity.x.toFixed(2), z: this.physicsBody.velocity.z.toFixed(2)} : null,
@@ -358,28 +392,26 @@ class Player {
                 targetYaw = Math.atan2(moveDirThree.x, moveDirThree.z);
             }
             if (targetYaw !== null) {
-                const lerpAngle = (a, b, t) => {
-                    let delta = ((b - a + Math.PI) % (Math.PI * 2)) - Math.PI;
-                    return a + delta * t;
-                };
                 this.mesh.rotation.y = lerpAngle(this.mesh.rotation.y, targetYaw, this.turnLerp);
             }
         }
 
         // Update direction indicator: prefer movement dir, else camera forward while aiming
         // Direction indicator: show motion if moving, else aim
-        const indicatorDir = (isMoving && moveDirThree.lengthSq() > 0) ? moveDirThree : aimDir.clone();
+        const indicatorDir = (isMoving && moveDirThree.lengthSq() > 0) ? moveDirThree : aimDir;
         this.updateDirectionIndicator(indicatorDir);
         
-        // Debug telemetry for automated tests
-        try {
-            window.__playerDebug = {
-                yaw: this.mesh.rotation.y,
-                pos: { x: this.mesh.position.x, y: this.mesh.position.y, z: this.mesh.position.z },
-                isMoving: !!isMoving,
-                desiredDir: { x: indicatorDir.x, y: indicatorDir.y, z: indicatorDir.z }
-            };
-        } catch (e) { /* ignore */ }
+        // Debug telemetry for automated tests (one object, rewritten in place)
+        const debug = this.debugState;
+        debug.yaw = this.mesh.rotation.y;
+        debug.pos.x = this.mesh.position.x;
+        debug.pos.y = this.mesh.position.y;
+        debug.pos.z = this.mesh.position.z;
+        debug.isMoving = !!isMoving;
+        debug.desiredDir.x = indicatorDir.x;
+        debug.desiredDir.y = indicatorDir.y;
+        debug.desiredDir.z = indicatorDir.z;
+        window.__playerDebug = debug;
         
         // Jumping (Space key or D key per request)
         if (this.gameEngine.isKeyPressed('Space') || this.gameEngine.isKeyPressed('KeyD')) {
@@ -394,6 +426,8 @@ class Player {
         if (this.gameEngine.isMouseClicked() || this.gameEngine.isKeyPressed('Space')) {
             if (!this.isGrounded && this.currentHoverTime < this.maxHoverTime) {
                 this.hover(deltaTime);
+            } else {
+                this.stopHover(); // Out of thrust: fixedUpdate stops pushing
             }
         } else {
             this.stopHover();
@@ -409,7 +443,7 @@ class Player {
         this.physicsBody.velocity.y = this.jumpForce;
         this.isGrounded = false;
         this.animationState = 'jumping';
-        console.log('🤖 Jump!');
+        gameLog.debug('player', '🤖 Jump!');
     }
     
     doubleJump() {
@@ -417,12 +451,11 @@ class Player {
         this.hasUsedDoubleJump = true;
         this.canDoubleJump = false;
         this.animationState = 'jumping';
-        console.log('🚀 Double Jump!');
+        gameLog.debug('player', '🚀 Double Jump!');
     }
     
     hover(deltaTime) {
         if (this.currentHoverTime < this.maxHoverTime) {
-            this.physicsBody.force.y += this.hoverForce;
             this.currentHoverTime += deltaTime;
             this.isHovering = true;
             this.animationState = 'hovering';
@@ -548,8 +581,8 @@ class Player {
             
             this.gameEngine.camera.lookAt(playerPos.x, playerPos.y + 2, playerPos.z);
             
-            if (Math.random() < 0.01) {
-                console.log('🖱️ Mouse camera control active:', {mouse, horizontalAngle, verticalAngle});
+            if (gameLog.enabled('debug', 'camera') && gameLog.every('player.mouseCamera', 100)) {
+                gameLog.debug('camera', '🖱️ Mouse camera control active', {mouse, horizontalAngle, verticalAngle});
             }
         } else {
             // Standard follow camera when not using mouse
@@ -574,18 +607,24 @@ class Player {
     }
     
     updateHUD() {
-        // Update UI elements
-        const scoreElement = document.getElementById('score');
-        const livesElement = document.getElementById('lives');
-        
-        if (scoreElement) scoreElement.textContent = `Coins: ${this.coins}`;
-        if (livesElement) livesElement.textContent = `Lives: ${this.lives}`;
+        // Update UI elements only when the values change (no per-frame strings or DOM writes)
+        const hud = this.hudState;
+        if (hud.coins !== this.coins) {
+            const scoreElement = document.getElementById('score');
+            if (scoreElement) scoreElement.textContent = `Coins: ${this.coins}`;
+            hud.coins = this.coins;
+        }
+        if (hud.lives !== this.lives) {
+            const livesElement = document.getElementById('lives');
+            if (livesElement) livesElement.textContent = `Lives: ${this.lives}`;
+            hud.lives = this.lives;
+        }
     }
     
     // Collectibles and interactions
     collectCoin() {
         this.coins++;
-        console.log('🪙 Coin collected! Total:', this.coins);
+        gameLog.info('collect', `🪙 Coin collected! Total: ${this.coins}`);
         
         // Play collection effect (visual feedback)
         this.playCollectionEffect();
@@ -617,6 +656,7 @@ class Player {
         this.physicsBody.position.set(0, 5, 0);
         this.physicsBody.velocity.set(0, 0, 0);
         this.physicsBody.force.set(0, 0, 0);
+        this.gameEngine.snapInterpolation(this.physicsBody);
         
         // Reset states
         this.currentHoverTime = 0;
@@ -631,42 +671,69 @@ class Player {
         // Handle game over logic
     }
     
+    // Share (0..1) of the hover and burst particles drawn; set by the quality tier
+    setParticleBudget(fraction) {
+        this.hoverParticles.geometry.setDrawRange(0, Math.round(HOVER_PARTICLES * fraction));
+        this.burstParticles = Math.max(1, Math.round(BURST_PARTICLES * fraction));
+    }
+    
+    // Burst particles are created once and recycled; a burst reuses the oldest slots when all are busy
+    createBurstPool() {
+        const geometry = new THREE.SphereGeometry(0.1, 8, 8);
+        for (let i = 0; i < BURST_POOL_SIZE; i++) {
+            const mesh = new THREE.Mesh(geometry, new THREE.MeshBasicMaterial({
+                color: 0xFFD700,
+                transparent: true,
+                opacity: 1
+            }));
+            mesh.visible = false;
+            this.scene.add(mesh);
+            this.bursts.push({ mesh, velocity: new THREE.Vector3(), delay: 0, active: false });
+        }
+        this.nextBurst = 0;
+    }
+    
     playCollectionEffect() {
-        // Create a small burst of particles
-        const burstGeometry = new THREE.SphereGeometry(0.1, 8, 8);
-        const burstMaterial = new THREE.MeshBasicMaterial({ 
-            color: 0xFFD700,
-            transparent: true,
-            opacity: 1
-        });
-        
-        for (let i = 0; i < 5; i++) {
-            const particle = new THREE.Mesh(burstGeometry, burstMaterial.clone());
-            particle.position.copy(this.mesh.position);
-            particle.position.y += 1;
+        // A small burst of particles, started 50 ms apart
+        if (this.bursts.length === 0) this.createBurstPool();
+        for (let i = 0; i < this.burstParticles; i++) {
+            const particle = this.bursts[this.nextBurst];
+            this.nextBurst = (this.nextBurst + 1) % BURST_POOL_SIZE;
             
-            const velocity = new THREE.Vector3(
+            particle.mesh.position.copy(this.mesh.position);
+            particle.mesh.position.y += 1;
+            particle.mesh.material.opacity = 1;
+            particle.mesh.visible = false;
+            particle.velocity.set(
                 (Math.random() - 0.5) * 5,
                 Math.random() * 3 + 2,
                 (Math.random() - 0.5) * 5
             );
+            particle.delay = i * 0.05;
+            particle.active = true;
+        }
+    }
+    
+    updateBursts(deltaTime) {
+        for (let i = 0; i < this.bursts.length; i++) {
+            const particle = this.bursts[i];
+            if (!particle.active) continue;
+            if (particle.delay > 0) {
+                particle.delay -= deltaTime;
+                continue;
+            }
             
-            this.scene.add(particle);
-            
-            // Animate particle
-            const animateParticle = () => {
-                particle.position.add(velocity.clone().multiplyScalar(0.016));
-                velocity.y -= 0.2; // Gravity
-                particle.material.opacity -= 0.02;
-                
-                if (particle.material.opacity > 0) {
-                    requestAnimationFrame(animateParticle);
-                } else {
-                    this.scene.remove(particle);
-                }
-            };
+            // Same motion as the old 60 fps animation, scaled by the real frame time
+            const frames = deltaTime * 60;
+            particle.mesh.visible = true;
+            particle.mesh.position.addScaledVector(particle.velocity, 0.016 * frames);
+            particle.velocity.y -= 0.2 * frames; // Gravity
+            particle.mesh.material.opacity -= 0.02 * frames;
             
-            setTimeout(() => animateParticle(), i * 50);
+            if (particle.mesh.material.opacity <= 0) {
+                particle.active = false;
+                particle.mesh.visible = false;
+            }
         }
     }
     
@@ -684,9 +751,9 @@ class Player {
         });
     }
     
-    // Getters for game logic
-    getPosition() {
-        return this.mesh.position.clone();
+    // Getters for game logic (copies into target; pass a reused vector on hot paths)
+    getPosition(target = new THREE.Vector3()) {
+        return target.copy(this.mesh.position);
     }
     
     getPhysicsPosition() {
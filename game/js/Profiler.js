@@ -0,0 +1,176 @@
+/*
+ROBOQUEST FRAME PROFILER
+performance.now() spans around each subsystem of the frame (physics step,
+player, camera, world, collectible checks, render) kept in per-span ring
+buffers, with FPS measured from the main loop's own frame deltas. Each span
+is also staged in the telemetry ring (<span>Ms columns). With marks on
+(?profile=1) every span is emitted as a performance.measure named rq:<span>
+for the DevTools timeline. The harness reads everything with one call to
+gameEngine.profiler.snapshot(). Optional overlay: ?profile=1 or F4.
+*/
+
+const PROFILER_SPANS = ['physics', 'player', 'camera', 'world', 'collectibles', 'render'];
+// Upper bucket edges (ms) of the span histograms
+const PROFILER_BUCKETS = [0.25, 0.5, 1, 2, 4, 8, 16, 33, Infinity];
+
+class Profiler {
+    constructor(telemetry = window.gameTelemetry, capacity = 600) {
+        this.telemetry = telemetry;
+        this.capacity = capacity;
+        this.head = 0;         // Frame slot the current frame's spans are written to
+        this.count = 0;        // Frames recorded (capped at capacity)
+        this.frames = 0;
+
+        this.spans = {};
+        for (const name of PROFILER_SPANS) {
+            this.spans[name] = {
+                samples: new Float32Array(capacity),
+                start: 0,
+                column: `${name}Ms`,
+                measure: `rq:${name}`,
+                startMark: `rq:${name}:start`
+            };
+            if (telemetry) telemetry.addColumn(`${name}Ms`);
+        }
+        this.deltas = new Float32Array(capacity); // Main-loop frame deltas (ms), for FPS
+        this.sorted = new Float32Array(capacity);
+
+        const params = new URLSearchParams(window.location.search);
+        this.marks = params.get('profile') === '1';
+        this.overlay = null;
+        this.overlayIntervalMs = 250;
+        this.overlayUpdated = 0;
+        if (this.marks) this.showOverlay();
+    }
+
+    begin(name) {
+        const span = this.spans[name];
+        span.start = performance.now();
+        if (this.marks) performance.mark(span.startMark);
+    }
+
+    end(name) {
+        const span = this.spans[name];
+        const ms = performance.now() - span.start;
+        // Spans that run more than once a frame (replayed ticks) add up
+        span.samples[this.head] += ms;
+        if (this.telemetry) this.telemetry.set(span.column, span.samples[this.head]);
+        if (this.marks) performance.measure(span.measure, span.startMark);
+    }
+
+    // Close the frame: called by the main loop once per rendered frame
+    endFrame(deltaMs) {
+        this.deltas[this.head] = deltaMs;
+        this.head = (this.head + 1) % this.capacity;
+        if (this.count < this.capacity) this.count++;
+        this.frames++;
+
+        for (const name in this.spans) this.spans[name].samples[this.head] = 0;
+        if (this.marks && this.frames % this.capacity === 0) {
+            // The timeline already has them; keep the entry buffer bounded. Only our own
+            // entries: other code on the page may rely on its marks
+            for (const name in this.spans) {
+                performance.clearMarks(this.spans[name].startMark);
+                performance.clearMeasures(this.spans[name].measure);
+            }
+        }
+        if (this.overlay) this.updateOverlay();
+    }
+
+    // Frames per second over the last second of recorded frames
+    fps() {
+        let total = 0;
+        let frames = 0;
+        for (let i = 1; i <= this.count && total < 1000; i++) {
+            total += this.deltas[(this.head - i + this.capacity) % this.capacity];
+            frames++;
+        }
+        return total > 0 ? (frames * 1000) / total : 0;
+    }
+
+    // Mean, percentiles, max and histogram of a ring of per-frame values
+    summarize(ring) {
+        const n = this.count;
+        const start = (this.head - n + this.capacity) % this.capacity;
+        const sorted = this.sorted.subarray(0, n);
+        let sum = 0;
+        for (let i = 0; i < n; i++) {
+            sorted[i] = ring[(start + i) % this.capacity];
+            sum += sorted[i];
+        }
+        sorted.sort();
+
+        const histogram = PROFILER_BUCKETS.map(() => 0);
+        let bucket = 0;
+        for (let i = 0; i < n; i++) {
+            while (sorted[i] > PROFILER_BUCKETS[bucket]) bucket++;
+            histogram[bucket]++;
+        }
+        const at = q => (n ? sorted[Math.min(n - 1, Math.floor(n * q))] : 0);
+        return {
+            last: n ? ring[(this.head - 1 + this.capacity) % this.capacity] : 0,
+            mean: n ? sum / n : 0,
+            p50: at(0.5),
+            p95: at(0.95),
+            max: n ? sorted[n - 1] : 0,
+            histogram: histogram
+        };
+    }
+
+    snapshot() {
+        const spans = {};
+        for (const name in this.spans) spans[name] = this.summarize(this.spans[name].samples);
+        return {
+            fps: this.fps(),
+            frames: this.frames,
+            window: this.count,
+            buckets: PROFILER_BUCKETS.map(edge => (edge === Infinity ? null : edge)),
+            frame: this.summarize(this.deltas),
+            spans: spans
+        };
+    }
+
+    reset() {
+        this.head = 0;
+        this.count = 0;
+        for (const name in this.spans) this.spans[name].samples[0] = 0;
+    }
+
+    showOverlay() {
+        if (this.overlay) return;
+        this.overlay = document.createElement('pre');
+        this.overlay.id = 'profiler';
+        this.overlay.style.cssText = 'position:absolute; top:170px; right:160px; margin:0; padding:8px 12px; ' +
+            'background:rgba(0,0,0,0.5); color:#fff; font:12px monospace; border-radius:8px; ' +
+            'pointer-events:none; z-index:150;';
+        document.body.appendChild(this.overlay);
+    }
+
+    hideOverlay() {
+        if (!this.overlay) return;
+        this.overlay.remove();
+        this.overlay = null;
+    }
+
+    toggleOverlay() {
+        if (this.overlay) this.hideOverlay(); else this.showOverlay();
+    }
+
+    updateOverlay() {
+        const now = performance.now();
+        if (now - this.overlayUpdated < this.overlayIntervalMs) return;
+        this.overlayUpdated = now;
+        const snapshot = this.snapshot();
+        let text = `fps          ${snapshot.fps.toFixed(1)}\n`;
+        for (const name in snapshot.spans) {
+            const span = snapshot.spans[name];
+            text += `${name.padEnd(12)} ${span.mean.toFixed(2)} ms (p95 ${span.p95.toFixed(2)})\n`;
+        }
+        this.overlay.textContent = text.trimEnd();
+    }
+}
+
+Profiler.SPANS = PROFILER_SPANS;
+Profiler.BUCKETS = PROFILER_BUCKETS;
+
+window.Profiler = Profiler;
@@ -0,0 +1,175 @@
+/*
+ROBOQUEST ADAPTIVE QUALITY
+Watches a rolling window of frame times and moves between QUALITY_TIERS:
+render resolution, shadow map size (or no shadow map, blob shadows only),
+scenery LOD distances and particle budgets. A tier is dropped as soon as the
+90th percentile frame misses the budget, but only raised after a sustained
+stretch of frames on budget; raising into a tier that then has to be dropped
+again doubles the wait before that tier is tried next time, so a device on
+the edge settles instead of oscillating. Antialiasing is fixed when the WebGL
+context is created, so it follows the tier remembered from the last session.
+?quality=high|medium|low|minimal pins a tier and turns adaptation off.
+*/
+
+// Best first. maxPixelRatio caps devicePixelRatio; resolutionScale multiplies the result
+const QUALITY_TIERS = [
+    { name: 'high',    maxPixelRatio: 2,   resolutionScale: 1,    shadows: true,  shadowMapSize: 1024, lod: 'high',   particles: 1,   antialias: true },
+    { name: 'medium',  maxPixelRatio: 1.5, resolutionScale: 1,    shadows: true,  shadowMapSize: 1024, lod: 'medium', particles: 0.6, antialias: true },
+    { name: 'low',     maxPixelRatio: 1,   resolutionScale: 0.85, shadows: true,  shadowMapSize: 512,  lod: 'low',    particles: 0.3, antialias: false },
+    { name: 'minimal', maxPixelRatio: 1,   resolutionScale: 0.7,  shadows: false, shadowMapSize: 512,  lod: 'low',    particles: 0.2, antialias: false }
+];
+const QUALITY_STORAGE_KEY = 'roboquest_quality';
+
+class QualityScaler {
+    constructor(gameEngine, config = {}) {
+        this.gameEngine = gameEngine;
+        this.telemetry = window.gameTelemetry;
+        this.config = Object.assign({
+            targetMs: 1000 / 60,
+            percentile: 0.9,
+            windowFrames: 120,       // Rolling window the percentile is taken over
+            evaluateEvery: 30,       // Frames between decisions
+            downgradeRatio: 1.3,     // Drop a tier when the percentile exceeds target * this
+            upgradeRatio: 1.1,       // Frames under target * this count as on budget
+            minDwellMs: 3000,        // No decision until a new tier has run this long
+            upgradeAfterMs: 8000,    // On-budget time needed before raising a tier
+            maxUpgradeAfterMs: 120000,
+            failedUpgradeMs: 15000,  // Dropping back within this of a raise counts as a failed raise
+            stallMs: 250             // Longer frames (tab switches, breakpoints) are not samples
+        }, config);
+
+        // Frame-time ring and a scratch copy for sorting
+        this.samples = new Float32Array(this.config.windowFrames);
+        this.sorted = new Float32Array(this.config.windowFrames);
+        this.sampleHead = 0;
+        this.sampleCount = 0;
+        this.framesSinceEvaluation = 0;
+
+        // Hysteresis state; times are accumulated frame time, so pauses do not count
+        this.elapsedMs = 0;
+        this.changedAt = 0;
+        this.lastChange = null;      // 'up' | 'down'
+        this.onBudgetSince = null;
+        this.upgradeAfterMs = QUALITY_TIERS.map(() => this.config.upgradeAfterMs);
+        this.lastPercentileMs = 0;
+        this.changes = 0;
+
+        const pinned = QualityScaler.tierIndex(new URLSearchParams(window.location.search).get('quality'));
+        this.adaptive = pinned === -1;
+        this.index = pinned !== -1 ? pinned : this.initialTier();
+        if (this.telemetry) this.telemetry.set('qualityTier', this.index);
+    }
+
+    static tierIndex(name) {
+        return QUALITY_TIERS.findIndex(tier => tier.name === name);
+    }
+
+    // Last session's settled tier, else a guess from the screen size
+    initialTier() {
+        const saved = QualityScaler.tierIndex(localStorage.getItem(QUALITY_STORAGE_KEY));
+        if (saved !== -1) return saved;
+        return window.innerWidth < 768 ? QualityScaler.tierIndex('low') : 0;
+    }
+
+    get tier() {
+        return QUALITY_TIERS[this.index];
+    }
+
+    pixelRatio() {
+        const tier = this.tier;
+        return Math.min(window.devicePixelRatio || 1, tier.maxPixelRatio) * tier.resolutionScale;
+    }
+
+    // Push the current tier to everything that exists; safe to call repeatedly
+    apply() {
+        const engine = this.gameEngine;
+        const tier = this.tier;
+        if (engine.renderer) engine.renderer.setPixelRatio(this.pixelRatio());
+        if (engine.shadows) engine.shadows.setQuality(tier.shadows, tier.shadowMapSize);
+
+        const logic = window.gameLogic;
+        if (logic && logic.player) logic.player.setParticleBudget(tier.particles);
+        if (logic && logic.worldManager && logic.worldManager.scenery) {
+            logic.worldManager.scenery.setLodTier(tier.lod);
+        }
+    }
+
+    // One frame's wall time (ms); called from the render loop
+    sample(deltaMs) {
+        if (!this.adaptive || deltaMs > this.config.stallMs) return;
+
+        this.elapsedMs += deltaMs;
+        this.samples[this.sampleHead] = deltaMs;
+        this.sampleHead = (this.sampleHead + 1) % this.samples.length;
+        if (this.sampleCount < this.samples.length) this.sampleCount++;
+
+        if (++this.framesSinceEvaluation >= this.config.evaluateEvery) {
+            this.framesSinceEvaluation = 0;
+            this.evaluate();
+        }
+    }
+
+    percentileMs() {
+        const sorted = this.sorted;
+        sorted.set(this.samples);
+        sorted.sort();
+        return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * this.config.percentile))];
+    }
+
+    evaluate() {
+        const config = this.config;
+        if (this.sampleCount < this.samples.length || this.elapsedMs - this.changedAt < config.minDwellMs) return;
+
+        const p = this.lastPercentileMs = this.percentileMs();
+        if (this.telemetry) this.telemetry.set('qualityP90Ms', p);
+
+        if (p > config.targetMs * config.downgradeRatio) {
+            this.onBudgetSince = null;
+            if (this.index === QUALITY_TIERS.length - 1) return;
+            // This tier was just raised into and could not hold: wait longer before trying it again
+            if (this.lastChange === 'up' && this.elapsedMs - this.changedAt < config.failedUpgradeMs) {
+                this.upgradeAfterMs[this.index] = Math.min(this.upgradeAfterMs[this.index] * 2, config.maxUpgradeAfterMs);
+            }
+            this.setTier(this.index + 1, 'down', p);
+        } else if (p < config.targetMs * config.upgradeRatio) {
+            if (this.onBudgetSince === null) this.onBudgetSince = this.elapsedMs;
+            if (this.index > 0 && this.elapsedMs - this.onBudgetSince >= this.upgradeAfterMs[this.index - 1]) {
+                this.setTier(this.index - 1, 'up', p);
+            }
+        } else {
+            this.onBudgetSince = null;
+        }
+    }
+
+    setTier(index, direction, percentileMs) {
+        this.index = index;
+        this.lastChange = direction;
+        this.changedAt = this.elapsedMs;
+        this.onBudgetSince = null;
+        this.changes++;
+
+        // The switch itself hitches (render targets resize), so start a fresh window
+        this.sampleCount = 0;
+        this.sampleHead = 0;
+        this.framesSinceEvaluation = 0;
+
+        this.apply();
+        localStorage.setItem(QUALITY_STORAGE_KEY, this.tier.name);
+        if (this.telemetry) this.telemetry.set('qualityTier', index);
+        console.log(`⚙️ Quality ${direction} to ${this.tier.name} (p90 ${percentileMs.toFixed(1)} ms)`);
+    }
+
+    getDebugInfo() {
+        return {
+            tier: this.tier.name,
+            index: this.index,
+            adaptive: this.adaptive,
+            pixelRatio: this.pixelRatio(),
+            p90Ms: this.lastPercentileMs,
+            changes: this.changes
+        };
+    }
+}
+
+QualityScaler.TIERS = QUALITY_TIERS;
+window.QualityScaler = QualityScaler;
@@ -0,0 +1,118 @@
+/*
+ROBOQUEST RENDER STATISTICS
+Per-frame renderer.info counters (draw calls, triangles, shadow-pass calls,
+programs, textures, geometries) written into the telemetry ring buffer,
+with the camera's world position so the harness can attribute cost to scene
+regions (the camera rig moves its parents, not the camera itself).
+Optional on-screen overlay: ?stats=1 or F3.
+*/
+
+const RENDER_STAT_COLUMNS = [
+    'drawCalls',        // All draw calls this frame: main pass plus shadow passes
+    'triangles',        // Likewise main pass plus shadow passes
+    'shadowCalls',      // Draw calls spent rendering shadow maps
+    'shadowTriangles',
+    'programs',
+    'textures',
+    'geometries',
+    'cameraX',
+    'cameraZ'
+];
+
+class RenderStats {
+    constructor(renderer, telemetry = window.gameTelemetry) {
+        this.renderer = renderer;
+        this.telemetry = telemetry;
+        this.shadowCalls = 0;
+        this.shadowTriangles = 0;
+        this.cameraPosition = new THREE.Vector3();
+        this.last = {};
+        this.overlay = null;
+        this.overlayIntervalMs = 250;
+        this.overlayUpdated = 0;
+
+        if (telemetry) RENDER_STAT_COLUMNS.forEach(name => telemetry.addColumn(name));
+        this.wrapShadowPass();
+    }
+
+    // render() runs the shadow pass before renderer.info resets, so info only ever
+    // holds the main pass; the shadow share is the difference across WebGLShadowMap.render()
+    wrapShadowPass() {
+        const shadowMap = this.renderer.shadowMap;
+        const info = this.renderer.info.render;
+        const render = shadowMap.render.bind(shadowMap);
+        shadowMap.render = (...args) => {
+            const calls = info.calls;
+            const triangles = info.triangles;
+            render(...args);
+            this.shadowCalls = info.calls - calls;
+            this.shadowTriangles = info.triangles - triangles;
+        };
+    }
+
+    // Call right after renderer.render()
+    capture(camera) {
+        const info = this.renderer.info;
+        const stats = this.last;
+        stats.drawCalls = info.render.calls + this.shadowCalls;
+        stats.triangles = info.render.triangles + this.shadowTriangles;
+        stats.shadowCalls = this.shadowCalls;
+        stats.shadowTriangles = this.shadowTriangles;
+        stats.programs = info.programs ? info.programs.length : 0;
+        stats.textures = info.memory.textures;
+        stats.geometries = info.memory.geometries;
+        if (camera) camera.getWorldPosition(this.cameraPosition);
+        stats.cameraX = camera ? this.cameraPosition.x : 0;
+        stats.cameraZ = camera ? this.cameraPosition.z : 0;
+        this.shadowCalls = 0;
+        this.shadowTriangles = 0;
+
+        if (this.telemetry) {
+            for (const name of RENDER_STAT_COLUMNS) this.telemetry.set(name, stats[name]);
+        }
+        if (this.overlay) this.updateOverlay();
+    }
+
+    snapshot() {
+        return Object.assign({}, this.last);
+    }
+
+    showOverlay() {
+        if (this.overlay) return;
+        this.overlay = document.createElement('pre');
+        this.overlay.id = 'renderStats';
+        this.overlay.style.cssText = 'position:absolute; top:20px; right:160px; margin:0; padding:8px 12px; ' +
+            'background:rgba(0,0,0,0.5); color:#fff; font:12px monospace; border-radius:8px; ' +
+            'pointer-events:none; z-index:150;';
+        document.body.appendChild(this.overlay);
+    }
+
+    hideOverlay() {
+        if (!this.overlay) return;
+        this.overlay.remove();
+        this.overlay = null;
+    }
+
+    toggleOverlay() {
+        if (this.overlay) this.hideOverlay(); else this.showOverlay();
+    }
+
+    updateOverlay() {
+        const now = performance.now();
+        if (now - this.overlayUpdated < this.overlayIntervalMs) return;
+        this.overlayUpdated = now;
+        const s = this.last;
+        const frameMs = this.telemetry ? this.telemetry.latest('frameMs') : 0;
+        this.overlay.textContent =
+            `frame     ${frameMs.toFixed(2)} ms\n` +
+            `calls     ${s.drawCalls} (shadow ${s.shadowCalls})\n` +
+            `triangles ${s.triangles} (shadow ${s.shadowTriangles})\n` +
+            `programs  ${s.programs}\n` +
+            `textures  ${s.textures}\n` +
+            `geometry  ${s.geometries}`;
+    }
+}
+
+RenderStats.COLUMNS = RENDER_STAT_COLUMNS;
+
+window.RenderStats = RenderStats;
@@ -0,0 +1,144 @@
+/*
+ROBOQUEST GPU RESOURCE TRACKER
+Attributes geometries, materials and textures to the game code that created
+them and reports the ones that are still alive (not disposed) but no longer
+reachable from the scene - GPU memory that will never be freed.
+
+Tracking patches Object3D.add, so it must load after three.js and before
+the engine. It is off by default (stack capture is slow); enable it with
+?track=1 or resourceTracker.enable() before the objects of interest exist.
+*/
+
+// First stack frame outside three.js and this file, e.g. "World.createCoin (World.js:246)"
+function creationSite(stack) {
+    const lines = (stack || '').split('\n').slice(1);
+    for (const line of lines) {
+        if (line.includes('ResourceTracker.js') || line.includes('three.min.js') || line.includes('three.module.js')) continue;
+        const match = line.match(/at (?:(\S+) \()?(?:.*\/)?([^\/\s]+?):(\d+):\d+\)?$/);
+        if (match) return `${match[1] || '<anonymous>'} (${match[2]}:${match[3]})`;
+    }
+    return 'unknown';
+}
+
+class ResourceTracker {
+    constructor() {
+        this.enabled = false;
+        this.resources = new Map(); // resource -> { kind, site, generation, created }
+        this.generation = 0;
+        this.created = { geometry: 0, material: 0, texture: 0 };
+        this.disposed = { geometry: 0, material: 0, texture: 0 };
+        this.originalAdd = null;
+    }
+
+    enable() {
+        if (this.enabled) return this;
+        const tracker = this;
+        this.originalAdd = THREE.Object3D.prototype.add;
+        const originalAdd = this.originalAdd;
+        THREE.Object3D.prototype.add = function (...objects) {
+            // One stack per add() call covers the whole subtree being attached
+            const stack = new Error().stack;
+            for (const object of objects) {
+                if (object && object.traverse) object.traverse((child) => tracker.trackObject(child, stack));
+            }
+            return originalAdd.apply(this, objects);
+        };
+        this.enabled = true;
+        return this;
+    }
+
+    disable() {
+        if (!this.enabled) return this;
+        THREE.Object3D.prototype.add = this.originalAdd;
+        this.originalAdd = null;
+        this.enabled = false;
+        return this;
+    }
+
+    trackObject(object, stack) {
+        if (object.geometry) this.track(object.geometry, 'geometry', stack);
+        const materials = Array.isArray(object.material) ? object.material : [object.material];
+        for (const material of materials) {
+            if (!material) continue;
+            this.track(material, 'material', stack);
+            for (const key in material) {
+                const value = material[key];
+                if (value && value.isTexture) this.track(value, 'texture', stack);
+            }
+        }
+    }
+
+    // Register a resource; the first site that attaches it wins
+    track(resource, kind, stack = new Error().stack) {
+        if (this.resources.has(resource)) return resource;
+        this.resources.set(resource, {
+            kind: kind,
+            site: creationSite(stack),
+            generation: this.generation,
+            created: performance.now()
+        });
+        this.created[kind]++;
+        const onDispose = () => {
+            resource.removeEventListener('dispose', onDispose);
+            if (this.resources.delete(resource)) this.disposed[kind]++;
+        };
+        resource.addEventListener('dispose', onDispose);
+        return resource;
+    }
+
+    // Start a new generation; leaks() can then be limited to resources created after it
+    mark() {
+        return ++this.generation;
+    }
+
+    // Geometries, materials and textures currently referenced by the scene graph
+    reachable(root) {
+        const seen = new Set();
+        root.traverse((object) => {
+            if (object.geometry) seen.add(object.geometry);
+            const materials = Array.isArray(object.material) ? object.material : [object.material];
+            for (const material of materials) {
+                if (!material) continue;
+                seen.add(material);
+                for (const key in material) {
+                    if (material[key] && material[key].isTexture) seen.add(material[key]);
+                }
+            }
+        });
+        return seen;
+    }
+
+    // Live (undisposed) resources no longer reachable from root, grouped by kind + creation site
+    leaks(root = window.gameEngine.scene, sinceGeneration = 0) {
+        const reachable = this.reachable(root);
+        const groups = new Map();
+        for (const [resource, info] of this.resources) {
+            if (info.generation < sinceGeneration || reachable.has(resource)) continue;
+            const key = `${info.kind} ${info.site}`;
+            const group = groups.get(key) || { kind: info.kind, site: info.site, count: 0 };
+            group.count++;
+            groups.set(key, group);
+        }
+        return Array.from(groups.values()).sort((a, b) => b.count - a.count);
+    }
+
+    report(root = window.gameEngine.scene, sinceGeneration = 0) {
+        const live = { geometry: 0, material: 0, texture: 0 };
+        for (const info of this.resources.values()) live[info.kind]++;
+        return {
+            enabled: this.enabled,
+            generation: this.generation,
+            created: Object.assign({}, this.created),
+            disposed: Object.assign({}, this.disposed),
+            live: live,
+            leaks: this.leaks(root, sinceGeneration)
+        };
+    }
+}
+
+// Global tracker (GameEngine.disposeObject() releases what it tracks)
+window.ResourceTracker = ResourceTracker;
+window.resourceTracker = new ResourceTracker();
+if (new URLSearchParams(window.location.search).get('track') === '1') {
+    window.resourceTracker.enable();
+}
@@ -0,0 +1,506 @@
+/*
+ROBOQUEST INSTANCED SCENERY
+Trees and clouds drawn with one InstancedMesh per shared geometry/material:
+every trunk and branch is an instance of one tapered cylinder, every canopy
+and cloud puff an instance of one sphere, so the cost is a few draw calls
+however many trees there are. Bark and leaf textures are shared AssetManager
+textures. Per-instance matrices give each tree its own yaw and scale,
+per-instance colors tint bark and leaves for variety.
+
+Level of detail: each tree is drawn at full detail near the camera, as one
+merged low-poly mesh at mid range and as a textured cross-quad impostor far
+away; clouds go from sphere puffs to low-poly puffs to one camera-facing
+sprite. Anything outside the view frustum or past the end of the scene fog
+(where it is fully fogged anyway) is not drawn at all. Distances are measured
+from the camera's world position, so they follow the player under the camera
+rig. Tier distances come from SCENERY_LOD_TIERS; the QualityScaler picks the
+tier (or 'off' for benchmarks).
+*/
+
+// Tree parts relative to the tree origin (on the ground): position, Z rotation, scale
+const TREE_BARK_PARTS = [
+    { position: [0, 2, 0], rotationZ: 0, scale: [0.8, 4, 0.8] },                    // Trunk
+    { position: [-1.5, 3.5, 0.8], rotationZ: Math.PI / 5, scale: [0.35, 2.5, 0.35] }, // Branch 1
+    { position: [1.2, 4, -0.6], rotationZ: -Math.PI / 6, scale: [0.28, 2, 0.28] }     // Branch 2
+];
+const TREE_CANOPY_PARTS = [
+    { position: [0, 5.8, 0], radius: 2.4 },      // Main canopy
+    { position: [-2.3, 4.5, 1.2], radius: 1.3 }, // Branch 1 canopy
+    { position: [1.8, 4.8, -0.9], radius: 1.1 }  // Branch 2 canopy
+];
+const TREE_BOUNDS = { centerY: 4, radius: 5 }; // Bounding sphere of an unscaled tree
+const CLOUD_PUFFS = 4;
+const CLOUD_RADIUS = 7;                        // Bounding radius of a cloud (offsets + puff size)
+
+// Distances from the camera (world units): full detail up to near, low-poly up to mid,
+// impostors beyond; culled past the fog's far distance, where nothing is visible to pop out
+const SCENERY_LOD_TIERS = {
+    low:    { near: 25, mid: 70 },
+    medium: { near: 40, mid: 110 },
+    high:   { near: 70, mid: 180 },
+    off:    { near: Infinity, mid: Infinity, culling: false } // Everything full detail, no culling
+};
+
+const LOD_NEAR = 0;
+const LOD_MID = 1;
+const LOD_FAR = 2;
+const LOD_CULLED = 3;
+
+// One geometry from several (non-indexed), each optionally transformed and painted one vertex color
+function mergeGeometries(parts) {
+    const pieces = parts.map(part => {
+        const geometry = (part.geometry.index ? part.geometry.toNonIndexed() : part.geometry.clone());
+        if (part.matrix) geometry.applyMatrix4(part.matrix);
+        return { geometry: geometry, color: part.color ? new THREE.Color(part.color) : null };
+    });
+    const vertexCount = pieces.reduce((sum, piece) => sum + piece.geometry.attributes.position.count, 0);
+    const positions = new Float32Array(vertexCount * 3);
+    const normals = new Float32Array(vertexCount * 3);
+    const uvs = new Float32Array(vertexCount * 2);
+    const colors = new Float32Array(vertexCount * 3).fill(1);
+
+    let offset = 0;
+    pieces.forEach(({ geometry, color }) => {
+        const count = geometry.attributes.position.count;
+        positions.set(geometry.attributes.position.array, offset * 3);
+        normals.set(geometry.attributes.normal.array, offset * 3);
+        if (geometry.attributes.uv) uvs.set(geometry.attributes.uv.array, offset * 2);
+        if (color) {
+            for (let i = 0; i < count; i++) color.toArray(colors, (offset + i) * 3);
+        }
+        offset += count;
+        geometry.dispose();
+    });
+
+    const merged = new THREE.BufferGeometry();
+    merged.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+    merged.setAttribute('normal', new THREE.BufferAttribute(normals, 3));
+    merged.setAttribute('uv', new THREE.BufferAttribute(uvs, 2));
+    merged.setAttribute('color', new THREE.BufferAttribute(colors, 3));
+    return merged;
+}
+
+function impostorTexture(width, height, paint) {
+    const canvas = document.createElement('canvas');
+    canvas.width = width;
+    canvas.height = height;
+    paint(canvas.getContext('2d'), width, height);
+    return new THREE.CanvasTexture(canvas);
+}
+
+// Far-tree silhouette: trunk plus canopy blobs on a transparent background
+function paintTreeImpostor(ctx, width, height) {
+    ctx.fillStyle = '#8B4513';
+    ctx.fillRect(width * 0.44, height * 0.45, width * 0.12, height * 0.55);
+    ctx.fillStyle = '#2E8B2E';
+    [[0.5, 0.28, 0.3], [0.25, 0.43, 0.17], [0.74, 0.4, 0.15]].forEach(([x, y, r]) => {
+        ctx.beginPath();
+        ctx.arc(width * x, height * y, width * r, 0, Math.PI * 2);
+        ctx.fill();
+    });
+}
+
+// Far-cloud sprite: a few soft white blobs
+function paintCloudImpostor(ctx, width, height) {
+    [[0.5, 0.55, 0.3], [0.3, 0.6, 0.2], [0.7, 0.6, 0.22], [0.45, 0.4, 0.2]].forEach(([x, y, r]) => {
+        const gradient = ctx.createRadialGradient(width * x, height * y, 0, width * x, height * y, width * r);
+        gradient.addColorStop(0, 'rgba(255,255,255,1)');
+        gradient.addColorStop(0.7, 'rgba(255,255,255,0.8)');
+        gradient.addColorStop(1, 'rgba(255,255,255,0)');
+        ctx.fillStyle = gradient;
+        ctx.fillRect(0, 0, width, height);
+    });
+}
+
+// One InstancedMesh that doubles its capacity when full
+class InstancedBatch {
+    constructor(scene, geometry, material, capacity = 64) {
+        this.scene = scene;
+        this.geometry = geometry;
+        this.material = material;
+        this.count = 0;
+        this.castShadow = false;
+        this.receiveShadow = false;
+        this.mesh = this.createMesh(capacity);
+        this.scene.add(this.mesh);
+    }
+
+    createMesh(capacity) {
+        const mesh = new THREE.InstancedMesh(this.geometry, this.material, capacity);
+        mesh.instanceMatrix.setUsage(THREE.DynamicDrawUsage);
+        mesh.count = this.count;
+        mesh.visible = this.count > 0; // An empty batch would still cost a draw call
+        mesh.castShadow = this.castShadow;
+        mesh.receiveShadow = this.receiveShadow;
+        // The geometry's bounding sphere says nothing about where instances are
+        mesh.frustumCulled = false;
+        return mesh;
+    }
+
+    setShadows(cast, receive) {
+        this.castShadow = this.mesh.castShadow = cast;
+        this.receiveShadow = this.mesh.receiveShadow = receive;
+    }
+
+    grow() {
+        const old = this.mesh;
+        const mesh = this.createMesh(old.instanceMatrix.count * 2);
+        mesh.instanceMatrix.array.set(old.instanceMatrix.array);
+        if (old.instanceColor) {
+            mesh.setColorAt(0, new THREE.Color()); // Allocates instanceColor
+            mesh.instanceColor.array.set(old.instanceColor.array);
+        }
+        this.scene.remove(old);
+        old.dispose();
+        this.scene.add(mesh);
+        this.mesh = mesh;
+    }
+
+    add(matrix, color = null) {
+        if (this.count === this.mesh.instanceMatrix.count) this.grow();
+        const index = this.count++;
+        this.mesh.count = this.count;
+        this.mesh.visible = true;
+        this.mesh.setMatrixAt(index, matrix);
+        if (color) this.mesh.setColorAt(index, color);
+        this.mesh.instanceMatrix.needsUpdate = true;
+        if (this.mesh.instanceColor) this.mesh.instanceColor.needsUpdate = true;
+        return index;
+    }
+
+    setMatrixAt(index, matrix) {
+        this.mesh.setMatrixAt(index, matrix);
+        this.mesh.instanceMatrix.needsUpdate = true;
+    }
+
+    // Drop every instance (capacity is kept) before refilling
+    clear() {
+        this.count = 0;
+        this.mesh.count = 0;
+        this.mesh.visible = false;
+    }
+
+    dispose() {
+        this.scene.remove(this.mesh);
+        this.mesh.dispose();
+    }
+}
+
+class SceneryRenderer {
+    constructor(scene, assets = window.assetManager) {
+        this.scene = scene;
+        this.trees = [];
+        this.clouds = [];
+
+        const barkPartMatrices = TREE_BARK_PARTS.map(part => new THREE.Matrix4().compose(
+            new THREE.Vector3(...part.position),
+            new THREE.Quaternion().setFromEuler(new THREE.Euler(0, 0, part.rotationZ)),
+            new THREE.Vector3(...part.scale)
+        ));
+        const canopyPartMatrices = TREE_CANOPY_PARTS.map(part => new THREE.Matrix4().compose(
+            new THREE.Vector3(...part.position),
+            new THREE.Quaternion(),
+            new THREE.Vector3(part.radius, part.radius, part.radius)
+        ));
+
+        const barkLow = new THREE.CylinderGeometry(0.625, 1, 1, 5, 1, true);
+        const canopyLow = new THREE.IcosahedronGeometry(1, 0);
+        const crossQuad = [0, Math.PI / 2].map(yaw => ({
+            geometry: new THREE.PlaneGeometry(7, 8),
+            matrix: new THREE.Matrix4().makeRotationY(yaw).setPosition(0, 4, 0)
+        }));
+        this.geometries = {
+            bark: new THREE.CylinderGeometry(0.625, 1, 1, 8), // Unit height; top/bottom matches the trunk taper
+            canopy: new THREE.SphereGeometry(1, 12, 8),
+            // Mid tier: the whole tree in one vertex-colored low-poly mesh
+            treeLow: mergeGeometries([
+                ...barkPartMatrices.map(matrix => ({ geometry: barkLow, matrix: matrix, color: 0x8B4513 })),
+                ...canopyPartMatrices.map(matrix => ({ geometry: canopyLow, matrix: matrix, color: 0x32CD32 }))
+            ]),
+            // Far tier: two crossed quads, view-independent so instances never need re-orienting
+            treeImpostor: mergeGeometries(crossQuad),
+            cloud: new THREE.SphereGeometry(1, 8, 8),
+            cloudLow: new THREE.IcosahedronGeometry(1, 0),
+            cloudImpostor: new THREE.PlaneGeometry(2, 1.2)
+        };
+        barkLow.dispose();
+        canopyLow.dispose();
+        crossQuad.forEach(part => part.geometry.dispose());
+
+        this.assets = assets;
+        const barkTexture = assets.texture('bark');
+        const leafTexture = assets.texture('leaves');
+        ['bark', 'leaves'].forEach(key => assets.load(key).promise.then((entry) => {
+            if (entry.state === 'loaded') performance.mark(`rq:texture-loaded:${key}`);
+        }));
+        this.impostorTextures = {
+            tree: impostorTexture(64, 128, paintTreeImpostor),
+            cloud: impostorTexture(128, 64, paintCloudImpostor)
+        };
+
+        // White base colors: the per-instance tint is the actual color
+        this.materials = {
+            bark: new THREE.MeshLambertMaterial({ map: barkTexture }),
+            leaves: new THREE.MeshLambertMaterial({ map: leafTexture, emissive: 0x0a1f0a }),
+            treeLow: new THREE.MeshLambertMaterial({ vertexColors: true, flatShading: true }),
+            treeImpostor: new THREE.MeshLambertMaterial({
+                map: this.impostorTextures.tree, alphaTest: 0.5, side: THREE.DoubleSide
+            }),
+            cloud: new THREE.MeshLambertMaterial({ color: 0xffffff, transparent: true, opacity: 0.8 }),
+            cloudImpostor: new THREE.MeshBasicMaterial({
+                map: this.impostorTextures.cloud, transparent: true, opacity: 0.8, depthWrite: false
+            })
+        };
+
+        // One batch per tier and part; only the near tier casts shadows
+        this.bark = new InstancedBatch(scene, this.geometries.bark, this.materials.bark, 128);
+        this.bark.setShadows(true, false);
+        this.canopies = new InstancedBatch(scene, this.geometries.canopy, this.materials.leaves, 128);
+        this.canopies.setShadows(true, true);
+        this.treesLow = new InstancedBatch(scene, this.geometries.treeLow, this.materials.treeLow, 64);
+        this.treeImpostors = new InstancedBatch(scene, this.geometries.treeImpostor, this.materials.treeImpostor, 64);
+        this.cloudPuffs = new InstancedBatch(scene, this.geometries.cloud, this.materials.cloud, 64);
+        this.cloudPuffsLow = new InstancedBatch(scene, this.geometries.cloudLow, this.materials.cloud, 64);
+        this.cloudImpostors = new InstancedBatch(scene, this.geometries.cloudImpostor, this.materials.cloudImpostor, 16);
+        this.batches = [
+            this.bark, this.canopies, this.treesLow, this.treeImpostors,
+            this.cloudPuffs, this.cloudPuffsLow, this.cloudImpostors
+        ];
+
+        // Local matrices of the tree parts, composed once
+        this.barkParts = barkPartMatrices;
+        this.canopyParts = canopyPartMatrices;
+
+        this.barkColor = new THREE.Color(0x8B4513);
+        this.leafColor = new THREE.Color(0x32CD32);
+
+        // LOD state: trees are re-sorted into tiers only when the camera has moved
+        this.fogFar = scene.fog ? scene.fog.far : Infinity;
+        this.lodCounts = [0, 0, 0, 0];
+        this.onCastersChanged = null; // Called when trees enter or leave the shadow-casting near tier
+        this.lodDirty = true;
+        this.lodCameraPosition = new THREE.Vector3(Infinity, 0, 0);
+        this.lodCameraQuaternion = new THREE.Quaternion();
+        this.cameraPosition = new THREE.Vector3();      // Camera world transform (it is parented to the rig)
+        this.cameraQuaternion = new THREE.Quaternion();
+        this.frustum = new THREE.Frustum();
+        this.viewProjection = new THREE.Matrix4();
+        this.sphere = new THREE.Sphere();
+        this.setLodTier('high'); // Until QualityScaler.apply()
+
+        // Scratch objects reused for every instance
+        this.treeMatrix = new THREE.Matrix4();
+        this.partMatrix = new THREE.Matrix4();
+        this.position = new THREE.Vector3();
+        this.quaternion = new THREE.Quaternion();
+        this.scale = new THREE.Vector3();
+        this.yAxis = new THREE.Vector3(0, 1, 0);
+        this.color = new THREE.Color();
+    }
+
+    get treeCount() {
+        return this.trees.length;
+    }
+
+    // Switch LOD distances; culling stays at the fog's far distance
+    setLodTier(name) {
+        const tier = SCENERY_LOD_TIERS[name];
+        if (!tier) {
+            console.warn(`⚠️ Unknown scenery LOD tier: ${name}`);
+            return;
+        }
+        this.lodTierName = name;
+        this.lodTier = tier;
+        this.nearSq = tier.near * tier.near;
+        this.midSq = tier.mid * tier.mid;
+        this.culling = tier.culling !== false;
+        this.cullSq = this.culling ? this.fogFar * this.fogFar : Infinity;
+        this.lodDirty = true;
+    }
+
+    // Tree with its base at (x, y, z); yaw and scale are randomized unless given
+    addTree(x, y, z, yaw = Math.random() * Math.PI * 2, size = 0.85 + Math.random() * 0.3) {
+        const tree = {
+            matrix: new THREE.Matrix4().compose(
+                new THREE.Vector3(x, y, z),
+                new THREE.Quaternion().setFromAxisAngle(new THREE.Vector3(0, 1, 0), yaw),
+                new THREE.Vector3(size, size, size)
+            ),
+            center: new THREE.Vector3(x, y + TREE_BOUNDS.centerY * size, z),
+            radius: TREE_BOUNDS.radius * size,
+            barkColor: this.barkColor.clone().offsetHSL(0, 0, (Math.random() - 0.5) * 0.08),
+            leafColor: this.leafColor.clone().offsetHSL((Math.random() - 0.5) * 0.06, 0, (Math.random() - 0.5) * 0.1),
+            shade: new THREE.Color().setScalar(0.92 + Math.random() * 0.16), // Low tiers are vertex-colored: vary brightness
+            tier: -1
+        };
+        this.trees.push(tree);
+        this.lodDirty = true;
+        return tree;
+    }
+
+    removeTree(tree) {
+        const index = this.trees.indexOf(tree);
+        if (index === -1) return;
+        this.trees[index] = this.trees[this.trees.length - 1];
+        this.trees.pop();
+        this.lodDirty = true;
+        if (tree.tier === LOD_NEAR && this.onCastersChanged) this.onCastersChanged();
+    }
+
+    addCloud(x, y, z) {
+        const cloud = {
+            position: new THREE.Vector3(x, y, z),
+            driftSpeed: Math.random() * 0.5 + 0.2,
+            bobSpeed: Math.random() * 0.5 + 0.5,
+            bobAmount: Math.random() * 1 + 0.5,
+            puffs: []
+        };
+        for (let i = 0; i < CLOUD_PUFFS; i++) {
+            cloud.puffs.push({
+                offset: new THREE.Vector3(
+                    (Math.random() - 0.5) * 6,
+                    (Math.random() - 0.5) * 2,
+                    (Math.random() - 0.5) * 6
+                ),
+                radius: Math.random() * 2 + 1
+            });
+        }
+        this.clouds.push(cloud);
+        return cloud;
+    }
+
+    puffMatrix(cloud, puff) {
+        return this.partMatrix
+            .makeScale(puff.radius, puff.radius, puff.radius)
+            .setPosition(this.position.copy(cloud.position).add(puff.offset));
+    }
+
+    // Tier of a bounding sphere seen from the camera (all near without a camera)
+    classify(center, radius, camera) {
+        if (!camera) return LOD_NEAR;
+        const distanceSq = center.distanceToSquared(this.cameraPosition);
+        if (distanceSq > this.cullSq) return LOD_CULLED;
+        if (this.culling && !this.frustum.intersectsSphere(this.sphere.set(center, radius))) {
+            return LOD_CULLED;
+        }
+        if (distanceSq <= this.nearSq) return LOD_NEAR;
+        return distanceSq <= this.midSq ? LOD_MID : LOD_FAR;
+    }
+
+    // Re-sort trees into tier batches when the camera moved or turned (or trees changed)
+    updateTrees(camera) {
+        if (camera) {
+            const moved = this.lodCameraPosition.distanceToSquared(this.cameraPosition) > 0.25;
+            const turned = this.lodCameraQuaternion.angleTo(this.cameraQuaternion) > 0.02;
+            if (!moved && !turned && !this.lodDirty) return;
+            this.lodCameraPosition.copy(this.cameraPosition);
+            this.lodCameraQuaternion.copy(this.cameraQuaternion);
+        } else if (!this.lodDirty) {
+            return;
+        }
+        this.lodDirty = false;
+
+        this.bark.clear();
+        this.canopies.clear();
+        this.treesLow.clear();
+        this.treeImpostors.clear();
+        this.lodCounts.fill(0);
+
+        // Only near trees cast into the (cached) shadow map
+        let castersChanged = false;
+        this.trees.forEach(tree => {
+            const tier = this.classify(tree.center, tree.radius, camera);
+            if ((tree.tier === LOD_NEAR) !== (tier === LOD_NEAR)) castersChanged = true;
+            tree.tier = tier;
+            this.lodCounts[tier]++;
+            if (tier === LOD_NEAR) {
+                this.barkParts.forEach(part => {
+                    this.bark.add(this.partMatrix.multiplyMatrices(tree.matrix, part), tree.barkColor);
+                });
+                this.canopyParts.forEach(part => {
+                    this.canopies.add(this.partMatrix.multiplyMatrices(tree.matrix, part), tree.leafColor);
+                });
+            } else if (tier === LOD_MID) {
+                this.treesLow.add(tree.matrix, tree.shade);
+            } else if (tier === LOD_FAR) {
+                this.treeImpostors.add(tree.matrix, tree.shade);
+            }
+        });
+        if (castersChanged && this.onCastersChanged) this.onCastersChanged();
+    }
+
+    // Clouds move every frame, so their batches are refilled every frame
+    updateClouds(camera) {
+        this.cloudPuffs.clear();
+        this.cloudPuffsLow.clear();
+        this.cloudImpostors.clear();
+
+        for (let i = 0; i < this.clouds.length; i++) {
+            const cloud = this.clouds[i];
+            const tier = this.classify(cloud.position, CLOUD_RADIUS, camera);
+            if (tier === LOD_NEAR || tier === LOD_MID) {
+                const batch = tier === LOD_NEAR ? this.cloudPuffs : this.cloudPuffsLow;
+                for (let p = 0; p < cloud.puffs.length; p++) batch.add(this.puffMatrix(cloud, cloud.puffs[p]));
+            } else if (tier === LOD_FAR) {
+                this.cloudImpostors.add(this.partMatrix.compose(
+                    cloud.position, this.cameraQuaternion, this.scale.set(CLOUD_RADIUS, CLOUD_RADIUS, CLOUD_RADIUS)
+                ));
+            }
+        }
+    }
+
+    // Drift and bob the clouds (the only animated scenery), then pick LOD tiers for this view
+    update(deltaTime, camera = null) {
+        const now = Date.now() * 0.001;
+        for (let i = 0; i < this.clouds.length; i++) {
+            const cloud = this.clouds[i];
+            cloud.position.x += cloud.driftSpeed * deltaTime;
+            cloud.position.y += Math.sin(now * cloud.bobSpeed) * cloud.bobAmount * deltaTime;
+
+            // Reset position if drifted too far
+            if (cloud.position.x > 120) {
+                cloud.position.x = -120;
+            }
+        }
+
+        if (camera) {
+            // The controller moved the rig this frame and render hasn't run yet: refresh the whole chain
+            camera.updateWorldMatrix(true, false);
+            camera.getWorldPosition(this.cameraPosition);
+            camera.getWorldQuaternion(this.cameraQuaternion);
+            this.viewProjection.multiplyMatrices(camera.projectionMatrix, camera.matrixWorldInverse);
+            this.frustum.setFromProjectionMatrix(this.viewProjection);
+        }
+        this.updateTrees(camera);
+        this.updateClouds(camera);
+    }
+
+    dispose() {
+        this.batches.forEach(batch => batch.dispose());
+        Object.values(this.geometries).forEach(geometry => geometry.dispose());
+        Object.values(this.materials).forEach(material => {
+            if (material.map && material.map.userData.assetUrl) this.assets.release(material.map);
+            material.dispose();
+        });
+        Object.values(this.impostorTextures).forEach(texture => texture.dispose());
+    }
+
+    getDebugInfo() {
+        return {
+            trees: this.trees.length,
+            clouds: this.clouds.length,
+            lodTier: this.lodTierName,
+            treesNear: this.lodCounts[LOD_NEAR],
+            treesMid: this.lodCounts[LOD_MID],
+            treesFar: this.lodCounts[LOD_FAR],
+            treesCulled: this.lodCounts[LOD_CULLED],
+            instances: this.batches.reduce((sum, batch) => sum + batch.count, 0),
+            drawCalls: this.batches.filter(batch => batch.count > 0).length
+        };
+    }
+}
+
+SceneryRenderer.LOD_TIERS = SCENERY_LOD_TIERS;
+
+window.InstancedBatch = InstancedBatch;
+window.SceneryRenderer = SceneryRenderer;
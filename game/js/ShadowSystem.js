@@ -0,0 +1,206 @@
+/*
+ROBOQUEST SHADOW SYSTEM
+The sun's shadow map covers only the region around the player and is cached:
+it is re-rendered when the fitted region moves to the next snap cell or a
+static caster is added, removed or changes LOD, not every frame. Only static
+geometry (platforms, near trees) casts into it. Dynamic objects (the robot,
+moving platforms, collectibles) get blob shadows instead: one instanced draw
+of soft dark discs placed on the surface below each object by a physics ray.
+*/
+
+class ShadowSystem {
+    constructor(renderer, scene, light, world, config = {}) {
+        this.renderer = renderer;
+        this.scene = scene;
+        this.light = light;
+        this.world = world;
+        this.config = Object.assign({
+            extent: 50,         // Half-size of the fitted shadow frustum (world units)
+            snap: 10,           // The frustum moves in steps of this, so the cached map stays valid between steps
+            mapSize: 1024,      // Texel density matches the old 2048 map over 200 units
+            blobCapacity: 64,
+            blobOpacity: 0.45,
+            blobFadeHeight: 15  // Blobs shrink with height above the surface and vanish past this
+        }, config);
+
+        // Cached map: the renderer only redraws it when needsUpdate is set
+        this.renderer.shadowMap.autoUpdate = false;
+        this.renderer.shadowMap.needsUpdate = true;
+        this.invalidations = 0;
+
+        this.lightOffset = light.position.clone(); // Sun direction and distance from the fitted center
+        this.center = new THREE.Vector3(Infinity, 0, Infinity);
+        const shadow = light.shadow;
+        shadow.mapSize.set(this.config.mapSize, this.config.mapSize);
+        shadow.camera.near = 1;
+        shadow.camera.far = this.lightOffset.length() + this.config.extent * 2;
+        shadow.camera.left = -this.config.extent;
+        shadow.camera.right = this.config.extent;
+        shadow.camera.top = this.config.extent;
+        shadow.camera.bottom = -this.config.extent;
+        shadow.camera.updateProjectionMatrix();
+        scene.add(light.target);
+
+        this.blobs = [];
+        this.blobMesh = this.createBlobMesh();
+        scene.add(this.blobMesh);
+
+        // Ray scratch for surface probes
+        this.rayFrom = new CANNON.Vec3();
+        this.rayTo = new CANNON.Vec3();
+        this.rayResult = new CANNON.RaycastResult();
+        this.blobMatrix = new THREE.Matrix4();
+    }
+
+    createBlobMesh() {
+        const canvas = document.createElement('canvas');
+        canvas.width = 64;
+        canvas.height = 64;
+        const ctx = canvas.getContext('2d');
+        const gradient = ctx.createRadialGradient(32, 32, 0, 32, 32, 32);
+        gradient.addColorStop(0, 'rgba(0,0,0,1)');
+        gradient.addColorStop(0.6, 'rgba(0,0,0,0.6)');
+        gradient.addColorStop(1, 'rgba(0,0,0,0)');
+        ctx.fillStyle = gradient;
+        ctx.fillRect(0, 0, 64, 64);
+
+        const geometry = new THREE.PlaneGeometry(2, 2).rotateX(-Math.PI / 2); // Unit radius, lying flat
+        const material = new THREE.MeshBasicMaterial({
+            map: new THREE.CanvasTexture(canvas),
+            color: 0x000000,
+            transparent: true,
+            opacity: this.config.blobOpacity,
+            depthWrite: false,
+            polygonOffset: true,   // Sit on the surface without z-fighting
+            polygonOffsetFactor: -1,
+            polygonOffsetUnits: -4
+        });
+        const mesh = new THREE.InstancedMesh(geometry, material, this.config.blobCapacity);
+        mesh.instanceMatrix.setUsage(THREE.DynamicDrawUsage);
+        mesh.frustumCulled = false;
+        mesh.count = 0;
+        return mesh;
+    }
+
+    // The cached shadow map is stale: redraw it on the next render
+    invalidate() {
+        this.renderer.shadowMap.needsUpdate = true;
+        this.invalidations++;
+    }
+
+    // Quality tier: shadow map resolution, or no shadow map at all (blob shadows only)
+    setQuality(enabled, mapSize) {
+        const shadow = this.light.shadow;
+        if (mapSize !== this.config.mapSize) {
+            this.config.mapSize = mapSize;
+            shadow.mapSize.set(mapSize, mapSize);
+            if (shadow.map) {
+                shadow.map.dispose(); // Reallocated at the new size by the next shadow pass
+                shadow.map = null;
+            }
+        }
+        if (enabled !== this.renderer.shadowMap.enabled) {
+            this.renderer.shadowMap.enabled = enabled;
+            this.light.castShadow = enabled;
+            // Lit materials compile shadow sampling in or out
+            this.scene.traverse((child) => {
+                const materials = Array.isArray(child.material) ? child.material : [child.material];
+                materials.forEach(material => { if (material) material.needsUpdate = true; });
+            });
+        }
+        this.invalidate();
+    }
+
+    // Register a dynamic object; bottom is the distance from its origin down to its underside.
+    // probeOnce: the object never moves horizontally, so the surface below is looked up once.
+    // Keep the returned record to remove the blob again
+    addBlob(object, radius, bottom = 0, probeOnce = false) {
+        const blob = { object, radius, bottom, probeOnce, surfaceY: null, index: this.blobs.length };
+        this.blobs.push(blob);
+        return blob;
+    }
+
+    // O(1): swap the last blob into the freed slot. Records of another (disposed) system are ignored
+    removeBlob(blob) {
+        if (this.blobs[blob.index] !== blob) return;
+        const last = this.blobs.pop();
+        if (last !== blob) {
+            this.blobs[blob.index] = last;
+            last.index = blob.index;
+        }
+    }
+
+    // Height of the first physics surface below the object's underside (null over the void)
+    probeSurface(blob) {
+        if (!this.world) return null;
+        const position = blob.object.position;
+        this.rayFrom.set(position.x, position.y - blob.bottom - 0.05, position.z);
+        this.rayTo.set(position.x, position.y - blob.bottom - this.config.blobFadeHeight, position.z);
+        this.rayResult.reset();
+        if (!this.world.raycastClosest(this.rayFrom, this.rayTo, { skipBackfaces: true }, this.rayResult)) {
+            return null;
+        }
+        return this.rayResult.hitPointWorld.y;
+    }
+
+    // Snap the shadow frustum around the focus point; moving to a new cell invalidates the map
+    fit(focus) {
+        const snap = this.config.snap;
+        const x = Math.round(focus.x / snap) * snap;
+        const z = Math.round(focus.z / snap) * snap;
+        if (x === this.center.x && z === this.center.z) return;
+
+        this.center.set(x, 0, z);
+        this.light.position.copy(this.center).add(this.lightOffset);
+        this.light.target.position.copy(this.center);
+        this.light.target.updateMatrixWorld();
+        this.invalidate();
+    }
+
+    updateBlobs() {
+        let count = 0;
+        for (const blob of this.blobs) {
+            if (!blob.probeOnce || blob.surfaceY === null) blob.surfaceY = this.probeSurface(blob);
+            if (blob.surfaceY === null || !blob.object.visible) continue;
+
+            const position = blob.object.position;
+            const height = position.y - blob.bottom - blob.surfaceY;
+            const scale = blob.radius * Math.max(0.3, 1 - height / this.config.blobFadeHeight);
+            if (height > this.config.blobFadeHeight || count === this.config.blobCapacity) continue;
+
+            this.blobMatrix.makeScale(scale, 1, scale).setPosition(position.x, blob.surfaceY + 0.02, position.z);
+            this.blobMesh.setMatrixAt(count++, this.blobMatrix);
+        }
+        this.blobMesh.count = count;
+        this.blobMesh.visible = count > 0;
+        this.blobMesh.instanceMatrix.needsUpdate = true;
+    }
+
+    // Once per frame before rendering
+    update(focus) {
+        if (focus) this.fit(focus);
+        this.updateBlobs();
+    }
+
+    dispose() {
+        this.scene.remove(this.blobMesh);
+        this.blobMesh.geometry.dispose();
+        this.blobMesh.material.map.dispose();
+        this.blobMesh.material.dispose();
+        this.blobMesh.dispose();
+        this.blobs = [];
+    }
+
+    getDebugInfo() {
+        return {
+            center: { x: this.center.x, z: this.center.z },
+            extent: this.config.extent,
+            mapSize: this.config.mapSize,
+            enabled: this.renderer.shadowMap.enabled,
+            invalidations: this.invalidations,
+            blobs: this.blobMesh.count
+        };
+    }
+}
+
+window.ShadowSystem = ShadowSystem;
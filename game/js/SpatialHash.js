@@ -0,0 +1,111 @@
+/*
+ROBOQUEST SPATIAL HASH
+Uniform-grid index for collectibles and other trigger volumes. Items live in
+the cell containing their center; a query visits only the cells its sphere
+(grown by the largest item radius) overlaps, so its cost depends on local
+density, not on how many items the level holds. Moving an item within its
+cell is a coordinate write; removal is a swap-remove from the cell array.
+*/
+
+// Cell coordinates are packed into one exact integer key (|cell| < 2^16 per axis)
+const CELL_OFFSET = 65536;
+const CELL_SPAN = 131072;
+
+class SpatialHash {
+    constructor(cellSize = 4) {
+        this.cellSize = cellSize;
+        this.inverseCellSize = 1 / cellSize;
+        this.cells = new Map(); // key -> array of handles
+        this.count = 0;
+        this.maxRadius = 0;
+    }
+
+    cellCoord(value) {
+        return Math.floor(value * this.inverseCellSize);
+    }
+
+    key(cx, cy, cz) {
+        return ((cx + CELL_OFFSET) * CELL_SPAN + (cy + CELL_OFFSET)) * CELL_SPAN + (cz + CELL_OFFSET);
+    }
+
+    // Index an item at position with a trigger radius; returns its handle
+    insert(item, position, radius = 0) {
+        const handle = { item: item, x: position.x, y: position.y, z: position.z, radius: radius, key: 0, slot: 0 };
+        if (radius > this.maxRadius) this.maxRadius = radius;
+        this.addToCell(handle);
+        this.count++;
+        return handle;
+    }
+
+    addToCell(handle) {
+        handle.key = this.key(this.cellCoord(handle.x), this.cellCoord(handle.y), this.cellCoord(handle.z));
+        let cell = this.cells.get(handle.key);
+        if (!cell) {
+            cell = [];
+            this.cells.set(handle.key, cell);
+        }
+        handle.slot = cell.length;
+        cell.push(handle);
+    }
+
+    removeFromCell(handle) {
+        const cell = this.cells.get(handle.key);
+        const last = cell.pop();
+        if (last !== handle) {
+            cell[handle.slot] = last;
+            last.slot = handle.slot;
+        }
+        if (cell.length === 0) this.cells.delete(handle.key);
+    }
+
+    // Move an item; only re-buckets when it crosses into another cell
+    update(handle, position) {
+        handle.x = position.x;
+        handle.y = position.y;
+        handle.z = position.z;
+        const key = this.key(this.cellCoord(handle.x), this.cellCoord(handle.y), this.cellCoord(handle.z));
+        if (key !== handle.key) {
+            this.removeFromCell(handle);
+            this.addToCell(handle);
+        }
+    }
+
+    remove(handle) {
+        this.removeFromCell(handle);
+        this.count--;
+    }
+
+    clear() {
+        this.cells.clear();
+        this.count = 0;
+        this.maxRadius = 0;
+    }
+
+    // Items whose trigger sphere overlaps the query sphere, appended to out
+    query(position, radius, out = []) {
+        const reach = radius + this.maxRadius;
+        const minX = this.cellCoord(position.x - reach), maxX = this.cellCoord(position.x + reach);
+        const minY = this.cellCoord(position.y - reach), maxY = this.cellCoord(position.y + reach);
+        const minZ = this.cellCoord(position.z - reach), maxZ = this.cellCoord(position.z + reach);
+
+        for (let cx = minX; cx <= maxX; cx++) {
+            for (let cy = minY; cy <= maxY; cy++) {
+                for (let cz = minZ; cz <= maxZ; cz++) {
+                    const cell = this.cells.get(this.key(cx, cy, cz));
+                    if (!cell) continue;
+                    for (let i = 0; i < cell.length; i++) {
+                        const handle = cell[i];
+                        const dx = handle.x - position.x;
+                        const dy = handle.y - position.y;
+                        const dz = handle.z - position.z;
+                        const limit = radius + handle.radius;
+                        if (dx * dx + dy * dy + dz * dz < limit * limit) out.push(handle);
+                    }
+                }
+            }
+        }
+        return out;
+    }
+}
+
+window.SpatialHash = SpatialHash;
@@ -0,0 +1,100 @@
+/*
+ROBOQUEST FRAME TELEMETRY
+Per-frame ring buffer of timing samples that the test harness drains
+*/
+
+class Telemetry {
+    constructor(capacity = 4096) {
+        this.capacity = capacity;
+
+        // Column name -> Float32Array ring (one value per frame)
+        this.columns = {};
+        this.current = {};
+
+        this.head = 0;        // Next frame slot to write
+        this.count = 0;       // Frames written since last drain (capped at capacity)
+        this.dropped = 0;     // Frames overwritten before the harness drained them
+        this.totalFrames = 0;
+        this.longFrameMs = 50; // Frames above this are recorded as performance measures
+
+        this.addColumn('frameMs'); // CPU time spent inside the frame callback
+        this.addColumn('deltaMs'); // Wall time since previous frame
+        this.addColumn('timestamp');
+    }
+
+    addColumn(name) {
+        if (!this.columns[name]) {
+            this.columns[name] = new Float32Array(this.capacity);
+            this.current[name] = 0;
+        }
+        return this.columns[name];
+    }
+
+    // Stage a value for the frame currently being recorded
+    set(name, value) {
+        if (this.current[name] === undefined) this.addColumn(name);
+        this.current[name] = value;
+    }
+
+    endFrame(frameMs, deltaMs) {
+        this.current.frameMs = frameMs;
+        this.current.deltaMs = deltaMs;
+        this.current.timestamp = performance.now();
+
+        // Hitches show up on the DevTools timeline and in the stutter report
+        if (frameMs > this.longFrameMs) {
+            performance.measure('rq:long-frame', {
+                start: this.current.timestamp - frameMs,
+                end: this.current.timestamp
+            });
+        }
+
+        const slot = this.head;
+        for (const name in this.columns) {
+            this.columns[name][slot] = this.current[name];
+        }
+
+        this.head = (slot + 1) % this.capacity;
+        if (this.count < this.capacity) {
+            this.count++;
+        } else {
+            this.dropped++;
+        }
+        this.totalFrames++;
+    }
+
+    // Return frames recorded since the last drain (oldest first) and reset
+    drain() {
+        const start = (this.head - this.count + this.capacity) % this.capacity;
+        const result = { frames: this.count, dropped: this.dropped, columns: {} };
+
+        for (const name in this.columns) {
+            const column = this.columns[name];
+            const values = new Array(this.count);
+            for (let i = 0; i < this.count; i++) {
+                values[i] = column[(start + i) % this.capacity];
+            }
+            result.columns[name] = values;
+        }
+
+        this.count = 0;
+        this.dropped = 0;
+        return result;
+    }
+
+    // Most recent value of a column without draining
+    latest(name) {
+        if (this.totalFrames === 0 || !this.columns[name]) return 0;
+        return this.columns[name][(this.head - 1 + this.capacity) % this.capacity];
+    }
+
+    reset() {
+        this.head = 0;
+        this.count = 0;
+        this.dropped = 0;
+    }
+}
+
+// Global telemetry instance (read by GameEngine and the test harness)
+window.Telemetry = Telemetry;
+window.gameTelemetry = new Telemetry();
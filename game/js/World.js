@@ -1,8 +1,23 @@
 /*
 ROBOQUEST 3D WORLD
-Colorful, vibrant world generation inspired by Astro Bot
+Colorful, vibrant world generation inspired by Astro Bot.
+Level content comes from compiled binary levels (level_tools/level_compiler.py)
+and is registered with a WorldStreamer, which builds it chunk by chunk around
+the player; only the ground and the drifting clouds belong to no level.
 */
 
+const WORLD_SIZE = 200;                 // Ground extent; the grass texture repeats 20x across it
+const WORLD_SPAWN = { x: 0, z: 0 };     // Chunks around it are built before the first frame
+const BASE_LEVEL_URL = 'levels/level1.rql';
+
+// Binary level layout (see level_compiler.py): 20-byte header, float32 sections, uint8 sections
+const LEVEL_MAGIC = 0x564C5152;         // 'RQLV' read as a little-endian uint32
+const LEVEL_VERSION = 1;
+const LEVEL_HEADER_BYTES = 20;
+const LEVEL_MATERIALS = ['platform', 'platformAlt', 'platformSpecial'];
+const LEVEL_COLLECTIBLES = ['coin', 'gem'];
+const LEVEL_FLAG_MOVING = 1;
+
 class World {
     constructor(gameEngine) {
         this.gameEngine = gameEngine;
@@ -11,25 +26,52 @@ class World {
         
         // World objects
         this.platforms = [];
+        this.movingPlatforms = [];                  // Subset of platforms animated every step
         this.collectibles = [];
-        this.decorations = [];
+        this.collectibleIndex = new SpatialHash(4); // Pickup queries touch only nearby cells
+        this.collectibleHits = [];                  // Reused query result array
+        this.collected = [];                        // Reused pickup result array
+        
+        // Chunked streaming: content is built near the player and freed when left behind
+        this.streamer = new WorldStreamer();
+        this.streamer.onChunkUnloaded = (chunk) => this.removeClusters(chunk.cx, chunk.cz);
+        
+        // Static platforms and ground tiles share one compound physics body per chunk, so
+        // the broadphase sees a few clusters instead of every platform
+        this.staticClusters = new Map(); // 'group:cx,cz' -> CANNON.Body
+        this.clusterSize = this.streamer.chunkSize;
+        this.platformGroup = 'base';     // 'level' once the base world exists; reset() drops those
+        
+        // Trees and clouds (instanced, a few draw calls for the whole forest)
+        this.scenery = new SceneryRenderer(this.scene);
+        this.scenery.onCastersChanged = () => this.gameEngine.shadows.invalidate();
         
         // Materials library
         this.materials = this.createMaterials();
+        this.sharedMaterials = new Set(Object.values(this.materials)); // Never disposed with a mesh
         
         this.generateWorld();
+        this.platformGroup = 'level';
+        
+        // Ground under the spawn point now; the rest streams in over the next frames
+        this.streamer.update(WORLD_SPAWN);
+        
+        // The base level (level 1) stays loaded under every later level; reset() re-adds its collectibles
+        this.baseLevel = null;
+        this.ready = this.fetchLevel(BASE_LEVEL_URL).then(level => {
+            this.loadLevelData(level, 'base');
+            this.baseLevel = level;
+        }).catch(error => console.error('❌ Base level failed to load:', error));
     }
     
     createMaterials() {
         console.log('🎨 TEXTURE STEP 2: Creating textured platform materials...');
         
-        const textureLoader = new THREE.TextureLoader();
-        
         return {
-            // Platform materials with textures (Astro Bot style)
-            platform: this.createTexturedPlatformMaterial(textureLoader, 0x50E3C2, 'cyan'),
-            platformAlt: this.createTexturedPlatformMaterial(textureLoader, 0xF5A623, 'orange'),
-            platformSpecial: this.createTexturedPlatformMaterial(textureLoader, 0xFF6B9D, 'pink'),
+            // Platform materials with textures (Astro Bot style), all tinting one shared brick texture
+            platform: this.createTexturedPlatformMaterial(0x50E3C2),
+            platformAlt: this.createTexturedPlatformMaterial(0xF5A623),
+            platformSpecial: this.createTexturedPlatformMaterial(0xFF6B9D),
             
             // Collectible materials
             coin: new THREE.MeshLambertMaterial({ 
@@ -64,149 +106,155 @@ class World {
     
     generateWorld() {
         this.createGround();
-        this.createStartingArea();
-        this.createFloatingPlatforms();
-        this.createCollectibles();
-        this.createDecorations();
+        this.createClouds();
         this.createBoundaries();
     }
     
     createGround() {
-        console.log('🎨 TEXTURE STEP 1: Creating textured ground...');
-        
-        // Create textured ground material
-        const textureLoader = new THREE.TextureLoader();
-        
-        // Load grass texture from web (free texture). If it fails, continue without map.
-        let grassTexture = null;
-        try {
-            grassTexture = textureLoader.load(
-                'https://threejs.org/examples/textures/terrain/grasslight-big.jpg',
-                () => console.log('✅ Grass texture loaded successfully'),
-                undefined,
-                (error) => {
-                    console.warn('⚠️ Grass texture failed, using color-only material');
-                }
-            );
-        } catch (e) {
-            console.warn('⚠️ Grass texture load threw synchronously, proceeding without it');
+        // One tile per chunk, sharing geometry and material. The grass texture repeats
+        // 20x over the whole ground, so each tile's UVs cover only its share of it
+        const size = this.streamer.chunkSize;
+        this.groundGeometry = new THREE.PlaneGeometry(size, size);
+        const uv = this.groundGeometry.attributes.uv;
+        for (let i = 0; i < uv.count; i++) {
+            uv.setXY(i, uv.getX(i) * size / WORLD_SIZE, uv.getY(i) * size / WORLD_SIZE);
         }
+        this.groundMaterial = new THREE.MeshLambertMaterial({
+            color: 0x90EE90,
+            map: window.assetManager.texture('grass') // Procedural grass if the download fails
+        });
         
-        // Configure texture for tiling
-        if (grassTexture && grassTexture.wrapS !== undefined) {
-            grassTexture.wrapS = THREE.RepeatWrapping;
-            grassTexture.wrapT = THREE.RepeatWrapping;
-            grassTexture.repeat.set(20, 20); // Tile 20x20 times for detail
+        for (let x = -WORLD_SIZE / 2 + size / 2; x < WORLD_SIZE / 2; x += size) {
+            for (let z = -WORLD_SIZE / 2 + size / 2; z < WORLD_SIZE / 2; z += size) {
+                this.stream(x, z, () => this.createGroundTile(x, z), tile => this.scene.remove(tile));
+            }
         }
+    }
+    
+    createGroundTile(x, z) {
+        const mesh = new THREE.Mesh(this.groundGeometry, this.groundMaterial);
+        mesh.rotation.x = -Math.PI / 2;
+        mesh.position.set(x, 0, z);
+        mesh.receiveShadow = true;
+        this.scene.add(mesh);
         
-        // Create textured material
-        const groundMaterialParams = { color: 0x90EE90 };
-        if (grassTexture) groundMaterialParams.map = grassTexture;
-        const groundMaterial = new THREE.MeshLambertMaterial(groundMaterialParams);
-        
-        // Main ground plane with texture
-        const groundGeometry = new THREE.PlaneGeometry(200, 200);
-        const groundMesh = new THREE.Mesh(groundGeometry, groundMaterial);
-        groundMesh.rotation.x = -Math.PI / 2;
-        groundMesh.position.y = 0;
-        groundMesh.receiveShadow = true;
-        
-        this.scene.add(groundMesh);
-        
-        console.log('🌍 Textured ground plane created and added to scene');
-        console.log('📍 Ground position:', groundMesh.position);
-        
-        // Physics ground (re-enabled with working Cannon.js v0.6.2)
-        console.log('🌍 STEP 3: Creating physics ground...');
+        // Physics ground: a thin box in the chunk's static cluster
         try {
-            const groundShape = new CANNON.Box(new CANNON.Vec3(100, 0.1, 100));
-            const groundBody = new CANNON.Body({ mass: 0 });
-            groundBody.addShape(groundShape);
-            groundBody.position.set(0, 0, 0);
-            this.world.add(groundBody);
-            console.log('✅ Physics ground created successfully');
+            const half = this.streamer.chunkSize / 2;
+            const cluster = this.staticCluster(x, z, 'base');
+            cluster.addShape(new CANNON.Box(new CANNON.Vec3(half, 0.1, half)),
+                new CANNON.Vec3(x - cluster.position.x, -cluster.position.y, z - cluster.position.z));
         } catch (e) {
             console.error('❌ Physics ground creation failed:', e);
         }
+        return mesh;
     }
     
-    createStartingArea() {
-        // Starting platform (safe spawn area)
-        this.createPlatform(0, 1, 0, 8, 1, 8, this.materials.platform);
-        
-        // Tutorial platforms leading away from start
-        this.createPlatform(10, 2, 0, 4, 1, 4, this.materials.platformAlt);
-        this.createPlatform(18, 3, 2, 4, 1, 4, this.materials.platform);
-        this.createPlatform(25, 4, -3, 4, 1, 4, this.materials.platformSpecial);
+    // Register level content at (x, z): load() builds it when its chunk streams in,
+    // unload(entry) frees it when the chunk streams out
+    stream(x, z, load, unload, group = this.platformGroup) {
+        return this.streamer.add({ x, z, group, load, unload });
     }
     
-    createFloatingPlatforms() {
-        // Create a series of floating platforms (Astro Bot style)
-        const platformConfigs = [
-            // Position (x, y, z), Size (w, h, d), Material
-            { pos: [35, 6, 0], size: [3, 1, 3], material: 'platform' },
-            { pos: [42, 8, 5], size: [3, 1, 3], material: 'platformAlt' },
-            { pos: [48, 10, -2], size: [3, 1, 3], material: 'platform' },
-            { pos: [55, 12, 3], size: [4, 1, 4], material: 'platformSpecial' },
-            { pos: [65, 8, -5], size: [3, 1, 6], material: 'platform' },
-            { pos: [75, 6, 2], size: [3, 1, 3], material: 'platformAlt' },
-            { pos: [85, 10, -3], size: [5, 1, 5], material: 'platformSpecial' },
-            
-            // Side platforms for exploration
-            { pos: [15, 8, 15], size: [3, 1, 3], material: 'platform' },
-            { pos: [20, 12, 20], size: [2, 1, 2], material: 'platformAlt' },
-            { pos: [8, 6, -12], size: [4, 1, 4], material: 'platform' },
-            { pos: [30, 15, -15], size: [3, 1, 3], material: 'platformSpecial' },
-        ];
-        
-        platformConfigs.forEach(config => {
-            this.createPlatform(
-                ...config.pos,
-                ...config.size,
-                this.materials[config.material]
-            );
-        });
-        
-        // Moving platforms (animated)
-        this.createMovingPlatform(45, 15, 10, 4, 1, 4);
-        this.createMovingPlatform(70, 18, -8, 3, 1, 3);
+    // Streamed platform: built and freed with its chunk
+    addPlatform(x, y, z, width, height, depth, material) {
+        const group = this.platformGroup; // Cluster group at registration, not at load time
+        return this.stream(x, z,
+            () => this.createPlatform(x, y, z, width, height, depth, material, true, group),
+            platform => this.destroyPlatform(platform));
+    }
+    
+    addMovingPlatform(x, y, z, width, height, depth) {
+        // Path chosen once, so the platform moves the same way each time its chunk loads
+        const direction = new THREE.Vector3((Math.random() - 0.5) * 2, 0, (Math.random() - 0.5) * 2).normalize();
+        return this.stream(x, z,
+            () => this.createMovingPlatform(x, y, z, width, height, depth, direction),
+            platform => this.destroyPlatform(platform));
+    }
+    
+    // Static platforms leave their shape in the chunk's cluster, which goes with the chunk
+    destroyPlatform(platform) {
+        this.removeObject(platform);
+        this.platforms.splice(this.platforms.indexOf(platform), 1);
+        const moving = this.movingPlatforms.indexOf(platform);
+        if (moving !== -1) this.movingPlatforms.splice(moving, 1);
     }
     
-    createPlatform(x, y, z, width, height, depth, material) {
+    createPlatform(x, y, z, width, height, depth, material, isStatic = true, group = this.platformGroup) {
         // Visual mesh
         const geometry = new THREE.BoxGeometry(width, height, depth);
         const mesh = new THREE.Mesh(geometry, material);
         mesh.position.set(x, y, z);
-        mesh.castShadow = true;
+        mesh.castShadow = isStatic; // Moving platforms get a blob shadow instead
         mesh.receiveShadow = true;
         
         this.scene.add(mesh);
+        let blob = null;
+        if (isStatic) {
+            this.gameEngine.shadows.invalidate();
+        } else {
+            blob = this.gameEngine.shadows.addBlob(mesh, Math.max(width, depth) * 0.6, height / 2);
+        }
         
         // Physics body (re-enabled systematically - Step 4)
-        console.log('🏗️ STEP 4: Creating platform physics at', x, y, z);
+        gameLog.debug('world', '🏗️ STEP 4: Creating platform physics', { x, y, z });
         let physicsBody = null;
+        let cluster = null;
         try {
             const shape = new CANNON.Box(new CANNON.Vec3(width/2, height/2, depth/2));
-            physicsBody = new CANNON.Body({ mass: 0 }); // Static platforms
-            physicsBody.addShape(shape);
-            physicsBody.position.set(x, y, z);
-            this.world.add(physicsBody);
-            console.log('✅ Platform physics created successfully');
+            if (isStatic) {
+                cluster = this.staticCluster(x, z, group);
+                cluster.addShape(shape, new CANNON.Vec3(x - cluster.position.x, y - cluster.position.y, z - cluster.position.z));
+            } else {
+                physicsBody = new CANNON.Body({ mass: 0 }); // Moved by hand in update()
+                physicsBody.addShape(shape);
+                physicsBody.position.set(x, y, z);
+                this.world.add(physicsBody);
+            }
+            gameLog.debug('world', '✅ Platform physics created successfully');
         } catch (e) {
             console.error('❌ Platform physics creation failed:', e);
         }
         
-        this.platforms.push({ mesh, body: physicsBody });
+        const platform = { mesh, body: physicsBody, cluster, blob };
+        this.platforms.push(platform);
         
-        return { mesh, body: null };
+        return platform;
+    }
+    
+    // Compound static body for the cluster cell containing (x, z), created on first use
+    staticCluster(x, z, group = this.platformGroup) {
+        const cx = Math.floor(x / this.clusterSize);
+        const cz = Math.floor(z / this.clusterSize);
+        const key = `${group}:${cx},${cz}`;
+        let cluster = this.staticClusters.get(key);
+        if (!cluster) {
+            cluster = new CANNON.Body({ mass: 0 });
+            cluster.position.set((cx + 0.5) * this.clusterSize, 0, (cz + 0.5) * this.clusterSize);
+            cluster.platformGroup = group;
+            cluster.cell = { cx, cz };
+            this.world.add(cluster);
+            this.staticClusters.set(key, cluster);
+        }
+        return cluster;
+    }
+    
+    // A chunk streamed out: drop its clusters (every group) with the shapes in them
+    removeClusters(cx, cz) {
+        for (const [key, cluster] of this.staticClusters) {
+            if (cluster.cell.cx === cx && cluster.cell.cz === cz) {
+                this.world.remove(cluster);
+                this.staticClusters.delete(key);
+            }
+        }
     }
     
-    createMovingPlatform(x, y, z, width, height, depth) {
-        const platform = this.createPlatform(x, y, z, width, height, depth, this.materials.platformSpecial);
+    createMovingPlatform(x, y, z, width, height, depth, direction = null) {
+        const platform = this.createPlatform(x, y, z, width, height, depth, this.materials.platformSpecial, false);
         
         // Add moving animation
         platform.originalPosition = new THREE.Vector3(x, y, z);
-        platform.moveDirection = new THREE.Vector3(
+        platform.moveDirection = direction ? direction.clone() : new THREE.Vector3(
             (Math.random() - 0.5) * 2,
             0,
             (Math.random() - 0.5) * 2
@@ -215,30 +263,28 @@ class World {
         platform.moveDistance = 5;
         platform.moveTime = 0;
         platform.isMoving = true;
+        this.movingPlatforms.push(platform);
+        if (platform.body) this.gameEngine.trackInterpolation(platform.body);
         
         return platform;
     }
     
-    createCollectibles() {
-        // Coins scattered throughout the level
-        const coinPositions = [
-            [5, 3, 2], [15, 4, 0], [25, 6, -1],
-            [40, 9, 3], [50, 11, -1], [60, 9, 0],
-            [80, 11, -2], [20, 10, 18], [12, 8, -10]
-        ];
-        
-        coinPositions.forEach(pos => {
-            this.createCoin(...pos);
-        });
-        
-        // Special gems (worth more points)
-        const gemPositions = [
-            [30, 16, -12], [65, 20, -8], [85, 15, 2]
-        ];
-        
-        gemPositions.forEach(pos => {
-            this.createGem(...pos);
-        });
+    // Streamed collectibles; picking one up unregisters it, so it stays gone when its chunk reloads
+    addCoin(x, y, z) {
+        return this.streamCollectible(x, z, () => this.createCoin(x, y, z));
+    }
+    
+    addGem(x, y, z) {
+        return this.streamCollectible(x, z, () => this.createGem(x, y, z));
+    }
+    
+    streamCollectible(x, z, create) {
+        const item = this.stream(x, z, () => {
+            const collectible = create();
+            collectible.item = item;
+            return collectible;
+        }, collectible => this.removeCollectible(collectible), 'collectible');
+        return item;
     }
     
     createCoin(x, y, z) {
@@ -246,7 +292,6 @@ class World {
         const geometry = new THREE.CylinderGeometry(0.8, 0.8, 0.2, 12);
         const mesh = new THREE.Mesh(geometry, this.materials.coin);
         mesh.position.set(x, y, z);
-        mesh.castShadow = true;
         
         // Spinning animation
         mesh.rotation.x = Math.PI / 2;
@@ -268,7 +313,7 @@ class World {
         // body.position.set(x, y, z);
         // this.world.add(body);
         
-        this.collectibles.push({ mesh, body: null });
+        return this.addCollectible(mesh);
     }
     
     createGem(x, y, z) {
@@ -276,7 +321,6 @@ class World {
         const geometry = new THREE.OctahedronGeometry(1);
         const mesh = new THREE.Mesh(geometry, this.materials.gem);
         mesh.position.set(x, y, z);
-        mesh.castShadow = true;
         
         mesh.userData = { 
             type: 'gem', 
@@ -296,34 +340,29 @@ class World {
         // body.position.set(x, y, z);
         // this.world.add(body);
         
-        this.collectibles.push({ mesh, body: null });
+        return this.addCollectible(mesh);
     }
     
-    createDecorations() {
-        // Floating trees/mushrooms (visual only, no collision)
-        const decorationPositions = [
-            [25, 2, 15], [45, 3, -20], [70, 5, 25],
-            [-20, 2, 10], [-15, 4, -15], [90, 3, 10]
-        ];
-        
-        decorationPositions.forEach(pos => {
-            this.createTree(...pos);
-        });
-        
-        // Add more trees for richer forest environment
-        const extraTreePositions = [
-            [35, 2, 20], [55, 3, -25], [-35, 2, 18], 
-            [-25, 4, -22], [50, 5, 30], [-40, 3, -30],
-            [60, 2, 15], [-50, 4, 25], [40, 3, -35],
-            [25, 2, 35], [-30, 3, 30], [65, 4, -15]
-        ];
-        
-        extraTreePositions.forEach(pos => {
-            this.createTree(...pos);
-        });
-        
-        console.log('🌳 Created additional trees for richer forest environment');
-        
+    addCollectible(mesh, body = null) {
+        const collectible = { mesh, body, index: this.collectibles.length, cell: null, item: null, blob: null };
+        collectible.blob = this.gameEngine.shadows.addBlob(mesh, 0.7, 0.8, true); // Bobs in place: probe the surface once
+        collectible.cell = this.collectibleIndex.insert(collectible, mesh.position);
+        this.collectibles.push(collectible);
+        return collectible;
+    }
+    
+    // O(1): swap the last collectible into the freed slot
+    removeCollectible(collectible) {
+        this.removeObject(collectible);
+        this.collectibleIndex.remove(collectible.cell);
+        const last = this.collectibles.pop();
+        if (last !== collectible) {
+            this.collectibles[collectible.index] = last;
+            last.index = collectible.index;
+        }
+    }
+    
+    createClouds() {
         // Floating clouds (background elements)
         for (let i = 0; i < 10; i++) {
             this.createCloud(
@@ -334,133 +373,16 @@ class World {
         }
     }
     
-    createTree(x, y, z) {
-        console.log('🌳 Creating believable tree: trunk + branches + canopies...');
-        const treeGroup = new THREE.Group();
-        const textureLoader = new THREE.TextureLoader();
-        
-        // AI-Generated bark texture for all tree parts
-        const barkTexture = textureLoader.load(
-            './textures/gemini_bark.png',
-            () => console.log('✅ AI bark texture loaded for tree'),
-            undefined,
-            () => console.warn('⚠️ Using brown fallback for bark')
-        );
-        barkTexture.wrapS = THREE.RepeatWrapping;
-        barkTexture.wrapT = THREE.RepeatWrapping;
-        barkTexture.repeat.set(1, 2);
-        
-        const barkMaterial = new THREE.MeshLambertMaterial({ 
-            map: barkTexture,
-            color: 0x8B4513 
-        });
-        
-        // MAIN TRUNK (properly grounded)
-        const trunkGeometry = new THREE.CylinderGeometry(0.5, 0.8, 4, 8);
-        const trunkMesh = new THREE.Mesh(trunkGeometry, barkMaterial);
-        trunkMesh.position.set(0, 2, 0); // Base at y=0 when tree at ground level
-        trunkMesh.castShadow = true;
-        treeGroup.add(trunkMesh);
-        
-        // BRANCH 1 (extends from trunk)
-        const branch1Geometry = new THREE.CylinderGeometry(0.2, 0.35, 2.5, 6);
-        const branch1Mesh = new THREE.Mesh(branch1Geometry, barkMaterial);
-        branch1Mesh.position.set(-1.5, 3.5, 0.8);
-        branch1Mesh.rotation.z = Math.PI / 5; // Realistic branch angle
-        branch1Mesh.castShadow = true;
-        treeGroup.add(branch1Mesh);
-        
-        // BRANCH 2 (other side for balance)
-        const branch2Geometry = new THREE.CylinderGeometry(0.15, 0.28, 2, 6);
-        const branch2Mesh = new THREE.Mesh(branch2Geometry, barkMaterial);
-        branch2Mesh.position.set(1.2, 4, -0.6);
-        branch2Mesh.rotation.z = -Math.PI / 6; // Angled the other way
-        branch2Mesh.castShadow = true;
-        treeGroup.add(branch2Mesh);
-        
-        // SINGLE LEAF TEXTURE (small tiled - the good one)
-        const leafTexture = textureLoader.load(
-            './textures/leaves_variation_1_20250915_124330.png',
-            () => console.log('✅ Small tiled leaf texture loaded'),
-            undefined,
-            () => {
-                console.warn('⚠️ Using green fallback for leaves');
-            }
-        );
-        leafTexture.wrapS = THREE.RepeatWrapping;
-        leafTexture.wrapT = THREE.RepeatWrapping;
-        leafTexture.repeat.set(4, 4); // More tiling for detail
-        
-        const leafMaterial = new THREE.MeshLambertMaterial({ 
-            map: leafTexture,
-            color: 0x32CD32,
-            emissive: 0x0a1f0a
-        });
-        
-        // MAIN CANOPY (on trunk)
-        const mainCanopy = new THREE.SphereGeometry(2.4, 12, 8);
-        const mainCanopyMesh = new THREE.Mesh(mainCanopy, leafMaterial);
-        mainCanopyMesh.position.set(0, 5.8, 0);
-        mainCanopyMesh.castShadow = true;
-        mainCanopyMesh.receiveShadow = true;
-        treeGroup.add(mainCanopyMesh);
-        
-        // BRANCH 1 CANOPY (smaller, at end of branch)
-        const branch1Canopy = new THREE.SphereGeometry(1.3, 10, 6);
-        const branch1CanopyMesh = new THREE.Mesh(branch1Canopy, leafMaterial);
-        branch1CanopyMesh.position.set(-2.3, 4.5, 1.2);
-        branch1CanopyMesh.castShadow = true;
-        branch1CanopyMesh.receiveShadow = true;
-        treeGroup.add(branch1CanopyMesh);
-        
-        // BRANCH 2 CANOPY (smallest, at end of second branch)
-        const branch2Canopy = new THREE.SphereGeometry(1.1, 8, 6);
-        const branch2CanopyMesh = new THREE.Mesh(branch2Canopy, leafMaterial);
-        branch2CanopyMesh.position.set(1.8, 4.8, -0.9);
-        branch2CanopyMesh.castShadow = true;
-        branch2CanopyMesh.receiveShadow = true;
-        treeGroup.add(branch2CanopyMesh);
-        
-        // Position entire tree on ground
-        treeGroup.position.set(x, 0, z); // Grounded properly
-        this.scene.add(treeGroup);
-        this.decorations.push(treeGroup);
-        
-        console.log('✅ Believable tree created: 1 trunk + 2 branches + 3 canopies with consistent AI leaf texture');
+    // Yaw and size are fixed at registration so a tree looks the same each time its chunk loads
+    createTree(x, y, z, yaw = Math.random() * Math.PI * 2, size = 0.85 + Math.random() * 0.3) {
+        // Instanced: 1 trunk + 2 branches + 3 canopies sharing geometry, materials and textures
+        this.stream(x, z,
+            () => this.scenery.addTree(x, 0, z, yaw, size), // Grounded properly
+            tree => this.scenery.removeTree(tree));
     }
     
     createCloud(x, y, z) {
-        const cloudGroup = new THREE.Group();
-        
-        // Multiple spheres to create cloud shape
-        for (let i = 0; i < 4; i++) {
-            const cloudGeometry = new THREE.SphereGeometry(
-                Math.random() * 2 + 1,
-                8, 8
-            );
-            const cloudMaterial = new THREE.MeshLambertMaterial({ 
-                color: 0xffffff,
-                transparent: true,
-                opacity: 0.8
-            });
-            const cloudPart = new THREE.Mesh(cloudGeometry, cloudMaterial);
-            cloudPart.position.set(
-                (Math.random() - 0.5) * 6,
-                (Math.random() - 0.5) * 2,
-                (Math.random() - 0.5) * 6
-            );
-            cloudGroup.add(cloudPart);
-        }
-        
-        cloudGroup.position.set(x, y, z);
-        cloudGroup.userData = {
-            driftSpeed: Math.random() * 0.5 + 0.2,
-            bobSpeed: Math.random() * 0.5 + 0.5,
-            bobAmount: Math.random() * 1 + 0.5
-        };
-        
-        this.scene.add(cloudGroup);
-        this.decorations.push(cloudGroup);
+        this.scenery.addCloud(x, y, z);
     }
     
     createBoundaries() {
@@ -486,9 +408,14 @@ class World {
         // });
     }
     
-    update(deltaTime) {
-        // Animate collectibles
-        this.collectibles.forEach(collectible => {
+    update(deltaTime, focus = null) {
+        // Stream chunks around the player within the per-frame build budget
+        if (focus) this.streamer.update(focus);
+        
+        // Animate collectibles (indexed loops: the per-frame paths allocate nothing)
+        const bobTime = Date.now() * 0.001;
+        for (let i = 0; i < this.collectibles.length; i++) {
+            const collectible = this.collectibles[i];
             const mesh = collectible.mesh;
             const userData = mesh.userData;
             
@@ -498,51 +425,50 @@ class World {
                 
                 // Bobbing animation
                 mesh.position.y = userData.originalY + 
-                    Math.sin(Date.now() * 0.001 * userData.bobSpeed) * userData.bobAmount;
+                    Math.sin(bobTime * userData.bobSpeed) * userData.bobAmount;
+                
+                // Keep the pickup index current (a coordinate write unless the bob crosses a cell)
+                this.collectibleIndex.update(collectible.cell, mesh.position);
                 
                 // Sync physics body position (only if physics body exists)
                 if (collectible.body) {
                     collectible.body.position.copy(mesh.position);
                 }
             }
-        });
+        }
         
-        // Animate moving platforms
-        this.platforms.forEach(platform => {
-            if (platform.isMoving) {
-                platform.moveTime += deltaTime;
-                
-                const offset = new THREE.Vector3()
-                    .copy(platform.moveDirection)
-                    .multiplyScalar(Math.sin(platform.moveTime * platform.moveSpeed) * platform.moveDistance);
-                
-                const newPosition = new THREE.Vector3()
-                    .copy(platform.originalPosition)
-                    .add(offset);
-                
-                platform.mesh.position.copy(newPosition);
-                if (platform.body) {
-                    platform.body.position.copy(newPosition);
-                }
+        // Moving platform meshes render between their last two physics positions
+        for (let i = 0; i < this.movingPlatforms.length; i++) {
+            const platform = this.movingPlatforms[i];
+            if (platform.body) {
+                this.gameEngine.interpolateBody(platform.body, platform.mesh.position);
             }
-        });
+        }
         
-        // Animate decorations
-        this.decorations.forEach(decoration => {
-            const userData = decoration.userData;
-            if (userData) {
-                // Floating/drifting animation for clouds
-                if (userData.driftSpeed) {
-                    decoration.position.x += userData.driftSpeed * deltaTime;
-                    decoration.position.y += Math.sin(Date.now() * 0.001 * userData.bobSpeed) * userData.bobAmount * deltaTime;
-                    
-                    // Reset position if drifted too far
-                    if (decoration.position.x > 120) {
-                        decoration.position.x = -120;
-                    }
-                }
+        // Drift clouds and pick scenery LOD for this view
+        this.scenery.update(deltaTime, this.gameEngine.camera);
+    }
+    
+    // Once per fixed physics step: move platform bodies along their paths
+    fixedUpdate(step) {
+        for (let i = 0; i < this.movingPlatforms.length; i++) {
+            const platform = this.movingPlatforms[i];
+            platform.moveTime += step;
+            
+            const offset = Math.sin(platform.moveTime * platform.moveSpeed) * platform.moveDistance;
+            const origin = platform.originalPosition;
+            const direction = platform.moveDirection;
+            
+            if (platform.body) {
+                platform.body.position.set(
+                    origin.x + direction.x * offset,
+                    origin.y + direction.y * offset,
+                    origin.z + direction.z * offset
+                );
+            } else {
+                platform.mesh.position.copy(origin).addScaledVector(direction, offset);
             }
-        });
+        }
     }
     
     // Utility method to create platforms with physics
@@ -556,214 +482,36 @@ class World {
     }
     
     // Check collectible collisions with player
+    // Pickups within reach; the returned array is reused, read it before the next call
     checkCollectibleCollisions(playerPosition, collectRadius = 2) {
-        const collected = [];
-        
-        this.collectibles.forEach((collectible, index) => {
-            const distance = playerPosition.distanceTo(collectible.mesh.position);
-            
-            if (distance < collectRadius) {
-                // Collect the item
-                this.scene.remove(collectible.mesh);
-                this.world.remove(collectible.body);
-                collected.push({
-                    type: collectible.mesh.userData.type,
-                    value: collectible.mesh.userData.value,
-                    index: index
-                });
-            }
-        });
-        
-        // Remove collected items from array (in reverse order to maintain indices)
-        collected.reverse().forEach(item => {
-            this.collectibles.splice(item.index, 1);
-        });
-        
-        return collected;
-    }
-    
-    // Procedural texture creation for fallbacks
-    createProceduralGrassTexture() {
-        const canvas = document.createElement('canvas');
-        canvas.width = 256;
-        canvas.height = 256;
-        const ctx = canvas.getContext('2d');
-        
-        // Create grass-like texture
-        const gradient = ctx.createLinearGradient(0, 0, 0, 256);
-        gradient.addColorStop(0, '#90EE90');
-        gradient.addColorStop(0.5, '#228B22');
-        gradient.addColorStop(1, '#006400');
-        
-        ctx.fillStyle = gradient;
-        ctx.fillRect(0, 0, 256, 256);
-        
-        // Add grass blade details
-        ctx.strokeStyle = '#32CD32';
-        ctx.lineWidth = 1;
-        
-        for (let i = 0; i < 100; i++) {
-            const x = Math.random() * 256;
-            const y = Math.random() * 256;
-            const height = Math.random() * 20 + 10;
-            
-            ctx.beginPath();
-            ctx.moveTo(x, y);
-            ctx.lineTo(x + Math.random() * 4 - 2, y - height);
-            ctx.stroke();
+        const collected = this.collected;
+        collected.length = 0;
+        const hits = this.collectibleIndex.query(playerPosition, collectRadius, this.collectibleHits);
+        
+        for (let i = 0; i < hits.length; i++) {
+            // Collect the item
+            const collectible = hits[i].item;
+            if (collectible.item) this.streamer.remove(collectible.item); // Unloads it
+            else this.removeCollectible(collectible);
+            collected.push({
+                type: collectible.mesh.userData.type,
+                value: collectible.mesh.userData.value
+            });
         }
+        hits.length = 0;
         
-        const texture = new THREE.CanvasTexture(canvas);
-        texture.wrapS = THREE.RepeatWrapping;
-        texture.wrapT = THREE.RepeatWrapping;
-        texture.repeat.set(20, 20);
-        
-        console.log('🎨 Created procedural grass texture');
-        return new THREE.MeshLambertMaterial({ map: texture });
+        return collected;
     }
     
     // Create textured platform materials
-    createTexturedPlatformMaterial(textureLoader, baseColor, colorName) {
-        // Try to load platform texture from web
-        const platformTexture = textureLoader.load(
-            'https://threejs.org/examples/textures/brick_diffuse.jpg',
-            () => console.log(`✅ Platform texture loaded for ${colorName} platform`),
-            undefined,
-            (error) => {
-                console.warn(`⚠️ Platform texture failed for ${colorName}, using procedural`);
-                return this.createProceduralPlatformTexture(baseColor);
-            }
-        );
-        
-        // Configure texture
-        platformTexture.wrapS = THREE.RepeatWrapping;
-        platformTexture.wrapT = THREE.RepeatWrapping;
-        platformTexture.repeat.set(2, 2); // Smaller tiling for platform detail
-        
+    createTexturedPlatformMaterial(baseColor) {
         return new THREE.MeshLambertMaterial({
-            map: platformTexture,
+            map: window.assetManager.texture('brick'),
             color: baseColor, // Tint the texture with platform color
             emissive: new THREE.Color(baseColor).multiplyScalar(0.1)
         });
     }
     
-    // Procedural platform texture as fallback
-    createProceduralPlatformTexture(baseColor) {
-        const canvas = document.createElement('canvas');
-        canvas.width = 128;
-        canvas.height = 128;
-        const ctx = canvas.getContext('2d');
-        
-        // Create brick-like pattern
-        ctx.fillStyle = `#${baseColor.toString(16).padStart(6, '0')}`;
-        ctx.fillRect(0, 0, 128, 128);
-        
-        // Add brick lines
-        ctx.strokeStyle = 'rgba(255,255,255,0.2)';
-        ctx.lineWidth = 2;
-        
-        for (let y = 0; y < 128; y += 32) {
-            ctx.beginPath();
-            ctx.moveTo(0, y);
-            ctx.lineTo(128, y);
-            ctx.stroke();
-        }
-        
-        for (let x = 0; x < 128; x += 64) {
-            ctx.beginPath();
-            ctx.moveTo(x, 0);
-            ctx.lineTo(x, 128);
-            ctx.stroke();
-        }
-        
-        const texture = new THREE.CanvasTexture(canvas);
-        texture.wrapS = THREE.RepeatWrapping;
-        texture.wrapT = THREE.RepeatWrapping;
-        
-        console.log(`🎨 Created procedural platform texture for color ${baseColor}`);
-        return new THREE.MeshLambertMaterial({ map: texture });
-    }
-    
-    // Procedural bark texture
-    createProceduralBarkTexture() {
-        const canvas = document.createElement('canvas');
-        canvas.width = 256;
-        canvas.height = 256;
-        const ctx = canvas.getContext('2d');
-        
-        // Brown bark base
-        ctx.fillStyle = '#8B4513';
-        ctx.fillRect(0, 0, 256, 256);
-        
-        // Add bark texture lines
-        ctx.strokeStyle = '#654321';
-        ctx.lineWidth = 3;
-        
-        for (let i = 0; i < 20; i++) {
-            const y = Math.random() * 256;
-            const wobble = Math.random() * 20 - 10;
-            
-            ctx.beginPath();
-            ctx.moveTo(0, y);
-            ctx.lineTo(256, y + wobble);
-            ctx.stroke();
-        }
-        
-        // Add vertical grain
-        ctx.strokeStyle = '#A0522D';
-        ctx.lineWidth = 1;
-        for (let i = 0; i < 50; i++) {
-            const x = Math.random() * 256;
-            ctx.beginPath();
-            ctx.moveTo(x, 0);
-            ctx.lineTo(x + Math.random() * 10 - 5, 256);
-            ctx.stroke();
-        }
-        
-        const texture = new THREE.CanvasTexture(canvas);
-        texture.wrapS = THREE.RepeatWrapping;
-        texture.wrapT = THREE.RepeatWrapping;
-        
-        console.log('🎨 Created procedural bark texture');
-        return new THREE.MeshLambertMaterial({ map: texture, color: 0x8B4513 });
-    }
-    
-    // Procedural foliage texture
-    createProceduralFoliageTexture() {
-        const canvas = document.createElement('canvas');
-        canvas.width = 256;
-        canvas.height = 256;
-        const ctx = canvas.getContext('2d');
-        
-        // Green foliage base
-        const gradient = ctx.createRadialGradient(128, 128, 0, 128, 128, 128);
-        gradient.addColorStop(0, '#90EE90');
-        gradient.addColorStop(0.5, '#32CD32');
-        gradient.addColorStop(1, '#228B22');
-        
-        ctx.fillStyle = gradient;
-        ctx.fillRect(0, 0, 256, 256);
-        
-        // Add leaf-like details
-        ctx.fillStyle = '#228B22';
-        for (let i = 0; i < 100; i++) {
-            const x = Math.random() * 256;
-            const y = Math.random() * 256;
-            const size = Math.random() * 8 + 2;
-            
-            ctx.beginPath();
-            ctx.arc(x, y, size, 0, Math.PI * 2);
-            ctx.fill();
-        }
-        
-        const texture = new THREE.CanvasTexture(canvas);
-        texture.wrapS = THREE.RepeatWrapping;
-        texture.wrapT = THREE.RepeatWrapping;
-        
-        console.log('🎨 Created procedural foliage texture');
-        return new THREE.MeshLambertMaterial({ map: texture, color: 0x32CD32 });
-    }
-    
     // Dynamic world generation (for future expansion)
     generatePlatformSequence(startX, startY, startZ, count, spacing = 8) {
         for (let i = 0; i < count; i++) {
@@ -772,40 +520,138 @@ class World {
             const z = startZ + (Math.random() - 0.5) * 6;
             
             const materialType = ['platform', 'platformAlt', 'platformSpecial'][i % 3];
-            this.createPlatform(x, y, z, 4, 1, 4, this.materials[materialType]);
+            this.addPlatform(x, y, z, 4, 1, 4, this.materials[materialType]);
             
             // Add collectibles on some platforms
             if (Math.random() > 0.6) {
-                this.createCoin(x, y + 2, z);
+                this.addCoin(x, y + 2, z);
+            }
+        }
+    }
+    
+    // Compiled level -> typed-array views straight over the buffer (no copies, no parsing per object)
+    parseLevel(buffer) {
+        const view = new DataView(buffer);
+        if (view.getUint32(0, true) !== LEVEL_MAGIC || view.getUint16(4, true) !== LEVEL_VERSION) {
+            throw new Error(`Not a version ${LEVEL_VERSION} RoboQuest level`);
+        }
+        const platforms = view.getUint32(8, true);
+        const collectibles = view.getUint32(12, true);
+        const trees = view.getUint32(16, true);
+        
+        let offset = LEVEL_HEADER_BYTES;
+        const floats = (count) => {
+            const section = new Float32Array(buffer, offset, count);
+            offset += count * 4;
+            return section;
+        };
+        const bytes = (count) => {
+            const section = new Uint8Array(buffer, offset, count);
+            offset += count;
+            return section;
+        };
+        return {
+            platforms,
+            collectibles,
+            trees,
+            platformPositions: floats(platforms * 3),
+            platformSizes: floats(platforms * 3),
+            collectiblePositions: floats(collectibles * 3),
+            treeData: floats(trees * 4), // x, z, yaw, size
+            platformMaterials: bytes(platforms),
+            platformFlags: bytes(platforms),
+            collectibleTypes: bytes(collectibles)
+        };
+    }
+    
+    fetchLevel(url) {
+        return fetch(url).then(response => {
+            if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+            return response.arrayBuffer();
+        }).then(buffer => this.parseLevel(buffer));
+    }
+    
+    // Register a parsed level with the streamer; its chunks build as the player nears them
+    loadLevelData(level, group = 'level') {
+        const start = performance.now();
+        const previousGroup = this.platformGroup;
+        this.platformGroup = group;
+        
+        const positions = level.platformPositions;
+        const sizes = level.platformSizes;
+        for (let i = 0, j = 0; i < level.platforms; i++, j += 3) {
+            if (level.platformFlags[i] & LEVEL_FLAG_MOVING) {
+                this.addMovingPlatform(positions[j], positions[j + 1], positions[j + 2], sizes[j], sizes[j + 1], sizes[j + 2]);
+            } else {
+                this.addPlatform(positions[j], positions[j + 1], positions[j + 2], sizes[j], sizes[j + 1], sizes[j + 2],
+                    this.materials[LEVEL_MATERIALS[level.platformMaterials[i]]]);
+            }
+        }
+        this.addLevelCollectibles(level);
+        
+        const trees = level.treeData;
+        for (let i = 0, j = 0; i < level.trees; i++, j += 4) {
+            this.createTree(trees[j], 0, trees[j + 1], trees[j + 2], trees[j + 3]);
+        }
+        
+        this.platformGroup = previousGroup;
+        console.log(`🗺️ Level registered: ${level.platforms} platforms, ${level.collectibles} collectibles, ` +
+            `${level.trees} trees in ${(performance.now() - start).toFixed(2)} ms`);
+    }
+    
+    addLevelCollectibles(level) {
+        const positions = level.collectiblePositions;
+        for (let i = 0, j = 0; i < level.collectibles; i++, j += 3) {
+            if (LEVEL_COLLECTIBLES[level.collectibleTypes[i]] === 'gem') {
+                this.addGem(positions[j], positions[j + 1], positions[j + 2]);
+            } else {
+                this.addCoin(positions[j], positions[j + 1], positions[j + 2]);
             }
         }
     }
     
     // Level completion check
     isLevelComplete() {
-        return this.collectibles.length === 0;
+        return this.streamer.groupSize('collectible') === 0; // Loaded or not
+    }
+    
+    // Remove a { mesh, body, blob } entry from scene and physics and free its GPU resources
+    removeObject(entry) {
+        this.scene.remove(entry.mesh);
+        if (entry.blob) this.gameEngine.shadows.removeBlob(entry.blob);
+        if (entry.mesh.castShadow) this.gameEngine.shadows.invalidate();
+        if (entry.body) {
+            this.world.remove(entry.body);
+            this.gameEngine.untrackInterpolation(entry.body);
+        }
+        this.gameEngine.disposeObject(entry.mesh, this.sharedMaterials);
     }
     
     // Reset world for new game
     reset() {
-        // Remove all dynamic objects
-        this.collectibles.forEach(collectible => {
-            this.scene.remove(collectible.mesh);
-            this.world.remove(collectible.body);
-        });
-        
-        this.collectibles = [];
+        // Remove all collectibles, and the platforms generatePlatformSequence added for the previous level
+        this.streamer.removeGroup('collectible');
+        this.streamer.removeGroup('level');
+        for (const [key, cluster] of this.staticClusters) {
+            if (cluster.platformGroup === 'level') {
+                this.world.remove(cluster);
+                this.staticClusters.delete(key);
+            }
+        }
         
-        // Regenerate collectibles
-        this.createCollectibles();
+        // Regenerate the base level's collectibles
+        if (this.baseLevel) this.addLevelCollectibles(this.baseLevel);
     }
     
     // Get world info for debugging
     getDebugInfo() {
         return {
             platforms: this.platforms.length,
-            collectibles: this.collectibles.length,
-            decorations: this.decorations.length
+            platformClusters: this.staticClusters.size,
+            collectibles: this.streamer.groupSize('collectible'),
+            collectiblesLoaded: this.collectibles.length,
+            decorations: this.scenery.treeCount + this.scenery.clouds.length,
+            streaming: this.streamer.getDebugInfo()
         };
     }
 }
@@ -0,0 +1,235 @@
+/*
+ROBOQUEST WORLD STREAMING
+The level is described as items (ground tiles, platforms, collectibles,
+trees) with a position and load/unload functions, bucketed into square
+chunks. Chunks within loadRadius of the player are built nearest first, a
+few items per frame within budgetMs; chunks past unloadRadius (larger, so a
+player on a chunk border does not thrash) are unloaded and every item frees
+its meshes, GPU buffers and physics bodies. Chunks within syncDistance of the
+player are always finished at once, so the ground under the player exists.
+*/
+
+const CHUNK_UNLOADED = 0;
+const CHUNK_QUEUED = 1;
+const CHUNK_LOADED = 2;
+
+class WorldStreamer {
+    constructor(config = {}) {
+        this.config = Object.assign({
+            chunkSize: 50,
+            loadRadius: 3,      // Chunks (Chebyshev distance) kept loaded around the focus
+            unloadRadius: 4,
+            budgetMs: 2,        // Build time per frame; at least one item is built per frame
+            syncDistance: 10    // Chunks this close to the focus are built immediately
+        }, config);
+        this.chunkSize = this.config.chunkSize;
+
+        this.chunks = new Map();   // Packed cell key -> chunk
+        this.active = [];          // Queued and loaded chunks
+        this.queue = [];           // Chunks still building, nearest first
+        this.groupCounts = {};     // Items registered per group
+        this.focusCell = { cx: Infinity, cz: Infinity };
+        this.dirty = true;
+        this.onChunkUnloaded = null; // (chunk) after its items unloaded
+
+        this.itemsBuilt = 0;
+        this.lastBuildMs = 0;
+    }
+
+    cell(value) {
+        return Math.floor(value / this.chunkSize);
+    }
+
+    // Numeric key: no string per lookup
+    key(cx, cz) {
+        return (cx + 32768) * 65536 + (cz + 32768);
+    }
+
+    chunkAt(cx, cz, create = false) {
+        const key = this.key(cx, cz);
+        let chunk = this.chunks.get(key);
+        if (!chunk && create) {
+            chunk = { cx, cz, key, items: [], next: 0, state: CHUNK_UNLOADED, distance: 0 };
+            this.chunks.set(key, chunk);
+        }
+        return chunk;
+    }
+
+    // Register an item { x, z, group, load() -> entry, unload(entry) }; built if its chunk is
+    // active or within loadRadius (a level arriving after the player has settled in a cell)
+    add(item) {
+        const chunk = this.chunkAt(this.cell(item.x), this.cell(item.z), true);
+        item.chunk = chunk;
+        item.entry = null;
+        chunk.items.push(item);
+        this.groupCounts[item.group] = (this.groupCounts[item.group] || 0) + 1;
+        if (chunk.state === CHUNK_LOADED ||
+            (chunk.state === CHUNK_UNLOADED && this.chunkDistance(chunk) <= this.config.loadRadius)) {
+            this.enqueue(chunk);
+        }
+        return item;
+    }
+
+    // Unregister an item, unloading it if built
+    remove(item) {
+        const chunk = item.chunk;
+        const index = chunk.items.indexOf(item);
+        if (index === -1) return;
+        if (item.entry !== null) {
+            item.unload(item.entry);
+            item.entry = null;
+        }
+        chunk.items.splice(index, 1);
+        if (index < chunk.next) chunk.next--;
+        this.groupCounts[item.group]--;
+    }
+
+    removeGroup(group) {
+        for (const chunk of this.chunks.values()) {
+            for (let i = chunk.items.length - 1; i >= 0; i--) {
+                if (chunk.items[i].group === group) this.remove(chunk.items[i]);
+            }
+        }
+    }
+
+    groupSize(group) {
+        return this.groupCounts[group] || 0;
+    }
+
+    enqueue(chunk) {
+        if (chunk.state === CHUNK_UNLOADED) this.active.push(chunk);
+        chunk.state = CHUNK_QUEUED;
+        if (!this.queue.includes(chunk)) this.queue.push(chunk);
+        this.dirty = true;
+    }
+
+    unloadChunk(chunk) {
+        for (let i = 0; i < chunk.next; i++) {
+            const item = chunk.items[i];
+            if (item.entry !== null) {
+                item.unload(item.entry);
+                item.entry = null;
+            }
+        }
+        chunk.next = 0;
+        chunk.state = CHUNK_UNLOADED;
+        const queued = this.queue.indexOf(chunk);
+        if (queued !== -1) this.queue.splice(queued, 1);
+        if (this.onChunkUnloaded) this.onChunkUnloaded(chunk);
+    }
+
+    // Build the chunk's remaining items now
+    finishChunk(chunk) {
+        while (chunk.next < chunk.items.length) this.buildNext(chunk);
+        chunk.state = CHUNK_LOADED;
+        const queued = this.queue.indexOf(chunk);
+        if (queued !== -1) this.queue.splice(queued, 1);
+    }
+
+    buildNext(chunk) {
+        const item = chunk.items[chunk.next++];
+        item.entry = item.load();
+        this.itemsBuilt++;
+    }
+
+    // Chebyshev distance in chunks from the focus cell
+    chunkDistance(chunk) {
+        return Math.max(Math.abs(chunk.cx - this.focusCell.cx), Math.abs(chunk.cz - this.focusCell.cz));
+    }
+
+    // Once per frame with the player position
+    update(focus) {
+        const cx = this.cell(focus.x);
+        const cz = this.cell(focus.z);
+        if (cx !== this.focusCell.cx || cz !== this.focusCell.cz || this.dirty) {
+            this.focusCell.cx = cx;
+            this.focusCell.cz = cz;
+            this.dirty = false;
+            this.refresh();
+        }
+
+        // The ground near the player cannot wait for the budget
+        const d = this.config.syncDistance;
+        for (let x = this.cell(focus.x - d); x <= this.cell(focus.x + d); x++) {
+            for (let z = this.cell(focus.z - d); z <= this.cell(focus.z + d); z++) {
+                const chunk = this.chunkAt(x, z);
+                if (chunk && chunk.state !== CHUNK_LOADED) {
+                    if (chunk.state === CHUNK_UNLOADED) this.active.push(chunk);
+                    this.finishChunk(chunk);
+                }
+            }
+        }
+
+        this.build();
+    }
+
+    // Focus changed cell: unload far chunks, queue near ones nearest first
+    refresh() {
+        const { loadRadius, unloadRadius } = this.config;
+        for (let i = this.active.length - 1; i >= 0; i--) {
+            const chunk = this.active[i];
+            if (this.chunkDistance(chunk) > unloadRadius) {
+                this.unloadChunk(chunk);
+                this.active.splice(i, 1);
+            }
+        }
+
+        const { cx, cz } = this.focusCell;
+        for (let x = cx - loadRadius; x <= cx + loadRadius; x++) {
+            for (let z = cz - loadRadius; z <= cz + loadRadius; z++) {
+                const chunk = this.chunkAt(x, z);
+                if (chunk && chunk.state === CHUNK_UNLOADED) this.enqueue(chunk);
+            }
+        }
+        this.dirty = false;
+
+        for (const chunk of this.queue) {
+            const dx = chunk.cx - cx;
+            const dz = chunk.cz - cz;
+            chunk.distance = dx * dx + dz * dz;
+        }
+        this.queue.sort((a, b) => a.distance - b.distance);
+    }
+
+    // Time-sliced construction of queued chunks
+    build() {
+        if (this.queue.length === 0) {
+            this.lastBuildMs = 0;
+            return;
+        }
+        const start = performance.now();
+        const deadline = start + this.config.budgetMs;
+        do {
+            const chunk = this.queue[0];
+            if (chunk.next < chunk.items.length) {
+                this.buildNext(chunk);
+            } else {
+                chunk.state = CHUNK_LOADED;
+                this.queue.shift();
+            }
+        } while (this.queue.length > 0 && performance.now() < deadline);
+        this.lastBuildMs = performance.now() - start;
+    }
+
+    // Everything unloaded (items stay registered); the next update rebuilds around the focus
+    unloadAll() {
+        for (const chunk of this.active) this.unloadChunk(chunk);
+        this.active.length = 0;
+        this.queue.length = 0;
+        this.dirty = true;
+    }
+
+    getDebugInfo() {
+        let loaded = 0;
+        for (const chunk of this.active) if (chunk.state === CHUNK_LOADED) loaded++;
+        return {
+            chunks: this.chunks.size,
+            loaded: loaded,
+            queued: this.queue.length,
+            itemsBuilt: this.itemsBuilt,
+            lastBuildMs: this.lastBuildMs
+        };
+    }
+}
+
+window.WorldStreamer = WorldStreamer;
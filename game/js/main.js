@@ -54,8 +54,8 @@ function initializeGame() {
         // Start the game loop
         window.gameEngine.animate();
         
-        // Mobile optimizations
-        gameLogic.optimizeForMobile();
+        // Quality tier for the player and scenery (adapts to frame times from here on)
+        window.gameEngine.quality.apply();
         
         isGameInitialized = true;
         
@@ -97,6 +97,22 @@ function setupGameControls() {
                 gameLogic.toggleDebugMode();
                 break;
                 
+            case 'F3':
+                // Render statistics overlay
+                event.preventDefault();
+                if (window.gameEngine && window.gameEngine.renderStats) {
+                    window.gameEngine.renderStats.toggleOverlay();
+                }
+                break;
+                
+            case 'F4':
+                // Per-subsystem frame profiler overlay
+                event.preventDefault();
+                if (window.gameEngine && window.gameEngine.profiler) {
+                    window.gameEngine.profiler.toggleOverlay();
+                }
+                break;
+                
             case 'KeyM':
                 // Mute/unmute toggle (for future audio)
                 console.log('🔇 Audio toggle (not implemented yet)');
@@ -202,48 +218,36 @@ function setupTouchControls() {
 }
 
 function monitorPerformance() {
-    let lastTime = performance.now();
-    let frameCount = 0;
-    let fpsDisplay = null;
+    // FPS comes from the engine's profiler (the main loop's own frame deltas)
+    const profiler = window.gameEngine.profiler;
+    const fpsDisplay = document.createElement('div');
+    fpsDisplay.style.cssText = `
+        position: absolute;
+        top: 20px;
+        right: 120px;
+        color: white;
+        font-size: 14px;
+        background: rgba(0,0,0,0.3);
+        padding: 5px 10px;
+        border-radius: 5px;
+        font-family: monospace;
+    `;
+    document.getElementById('gameUI').appendChild(fpsDisplay);
     
-    function updateFPS() {
-        frameCount++;
-        const currentTime = performance.now();
+    let lastFrames = profiler.frames;
+    setInterval(() => {
+        // Paused or still loading: no frames, nothing to report
+        if (profiler.frames === lastFrames) return;
+        lastFrames = profiler.frames;
         
-        if (currentTime >= lastTime + 1000) {
-            const fps = Math.round((frameCount * 1000) / (currentTime - lastTime));
-            
-            if (!fpsDisplay) {
-                fpsDisplay = document.createElement('div');
-                fpsDisplay.style.cssText = `
-                    position: absolute;
-                    top: 20px;
-                    right: 120px;
-                    color: white;
-                    font-size: 14px;
-                    background: rgba(0,0,0,0.3);
-                    padding: 5px 10px;
-                    border-radius: 5px;
-                    font-family: monospace;
-                `;
-                document.getElementById('gameUI').appendChild(fpsDisplay);
-            }
-            
-            fpsDisplay.textContent = `FPS: ${fps}`;
-            
-            // Log performance warnings
-            if (fps < 30) {
-                console.warn('⚠️ Low FPS detected:', fps);
-            }
-            
-            frameCount = 0;
-            lastTime = currentTime;
-        }
+        const fps = Math.round(profiler.fps());
+        fpsDisplay.textContent = `FPS: ${fps}`;
         
-        requestAnimationFrame(updateFPS);
-    }
-    
-    updateFPS();
+        // Log performance warnings
+        if (fps < 30) {
+            console.warn('⚠️ Low FPS detected:', fps);
+        }
+    }, 1000);
 }
 
 function showErrorMessage(message) {
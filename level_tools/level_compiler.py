@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+RoboQuest Level Compiler
+Compiles human-editable JSON level descriptions (level_tools/levels/*.json)
+into the compact binary .rql format that World.loadLevelData builds from
+directly: typed arrays of platform transforms and sizes, material ids,
+collectible types and tree placements. Random choices (tree yaw and size,
+sequence jitter) are resolved here from the level's seed, so a level is the
+same every time it loads.
+
+Level JSON:
+  platforms: [{"pos": [x, y, z], "size": [w, h, d], "material": "platform", "moving": false}]
+  coins / gems: [[x, y, z], ...]
+  trees: [[x, z], ...] or [[x, z, yaw, size], ...]
+  sequences: [{"start": [x, y, z], "count": n, "spacing": 8, "coinChance": 0.4}]
+
+Binary layout (little-endian, every float section 4-byte aligned):
+  header    'RQLV', u16 version, u16 reserved, u32 platforms, u32 collectibles, u32 trees
+  float32   platform positions [3P], platform sizes [3P],
+            collectible positions [3C], trees (x, z, yaw, size) [4T]
+  uint8     platform materials [P], platform flags [P], collectible types [C]
+
+Usage:
+  python level_compiler.py                      # every levels/*.json -> game/levels/*.rql
+  python level_compiler.py levels/level1.json -o ../game/levels/level1.rql
+  python level_compiler.py --stress 5000 -o ../game/levels/stress.rql
+  python level_compiler.py --dump ../game/levels/level1.rql
+"""
+
+import glob
+import json
+import math
+import os
+import random
+import struct
+import sys
+from array import array
+
+MAGIC = b'RQLV'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+
+# Ids shared with World.js (LEVEL_MATERIALS, LEVEL_COLLECTIBLES)
+MATERIALS = ['platform', 'platformAlt', 'platformSpecial']
+COLLECTIBLES = ['coin', 'gem']
+FLAG_MOVING = 1
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(HERE, 'levels')
+OUTPUT_DIR = os.path.join(HERE, '..', 'game', 'levels')
+
+
+class LevelError(Exception):
+    pass
+
+
+def expand_sequences(level, rng):
+    """generatePlatformSequence-style strips: wavy heights, jittered depth, some coins"""
+    platforms = list(level.get('platforms', []))
+    coins = list(level.get('coins', []))
+    for seq in level.get('sequences', []):
+        x0, y0, z0 = seq['start']
+        spacing = seq.get('spacing', 8)
+        for i in range(seq['count']):
+            x = x0 + i * spacing
+            y = y0 + math.sin(i * 0.5) * 3
+            z = z0 + (rng.random() - 0.5) * 6
+            platforms.append({'pos': [x, y, z], 'size': [4, 1, 4], 'material': MATERIALS[i % 3]})
+            if rng.random() < seq.get('coinChance', 0.4):
+                coins.append([x, y + 2, z])
+    return platforms, coins
+
+
+def compile_level(level):
+    """Level description (dict) -> .rql bytes"""
+    rng = random.Random(level.get('seed', 0))
+    platforms, coins = expand_sequences(level, rng)
+    collectibles = [(pos, 'coin') for pos in coins] + [(pos, 'gem') for pos in level.get('gems', [])]
+
+    positions, sizes = array('f'), array('f')
+    materials, flags = array('B'), array('B')
+    for i, platform in enumerate(platforms):
+        if len(platform['pos']) != 3 or len(platform['size']) != 3:
+            raise LevelError(f"platform {i}: pos and size need 3 components")
+        material = platform.get('material', 'platform')
+        if material not in MATERIALS:
+            raise LevelError(f"platform {i}: unknown material '{material}' (expected one of {MATERIALS})")
+        positions.extend(platform['pos'])
+        sizes.extend(platform['size'])
+        materials.append(MATERIALS.index(material))
+        flags.append(FLAG_MOVING if platform.get('moving') else 0)
+
+    collectible_positions, collectible_types = array('f'), array('B')
+    for pos, kind in collectibles:
+        collectible_positions.extend(pos)
+        collectible_types.append(COLLECTIBLES.index(kind))
+
+    trees = array('f')
+    for tree in level.get('trees', []):
+        x, z = tree[0], tree[1]
+        yaw = tree[2] if len(tree) > 2 else rng.random() * math.pi * 2
+        size = tree[3] if len(tree) > 3 else 0.85 + rng.random() * 0.3
+        trees.extend((x, z, yaw, size))
+
+    if sys.byteorder != 'little':
+        for section in (positions, sizes, collectible_positions, trees):
+            section.byteswap()
+
+    header = HEADER.pack(MAGIC, VERSION, 0, len(materials), len(collectible_types), len(trees) // 4)
+    return b''.join([
+        header,
+        positions.tobytes(), sizes.tobytes(), collectible_positions.tobytes(), trees.tobytes(),
+        materials.tobytes(), flags.tobytes(), collectible_types.tobytes()
+    ])
+
+
+def read_header(data):
+    magic, version, _, platforms, collectibles, trees = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise LevelError(f"not a version {VERSION} RoboQuest level")
+    expected = HEADER.size + (platforms * 6 + collectibles * 3 + trees * 4) * 4 + platforms * 2 + collectibles
+    if len(data) != expected:
+        raise LevelError(f"size {len(data)} bytes, header implies {expected}")
+    return {'platforms': platforms, 'collectibles': collectibles, 'trees': trees, 'bytes': len(data)}
+
+
+def stress_level(objects, seed=0):
+    """A long winding course of roughly this many objects, for load benchmarks"""
+    rng = random.Random(seed)
+    level = {'seed': seed, 'platforms': [], 'coins': [], 'gems': [], 'trees': []}
+    for i in range(objects // 2):
+        x = i * 8
+        z = math.sin(i * 0.05) * 60
+        level['platforms'].append({
+            'pos': [x, 5 + math.sin(i * 0.5) * 3, z],
+            'size': [4, 1, 4],
+            'material': MATERIALS[i % 3],
+            'moving': i % 50 == 25
+        })
+        if i % 3 == 0:
+            level['coins'].append([x, 7 + math.sin(i * 0.5) * 3, z])
+        if i % 2 == 0:
+            level['trees'].append([x + rng.uniform(-30, 30), z + rng.choice((-1, 1)) * rng.uniform(15, 40)])
+    level['gems'] = [[x, y + 4, z] for x, y, z in level['coins'][::25]]
+    return level
+
+
+def compile_file(source, output):
+    with open(source) as f:
+        level = json.load(f)
+    data = compile_level(level)
+    write_level(data, output)
+    return data
+
+
+def write_level(data, output):
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'wb') as f:
+        f.write(data)
+    info = read_header(data)
+    print(f"✅ {os.path.relpath(output)}: {info['platforms']} platforms, {info['collectibles']} collectibles, "
+          f"{info['trees']} trees ({info['bytes']} bytes)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    print("🏗️ RoboQuest Level Compiler")
+    print("=" * 40)
+
+    output = args[args.index('-o') + 1] if '-o' in args else None
+    try:
+        if '--dump' in args:
+            with open(args[args.index('--dump') + 1], 'rb') as f:
+                print(json.dumps(read_header(f.read()), indent=2))
+        elif '--stress' in args:
+            count = int(args[args.index('--stress') + 1])
+            write_level(compile_level(stress_level(count)), output or os.path.join(OUTPUT_DIR, 'stress.rql'))
+        elif args and not args[0].startswith('-'):
+            source = args[0]
+            name = os.path.splitext(os.path.basename(source))[0]
+            compile_file(source, output or os.path.join(OUTPUT_DIR, f"{name}.rql"))
+        else:
+            sources = sorted(glob.glob(os.path.join(SOURCE_DIR, '*.json')))
+            for source in sources:
+                name = os.path.splitext(os.path.basename(source))[0]
+                compile_file(source, os.path.join(OUTPUT_DIR, f"{name}.rql"))
+            print(f"📦 Compiled {len(sources)} levels")
+    except (LevelError, KeyError, ValueError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)